@@ -1,8 +1,4 @@
 from django.apps import AppConfig
-import firebase_admin
-from firebase_admin import credentials
-import os
-import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,16 +8,17 @@ class AccountsConfig(AppConfig):
     name = 'accounts'
 
     def ready(self):
-        # Initialize Firebase Admin SDK if not already initialized
-        if not firebase_admin._apps:
-            service_account_json = os.getenv('FIREBASE_SERVICE_ACCOUNT_JSON')
-            if service_account_json:
-                try:
-                    cred_dict = json.loads(service_account_json)
-                    cred = credentials.Certificate(cred_dict)
-                    firebase_admin.initialize_app(cred)
-                    logger.info("✅ Firebase Admin SDK initialized successfully.")
-                except Exception as e:
-                    logger.error(f"❌ Failed to initialize Firebase Admin SDK: {e}")
+        from accounts import checks  # Registers the system checks
+
+        # Only check the credentials here. The Firebase Admin SDK is imported
+        # and initialized on first use (accounts.firebase_auth), which keeps
+        # it out of process startup; ID token checks never need it.
+        from accounts.firebase_auth import get_service_account_info
+
+        try:
+            if get_service_account_info():
+                logger.info("✅ Firebase service account found; the Admin SDK initializes on first use.")
             else:
-                 logger.warning("⚠️ FIREBASE_SERVICE_ACCOUNT_JSON not found in environment.")
+                logger.warning("⚠️ FIREBASE_SERVICE_ACCOUNT_JSON not found in environment.")
+        except Exception as e:
+            logger.error(f"❌ Invalid Firebase service account: {e}")
@@ -0,0 +1,151 @@
+"""
+Async Views for Accounts App
+
+This module contains async versions of the endpoints that wait on
+external services: OTP send (SendGrid) and Firebase login (Google's
+signing keys). ``accounts.urls`` routes to them instead of the sync views
+when the project runs under ASGI; requests and responses are identical.
+"""
+
+import logging
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.firebase_auth import averify_firebase_token
+from accounts.firebase_serializers import FirebaseLoginSerializer
+from accounts.otps import OTP
+from accounts.serializers import OTPSendSerializer, UserSerializer
+from accounts.services import asend_otp
+from accounts.throttles import IPRateThrottle, MobileRateThrottle, EmailRateThrottle
+from recruit_art.async_api import AsyncAPIView
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class AsyncOTPSendView(AsyncAPIView):
+    """
+    Async API view for requesting OTP.
+
+    POST: Send OTP to mobile number.
+    """
+    permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, MobileRateThrottle, EmailRateThrottle]
+    throttle_scope = 'otp_send'
+
+    async def post(self, request):
+        """Send OTP to mobile number."""
+        serializer = OTPSendSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        mobile = serializer.validated_data['mobile']
+        otp_type = serializer.validated_data['otp_type']
+        email = serializer.validated_data.get('email')
+
+        try:
+            user = await User.objects.filter(mobile=mobile).afirst()
+
+            if otp_type == 'registration':
+                if user is None:
+                    # Create inactive user
+                    user = await sync_to_async(User.objects.create_user)(
+                        email=email,
+                        mobile=mobile,
+                        is_active=False
+                    )
+                elif user.is_active:
+                    return Response({
+                        'error': 'User with this mobile number already exists.'
+                    }, status=status.HTTP_400_BAD_REQUEST)
+                otp_email = email
+            else:
+                if user is None:
+                    return Response({
+                        'error': 'User with this mobile number does not exist.'
+                    }, status=status.HTTP_404_NOT_FOUND)
+                otp_email = user.email
+
+            otp = await OTP.agenerate_otp(
+                mobile=mobile,
+                otp_type=otp_type,
+                user=user,
+                email=otp_email
+            )
+
+            await asend_otp(mobile, otp.otp_code, email=user.email)
+
+            return Response({
+                'message': f'OTP sent successfully to {mobile}.'
+            }, status=status.HTTP_200_OK)
+
+        except Exception:
+            logger.exception("Failed to send OTP")
+            return Response({
+                'error': 'Failed to send OTP. Please try again.'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncFirebaseLoginView(AsyncAPIView):
+    """
+    Async Firebase login view.
+
+    POST: Authenticate user with Firebase ID token.
+    """
+    permission_classes = [AllowAny]
+
+    async def post(self, request):
+        """Authenticate user with Firebase ID token."""
+        serializer = FirebaseLoginSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # Verify Firebase token
+            decoded_token = await averify_firebase_token(serializer.validated_data['id_token'])
+            email = decoded_token.get('email')
+            name = decoded_token.get('name')
+
+            # Get or create user
+            user, created = await User.objects.aget_or_create(
+                firebase_uid=decoded_token['uid'],
+                defaults={
+                    'email': email,
+                    'full_name': name,
+                    'email_verified': decoded_token.get('email_verified', False),
+                }
+            )
+
+            # Update user info if not created
+            if not created:
+                user.email = email or user.email
+                user.full_name = name or user.full_name
+                user.email_verified = decoded_token.get('email_verified', user.email_verified)
+                user.last_login = timezone.now()
+                await user.asave()
+
+            # Generate JWT tokens
+            refresh = RefreshToken.for_user(user)
+
+            return Response({
+                'message': 'Firebase login successful.',
+                'user': UserSerializer(user).data,
+                'tokens': {
+                    'refresh': str(refresh),
+                    'access': str(refresh.access_token),
+                }
+            }, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            return Response({
+                'error': f'Firebase authentication failed: {str(e)}'
+            }, status=status.HTTP_401_UNAUTHORIZED)
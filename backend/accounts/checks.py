@@ -0,0 +1,25 @@
+"""
+System Checks for Accounts App
+
+Rate limits (accounts.throttles) keep their counters in the default
+cache. A per-process cache gives every gunicorn worker its own counters,
+which multiplies each limit by the number of workers. Run
+``manage.py check --deploy`` to catch it.
+"""
+
+from django.core.checks import Tags, Warning, register
+
+from recruit_art.caching import cache_is_shared
+
+
+@register(Tags.caches, deploy=True)
+def check_throttle_cache(app_configs, **kwargs):
+    if cache_is_shared():
+        return []
+    return [
+        Warning(
+            'Rate limits are counted separately in each worker process.',
+            hint='Set REDIS_URL so all gunicorn workers share throttle counters.',
+            id='accounts.W001',
+        )
+    ]
@@ -0,0 +1,103 @@
+"""
+Cleanup Helpers for Accounts App
+
+This module deletes expired authentication rows (OTPs and, when the
+SimpleJWT blacklist app is installed, outstanding refresh tokens) in
+small batches so the purge can run alongside live traffic.
+"""
+
+import time
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.otps import OTP
+
+logger = logging.getLogger(__name__)
+
+TOKEN_BLACKLIST_APP = 'rest_framework_simplejwt.token_blacklist'
+
+
+def purge_in_batches(queryset, batch_size=None, pause=0):
+    """
+    Delete every row matched by ``queryset`` in bounded transactions.
+
+    Each batch selects at most ``batch_size`` primary keys and deletes them
+    in its own transaction, so row locks are held briefly and concurrent
+    inserts are never blocked for the whole purge.
+
+    Args:
+        queryset (QuerySet): Rows to delete.
+        batch_size (int): Maximum rows per transaction.
+        pause (float): Seconds to sleep between batches.
+
+    Returns:
+        int: Total number of rows deleted.
+    """
+    batch_size = batch_size or settings.AUTH_PURGE_BATCH_SIZE
+    model = queryset.model
+    total = 0
+
+    while True:
+        pks = list(
+            queryset.order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not pks:
+            break
+
+        with transaction.atomic():
+            deleted, _ = model.objects.filter(pk__in=pks).delete()
+        total += deleted
+
+        if len(pks) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return total
+
+
+def purge_expired_otps(batch_size=None, pause=0, now=None):
+    """
+    Delete OTPs whose expiry time has passed.
+
+    Returns:
+        int: Number of OTP rows deleted.
+    """
+    now = now or timezone.now()
+    deleted = purge_in_batches(
+        OTP.objects.filter(expires_at__lt=now),
+        batch_size=batch_size,
+        pause=pause,
+    )
+    logger.info("Purged %s expired OTP(s)", deleted)
+    return deleted
+
+
+def purge_expired_tokens(batch_size=None, pause=0, now=None):
+    """
+    Delete expired outstanding refresh tokens.
+
+    Blacklisted tokens reference outstanding tokens with a cascading
+    foreign key, so they are removed together. Returns ``None`` when the
+    token blacklist app is not installed.
+
+    Returns:
+        int | None: Number of rows deleted (outstanding + blacklisted).
+    """
+    if not apps.is_installed(TOKEN_BLACKLIST_APP):
+        return None
+
+    from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+    now = now or timezone.now()
+    deleted = purge_in_batches(
+        OutstandingToken.objects.filter(expires_at__lt=now),
+        batch_size=batch_size,
+        pause=pause,
+    )
+    logger.info("Purged %s expired token row(s)", deleted)
+    return deleted
@@ -2,37 +2,251 @@
 Firebase Authentication Module
 
 This module handles Firebase Admin SDK initialization and authentication.
+
+ID tokens are verified locally against Google's public signing certificates.
+The certificates are cached in-process and in Django's cache for as long as
+Google's ``Cache-Control: max-age`` allows, so token checks only hit the
+network when the key set expires.
 """
 
-import firebase_admin
-from firebase_admin import credentials, auth
-from django.conf import settings
 import os
+import re
 import json
+import time
+import asyncio
+import logging
+import threading
+import weakref
+
+import jwt
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+ID_TOKEN_CERT_URL = (
+    'https://www.googleapis.com/robot/v1/metadata/x509/'
+    'securetoken@system.gserviceaccount.com'
+)
+ID_TOKEN_ISSUER_PREFIX = 'https://securetoken.google.com/'
+CERTS_CACHE_KEY = 'firebase:id_token_certs'
+DEFAULT_CERTS_MAX_AGE = 3600
+CLOCK_SKEW_SECONDS = 10
+
+_init_lock = threading.Lock()
+
+
+class FirebaseTokenError(ValueError):
+    """Raised when a Firebase ID token fails verification."""
+
+
+def get_service_account_info():
+    """
+    Return the service account dict from FIREBASE_SERVICE_ACCOUNT_JSON
+    or ``firebase-service-account.json`` in BASE_DIR, if available.
+    """
+    service_account_json = os.getenv('FIREBASE_SERVICE_ACCOUNT_JSON')
+    if service_account_json:
+        return json.loads(service_account_json)
+
+    service_account_path = os.path.join(settings.BASE_DIR, 'firebase-service-account.json')
+    if os.path.exists(service_account_path):
+        with open(service_account_path) as f:
+            return json.load(f)
+    return None
+
+
+def get_project_id():
+    """Return the Firebase project ID used as the ID token audience."""
+    project_id = os.getenv('FIREBASE_PROJECT_ID')
+    if project_id:
+        return project_id
+    info = get_service_account_info()
+    if info:
+        return info.get('project_id')
+    return os.getenv('GOOGLE_CLOUD_PROJECT')
+
+
+def initialize_firebase(use_default_credentials=True):
+    """
+    Initialize Firebase Admin SDK once per process.
+
+    Safe to call from any thread; later calls return the existing app.
 
+    Args:
+        use_default_credentials (bool): Fall back to Google application
+            default credentials when no service account is configured.
+
+    Returns:
+        firebase_admin.App | None: The default app, or None if no
+        credentials are configured and defaults are not allowed.
+    """
+    import firebase_admin
+
+    if firebase_admin._apps:
+        return firebase_admin.get_app()
+
+    with _init_lock:
+        if firebase_admin._apps:
+            return firebase_admin.get_app()
+
+        from firebase_admin import credentials
+
+        info = get_service_account_info()
+        if info:
+            cred = credentials.Certificate(info)
+        elif use_default_credentials:
+            # Use default credentials (for Google Cloud environments)
+            cred = credentials.ApplicationDefault()
+        else:
+            return None
+
+        return firebase_admin.initialize_app(cred)
 
-def initialize_firebase():
+
+class GooglePublicKeys:
     """
-    Initialize Firebase Admin SDK.
+    Google's ID token signing certificates, keyed by ``kid``.
+
+    Certificates are parsed once per refresh and kept until the max-age
+    advertised by Google expires. Refreshes are serialized so concurrent
+    requests never trigger more than one fetch. ``aget`` does the same on
+    an event loop, fetching with the shared async HTTP client.
     """
-    if not firebase_admin._apps:
-        # Try to get credentials from environment variable first
-        service_account_json = os.getenv('FIREBASE_SERVICE_ACCOUNT_JSON')
 
-        if service_account_json:
-            # Load from environment variable
-            cred_dict = json.loads(service_account_json)
-            cred = credentials.Certificate(cred_dict)
+    def __init__(self, url=ID_TOKEN_CERT_URL):
+        self.url = url
+        self._keys = {}
+        self._expires_at = 0
+        self._lock = threading.Lock()
+        # asyncio locks belong to one event loop
+        self._async_locks = weakref.WeakKeyDictionary()
+
+    def get(self, kid):
+        """Return the public key for ``kid``, refreshing the set if needed."""
+        if time.time() >= self._expires_at:
+            with self._lock:
+                if time.time() >= self._expires_at:
+                    self._load()
+        return self._keys.get(kid)
+
+    async def aget(self, kid):
+        """Async ``get``."""
+        if time.time() >= self._expires_at:
+            loop = asyncio.get_running_loop()
+            lock = self._async_locks.setdefault(loop, asyncio.Lock())
+            async with lock:
+                if time.time() >= self._expires_at:
+                    await self._aload()
+        return self._keys.get(kid)
+
+    def _load(self):
+        """Load certificates from the shared cache, or fetch them from Google."""
+        cached = cache.get(CERTS_CACHE_KEY)
+        if cached:
+            certs, expires_at = cached
         else:
-            # Try to load from file
-            service_account_path = os.path.join(settings.BASE_DIR, 'firebase-service-account.json')
-            if os.path.exists(service_account_path):
-                cred = credentials.Certificate(service_account_path)
-            else:
-                # Use default credentials (for Google Cloud environments)
-                cred = credentials.ApplicationDefault()
+            certs, max_age = self.fetch()
+            expires_at = time.time() + max_age
+            cache.set(CERTS_CACHE_KEY, (certs, expires_at), max_age)
+        self._install(certs, expires_at)
+
+    async def _aload(self):
+        cached = await cache.aget(CERTS_CACHE_KEY)
+        if cached:
+            certs, expires_at = cached
+        else:
+            certs, max_age = await self.afetch()
+            expires_at = time.time() + max_age
+            await cache.aset(CERTS_CACHE_KEY, (certs, expires_at), max_age)
+        self._install(certs, expires_at)
+
+    def _install(self, certs, expires_at):
+        self._keys = {kid: load_pem_public_key(pem) for kid, pem in certs.items()}
+        self._expires_at = expires_at
+
+    def fetch(self):
+        """
+        Fetch the certificate set over HTTP.
+
+        Returns:
+            tuple: (dict of kid -> PEM certificate, max-age in seconds)
 
-        firebase_admin.initialize_app(cred)
+        Raises:
+            FirebaseTokenError: If the certificates cannot be fetched
+        """
+        try:
+            response = requests.get(self.url, timeout=10)
+            response.raise_for_status()
+            certs = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise FirebaseTokenError(f'Could not fetch Google signing certificates: {e}')
+        return certs, parse_max_age(response.headers.get('Cache-Control', ''))
+
+    async def afetch(self):
+        """Async ``fetch``."""
+        import httpx
+        from recruit_art.async_api import http_client
+
+        try:
+            response = await http_client().get(self.url)
+            response.raise_for_status()
+            certs = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise FirebaseTokenError(f'Could not fetch Google signing certificates: {e}')
+        return certs, parse_max_age(response.headers.get('Cache-Control', ''))
+
+
+class StaticPublicKeys:
+    """
+    Fixed key set for tests and offline development.
+
+    Install with ``set_public_keys(StaticPublicKeys({'kid': pem}))`` to
+    verify tokens signed by a local RSA key without network access.
+    """
+
+    def __init__(self, certs):
+        self._keys = {kid: load_pem_public_key(pem) for kid, pem in certs.items()}
+
+    def get(self, kid):
+        return self._keys.get(kid)
+
+    async def aget(self, kid):
+        return self._keys.get(kid)
+
+
+def parse_max_age(cache_control):
+    """Return max-age from a Cache-Control header, or the default."""
+    match = re.search(r'max-age=(\d+)', cache_control or '')
+    if match:
+        return int(match.group(1))
+    return DEFAULT_CERTS_MAX_AGE
+
+
+def load_pem_public_key(pem):
+    """Return the public key from a PEM certificate or public key."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives.serialization import load_pem_public_key as load_key
+
+    data = pem.encode() if isinstance(pem, str) else pem
+    if b'BEGIN CERTIFICATE' in data:
+        return x509.load_pem_x509_certificate(data).public_key()
+    return load_key(data)
+
+
+_public_keys = GooglePublicKeys()
+
+
+def set_public_keys(key_set):
+    """
+    Replace the key set used for ID token verification.
+
+    Returns the previous key set so callers (typically tests) can restore it.
+    """
+    global _public_keys
+    previous, _public_keys = _public_keys, key_set
+    return previous
 
 
 def verify_firebase_token(id_token):
@@ -43,17 +257,70 @@ def verify_firebase_token(id_token):
         id_token (str): Firebase ID token
 
     Returns:
-        dict: Decoded token data
+        dict: Decoded token data, with ``uid`` set from the ``sub`` claim
 
     Raises:
-        firebase_admin.auth.InvalidIdTokenError: If token is invalid
-        firebase_admin.auth.ExpiredIdTokenError: If token is expired
+        FirebaseTokenError: If the token is malformed, expired or not
+            signed by Firebase for this project
     """
+    project_id, kid = read_token_header(id_token)
+    return decode_firebase_token(id_token, _public_keys.get(kid), project_id)
+
+
+async def averify_firebase_token(id_token):
+    """Async ``verify_firebase_token``; only a key refresh does I/O."""
+    project_id, kid = read_token_header(id_token)
+    return decode_firebase_token(id_token, await _public_keys.aget(kid), project_id)
+
+
+def read_token_header(id_token):
+    """Return ``(project_id, kid)`` after checking the unverified header."""
+    project_id = get_project_id()
+    if not project_id:
+        raise FirebaseTokenError('Firebase project ID is not configured.')
+
+    try:
+        header = jwt.get_unverified_header(id_token)
+    except jwt.PyJWTError as e:
+        raise FirebaseTokenError(f'Malformed ID token: {e}')
+
+    if header.get('alg') != 'RS256' or not header.get('kid'):
+        raise FirebaseTokenError('ID token has an unexpected signing algorithm or no "kid".')
+
+    return project_id, header['kid']
+
+
+def decode_firebase_token(id_token, key, project_id):
+    """Check the signature and claims of an ID token against ``key``."""
+    if key is None:
+        raise FirebaseTokenError('ID token was signed by an unknown key.')
+
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        return decoded_token
-    except Exception as e:
-        raise e
+        decoded_token = jwt.decode(
+            id_token,
+            key=key,
+            algorithms=['RS256'],
+            audience=project_id,
+            issuer=ID_TOKEN_ISSUER_PREFIX + project_id,
+            leeway=CLOCK_SKEW_SECONDS,
+            options={'require': ['exp', 'iat', 'sub', 'auth_time']},
+        )
+    except jwt.ExpiredSignatureError:
+        raise FirebaseTokenError('ID token has expired.')
+    except jwt.PyJWTError as e:
+        raise FirebaseTokenError(f'Invalid ID token: {e}')
+
+    # Firebase requires the user to have signed in before the token was issued
+    auth_time = decoded_token['auth_time']
+    if not isinstance(auth_time, (int, float)) or auth_time > time.time() + CLOCK_SKEW_SECONDS:
+        raise FirebaseTokenError('ID token has an invalid "auth_time" claim.')
+
+    subject = decoded_token.get('sub')
+    if not isinstance(subject, str) or not subject or len(subject) > 128:
+        raise FirebaseTokenError('ID token has an invalid "sub" claim.')
+
+    decoded_token['uid'] = subject
+    return decoded_token
 
 
 def get_firebase_user(uid):
@@ -66,6 +333,9 @@ def get_firebase_user(uid):
     Returns:
         firebase_admin.auth.UserRecord: Firebase user record
     """
+    from firebase_admin import auth
+
+    initialize_firebase()
     try:
         user = auth.get_user(uid)
         return user
@@ -86,6 +356,9 @@ def create_firebase_user(email, password=None, phone_number=None, display_name=N
     Returns:
         firebase_admin.auth.UserRecord: Created Firebase user
     """
+    from firebase_admin import auth
+
+    initialize_firebase()
     user_data = {
         'email': email,
         'email_verified': False,
@@ -113,6 +386,9 @@ def update_firebase_user(uid, **kwargs):
     Returns:
         firebase_admin.auth.UserRecord: Updated Firebase user
     """
+    from firebase_admin import auth
+
+    initialize_firebase()
     user = auth.update_user(uid, **kwargs)
     return user
 
@@ -124,4 +400,7 @@ def delete_firebase_user(uid):
     Args:
         uid (str): Firebase user UID
     """
+    from firebase_admin import auth
+
+    initialize_firebase()
     auth.delete_user(uid)
@@ -12,7 +12,7 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from accounts.firebase_auth import verify_firebase_token, initialize_firebase
+from accounts.firebase_auth import verify_firebase_token
 from accounts.firebase_serializers import (
     FirebaseLoginSerializer,
     FirebasePhoneLoginSerializer,
@@ -37,9 +37,6 @@ def FirebaseLoginView(request):
         id_token = serializer.validated_data['id_token']
 
         try:
-            # Initialize Firebase if needed
-            initialize_firebase()
-
             # Verify Firebase token
             decoded_token = verify_firebase_token(id_token)
             firebase_uid = decoded_token['uid']
@@ -99,9 +96,6 @@ def FirebasePhoneLoginView(request):
         phone_number = serializer.validated_data['phone_number']
 
         try:
-            # Initialize Firebase if needed
-            initialize_firebase()
-
             # Verify Firebase token
             decoded_token = verify_firebase_token(id_token)
             firebase_uid = decoded_token['uid']
@@ -156,9 +150,6 @@ def FirebaseVerifyTokenView(request):
         id_token = serializer.validated_data['id_token']
 
         try:
-            # Initialize Firebase if needed
-            initialize_firebase()
-
             # Verify Firebase token
             decoded_token = verify_firebase_token(id_token)
 
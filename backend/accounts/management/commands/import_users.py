@@ -0,0 +1,250 @@
+import csv
+import json
+import time
+import secrets
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.models import FirebaseUserProfile
+
+User = get_user_model()
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y'}
+ROLES = {choice for choice, _ in User.ROLE_CHOICES}
+AUTH_PROVIDERS = {choice for choice, _ in User._meta.get_field('auth_provider').choices}
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-provisions users from a CSV or JSONL file (one user per row/line). '
+        'Columns: email, mobile, full_name, current_position, role, password, '
+        'firebase_uid, auth_provider, email_verified, mobile_verified, is_active. '
+        'Rows without a password get an unusable password (OTP/Firebase login only).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to a .csv or .jsonl file.')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl'],
+            help='Input format. Defaults to the file extension.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows validated and inserted per transaction.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate the file without writing anything.',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        self.seen = {'email': set(), 'mobile': set(), 'firebase_uid': set()}
+        self.errors = 0
+        created = 0
+        started = time.monotonic()
+
+        try:
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = self.read_rows(f, fmt)
+                batch_number = 0
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    batch_number += 1
+
+                    batch_started = time.monotonic()
+                    users, profiles = self.build_batch(batch)
+                    if not dry_run:
+                        self.save_batch(users, profiles)
+                    created += len(users)
+
+                    elapsed = time.monotonic() - batch_started
+                    rate = len(batch) / elapsed if elapsed else 0
+                    self.stdout.write(
+                        f"Batch {batch_number}: {len(users)}/{len(batch)} rows "
+                        f"{'valid' if dry_run else 'created'} in {elapsed:.2f}s ({rate:.0f} rows/s)"
+                    )
+        except OSError as e:
+            raise CommandError(f'Could not read {path}: {e}')
+
+        total_elapsed = time.monotonic() - started
+        verb = 'Validated' if dry_run else 'Created'
+        self.stdout.write(self.style.SUCCESS(
+            f"\n{verb} {created} users, skipped {self.errors} rows in {total_elapsed:.2f}s."
+        ))
+
+    def read_rows(self, f, fmt):
+        """Yield (line_number, row dict) pairs without loading the whole file."""
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                row = {'_error': f'Invalid JSON: {e}'}
+            if not isinstance(row, dict):
+                row = {'_error': 'Expected a JSON object'}
+            yield line_number, row
+
+    def skip(self, line_number, reason):
+        self.errors += 1
+        self.stderr.write(f"Line {line_number}: {reason}")
+
+    def build_batch(self, batch):
+        """
+        Validate a batch of rows and build unsaved model instances.
+
+        Uniqueness against the database is checked with one query per batch.
+        """
+        cleaned = []
+        for line_number, row in batch:
+            if '_error' in row:
+                self.skip(line_number, row['_error'])
+                continue
+            data, error = self.clean_row(row)
+            if error:
+                self.skip(line_number, error)
+                continue
+            cleaned.append((line_number, data))
+
+        emails = [data['email'] for _, data in cleaned]
+        mobiles = [data['mobile'] for _, data in cleaned]
+        uids = [data['firebase_uid'] for _, data in cleaned if data['firebase_uid']]
+
+        existing = User.objects.filter(
+            Q(email__in=emails) | Q(mobile__in=mobiles) | Q(firebase_uid__in=uids)
+        ).values_list('email', 'mobile', 'firebase_uid')
+        existing_emails, existing_mobiles, existing_uids = set(), set(), set()
+        for email, mobile, uid in existing:
+            existing_emails.add(email)
+            existing_mobiles.add(mobile)
+            existing_uids.add(uid)
+        if uids:
+            existing_uids.update(
+                FirebaseUserProfile.objects.filter(firebase_uid__in=uids).values_list('firebase_uid', flat=True)
+            )
+
+        users, profiles = [], []
+        for line_number, data in cleaned:
+            uid = data['firebase_uid']
+            if data['email'] in existing_emails or data['email'] in self.seen['email']:
+                self.skip(line_number, f"email {data['email']} already exists")
+                continue
+            if data['mobile'] in existing_mobiles or data['mobile'] in self.seen['mobile']:
+                self.skip(line_number, f"mobile {data['mobile']} already exists")
+                continue
+            if uid and (uid in existing_uids or uid in self.seen['firebase_uid']):
+                self.skip(line_number, f"firebase_uid {uid} already exists")
+                continue
+
+            self.seen['email'].add(data['email'])
+            self.seen['mobile'].add(data['mobile'])
+            if uid:
+                self.seen['firebase_uid'].add(uid)
+
+            password = data.pop('password')
+            user = User(**data)
+            if password:
+                user.password = make_password(password)
+            else:
+                # Same format as set_unusable_password(), with one urandom call per row
+                user.password = UNUSABLE_PASSWORD_PREFIX + secrets.token_urlsafe(30)
+            users.append(user)
+
+            if uid:
+                profiles.append(FirebaseUserProfile(
+                    user=user,
+                    firebase_uid=uid,
+                    phone_number=data['mobile'],
+                    display_name=data['full_name'] or None,
+                    email_verified=data['email_verified'],
+                ))
+
+        return users, profiles
+
+    def clean_row(self, row):
+        """Normalize one input row. Returns (data, error)."""
+        def text(key):
+            value = row.get(key)
+            return str(value).strip() if value not in (None, '') else ''
+
+        def flag(key, default):
+            value = row.get(key)
+            if value in (None, ''):
+                return default
+            if isinstance(value, bool):
+                return value
+            return str(value).strip().lower() in TRUE_VALUES
+
+        email = text('email').lower()
+        mobile = text('mobile')
+        if not email:
+            return None, 'email is required'
+        if not mobile:
+            return None, 'mobile is required'
+        try:
+            validate_email(email)
+        except ValidationError:
+            return None, f'invalid email {email}'
+        if len(mobile) > 15:
+            return None, f'mobile {mobile} is longer than 15 characters'
+
+        role = text('role').upper() or 'USER'
+        if role not in ROLES:
+            return None, f'unknown role {role}'
+
+        firebase_uid = text('firebase_uid') or None
+        auth_provider = text('auth_provider') or ('phone' if firebase_uid else 'email')
+        if auth_provider not in AUTH_PROVIDERS:
+            return None, f'unknown auth_provider {auth_provider}'
+
+        return {
+            'email': email,
+            'mobile': mobile,
+            'full_name': text('full_name'),
+            'current_position': text('current_position') or None,
+            'role': role,
+            'password': text('password'),
+            'firebase_uid': firebase_uid,
+            'auth_provider': auth_provider,
+            'email_verified': flag('email_verified', False),
+            'mobile_verified': flag('mobile_verified', bool(firebase_uid)),
+            'is_active': flag('is_active', True),
+        }, None
+
+    def save_batch(self, users, profiles):
+        """Insert a batch of users and their Firebase profiles in one transaction."""
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+            if profiles:
+                # bulk_create sets primary keys on the users, so rebind the FK ids
+                for profile in profiles:
+                    profile.user_id = profile.user.pk
+                FirebaseUserProfile.objects.bulk_create(profiles)
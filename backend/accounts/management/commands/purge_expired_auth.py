@@ -0,0 +1,61 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.cleanup import purge_expired_otps, purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = 'Deletes expired OTPs and expired outstanding JWT refresh tokens in bounded batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.AUTH_PURGE_BATCH_SIZE,
+            help='Maximum rows deleted per transaction.',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help='Seconds to sleep between batches to ease load on a busy database.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Run as a worker, purging every N seconds. 0 runs once and exits.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        pause = options['pause']
+        interval = options['interval']
+
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        while True:
+            self.purge(batch_size, pause)
+            if not interval:
+                break
+            time.sleep(interval)
+
+    def purge(self, batch_size, pause):
+        started = time.monotonic()
+
+        otps = purge_expired_otps(batch_size=batch_size, pause=pause)
+        self.stdout.write(f"Expired OTPs reclaimed: {otps}")
+
+        tokens = purge_expired_tokens(batch_size=batch_size, pause=pause)
+        if tokens is None:
+            self.stdout.write('Token blacklist app not installed, skipping outstanding tokens.')
+        else:
+            self.stdout.write(f"Expired token rows reclaimed: {tokens}")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Purge finished: {otps + (tokens or 0)} rows reclaimed in {elapsed:.2f}s."
+        ))
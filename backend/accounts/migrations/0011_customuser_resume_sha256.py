@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_customuser_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='resume_sha256',
+            field=models.CharField(blank=True, help_text='Content hash of the resume (see jobs.ResumeBlob)', max_length=64, verbose_name='Resume SHA-256'),
+        ),
+    ]
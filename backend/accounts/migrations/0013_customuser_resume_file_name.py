@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='resume_file_name',
+            field=models.CharField(blank=True, help_text='Original name of the uploaded resume', max_length=255, verbose_name='Resume File Name'),
+        ),
+    ]
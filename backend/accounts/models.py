@@ -9,7 +9,6 @@ Supports Firebase Authentication with Firebase UID tracking.
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
 from django.utils import timezone
-import random
 
 
 class CustomUserManager(BaseUserManager):
@@ -31,8 +30,8 @@ class CustomUserManager(BaseUserManager):
         if password:
             user.set_password(password)
         else:
-            # Generate a random password for OTP users
-            user.set_password(''.join([str(random.randint(0, 9)) for _ in range(8)]))
+            # OTP/Firebase users never log in with a password, so skip the hash
+            user.set_unusable_password()
         
         user.save(using=self._db)
         return user
@@ -77,6 +76,7 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     # Timestamps
     date_joined = models.DateTimeField('Date Joined', default=timezone.now)
     last_login = models.DateTimeField('Last Login', blank=True, null=True)
+    updated_at = models.DateTimeField('Updated At', auto_now=True)
     
     # Firebase Authentication
     firebase_uid = models.CharField(
@@ -128,6 +128,13 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         null=True,
         help_text="User's profile picture"
     )
+    profile_image_variants = models.JSONField(
+        'Profile Image Variants',
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Resized copies of the profile image (see content/image_derivatives.py)"
+    )
 
     # Resume upload for users
     resume = models.FileField(
@@ -137,6 +144,18 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         null=True,
         help_text="User's resume file (PDF/DOC)"
     )
+    resume_file_name = models.CharField(
+        'Resume File Name',
+        max_length=255,
+        blank=True,
+        help_text="Original name of the uploaded resume"
+    )
+    resume_sha256 = models.CharField(
+        'Resume SHA-256',
+        max_length=64,
+        blank=True,
+        help_text="Content hash of the resume (see jobs.ResumeBlob)"
+    )
 
     # Firestore sync
     firestore_doc_id = models.CharField(
@@ -43,6 +43,9 @@ class OTP(models.Model):
         db_table = 'accounts_otp'
         verbose_name = 'OTP'
         verbose_name_plural = 'OTPs'
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
     
     def __str__(self):
         return f"OTP for {self.mobile} - {self.otp_type}"
@@ -103,3 +106,18 @@ class OTP(models.Model):
             email=email
         )
 
+    @classmethod
+    async def agenerate_otp(cls, mobile, otp_type, user=None, email=None):
+        """Async ``generate_otp``."""
+        await cls.objects.filter(
+            mobile=mobile,
+            otp_type=otp_type,
+            is_used=False
+        ).aupdate(is_used=True)
+
+        return await cls.objects.acreate(
+            mobile=mobile,
+            otp_type=otp_type,
+            user=user,
+            email=email
+        )
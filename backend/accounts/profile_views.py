@@ -2,19 +2,59 @@
 Profile Views for Accounts App
 
 This module contains API views for user profile management.
+
+The profile payload is cached per user. The cache key embeds everything
+that can change the payload (user ``updated_at``, ``last_login`` and
+``token_version``, plus the count and latest ``updated_at`` of the
+user's applications), so stale entries are never served and simply
+expire. ``last_login`` is listed separately because logins save only
+that field, which leaves ``updated_at`` alone.
 """
 
+import hashlib
+
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, F, Max
 from accounts.serializers import UserSerializer, UserUpdateSerializer
 from jobs.models import JobApplication
-from jobs.serializers import JobApplicationSummarySerializer
+from jobs.serializers import JobApplicationProfileSerializer
 
 User = get_user_model()
 
+MAX_PROFILE_APPLICATIONS = 100
+
+
+def get_applications_limit(request):
+    """Return the number of applications to embed, from ?applications_limit=."""
+    try:
+        limit = int(request.query_params.get('applications_limit', settings.PROFILE_APPLICATIONS_LIMIT))
+    except (TypeError, ValueError):
+        limit = settings.PROFILE_APPLICATIONS_LIMIT
+    return max(0, min(limit, MAX_PROFILE_APPLICATIONS))
+
+
+def get_profile_cache_key(request, user, applications, limit):
+    """Build a versioned cache key for the user's profile payload."""
+    latest = applications['latest']
+    version = ':'.join([
+        user.updated_at.isoformat() if user.updated_at else '',
+        user.last_login.isoformat() if user.last_login else '',
+        str(user.token_version),
+        str(applications['total']),
+        latest.isoformat() if latest else '',
+        str(limit),
+        # Resume and image URLs are absolute, so they depend on the host
+        request.get_host(),
+    ])
+    digest = hashlib.md5(version.encode()).hexdigest()
+    return f'profile:{user.pk}:{digest}'
+
 
 class ProfileView(APIView):
     """
@@ -29,15 +69,29 @@ class ProfileView(APIView):
         """Retrieve user profile with applications."""
         try:
             user = request.user
-            applications = JobApplication.objects.filter(applicant=user).select_related('job')
+            limit = get_applications_limit(request)
+            user_applications = JobApplication.objects.filter(applicant=user)
 
-            user_data = UserSerializer(user, context={'request': request}).data
-            applications_data = JobApplicationSummarySerializer(applications, many=True).data
+            # One aggregate query versions the cached payload
+            stats = user_applications.aggregate(total=Count('id'), latest=Max('updated_at'))
+            cache_key = get_profile_cache_key(request, user, stats, limit)
+            payload = cache.get(cache_key)
 
-            return Response({
-                'user': user_data,
-                'applications': applications_data
-            }, status=status.HTTP_200_OK)
+            if payload is None:
+                applications = user_applications.order_by('-applied_at').values(
+                    'id', 'status', 'applied_at',
+                    job_title=F('job__title'),
+                    company_name=F('job__company_name'),
+                )[:limit]
+
+                payload = {
+                    'user': UserSerializer(user, context={'request': request}).data,
+                    'applications': JobApplicationProfileSerializer(applications, many=True).data,
+                    'applications_count': stats['total'],
+                }
+                cache.set(cache_key, payload, settings.PROFILE_CACHE_TIMEOUT)
+
+            return Response(payload, status=status.HTTP_200_OK)
         except Exception as e:
             import traceback
             traceback.print_exc()
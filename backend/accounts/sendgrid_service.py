@@ -5,20 +5,21 @@ from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
-def send_otp_via_sendgrid(to_email, otp_code):
+SENDGRID_URL = "https://api.sendgrid.com/v3/mail/send"
+
+
+def build_otp_request(to_email, otp_code):
     """
-    Send OTP using SendGrid Web API v3.
-    This bypasses SMTP ports which might be blocked on Render/Cloud Run.
+    Return ``(headers, payload)`` for a SendGrid OTP email, or None if
+    SendGrid is not configured.
     """
     sendgrid_api_key = getattr(settings, 'SENDGRID_API_KEY', None)
     from_email = getattr(settings, 'SENDGRID_FROM_EMAIL', None)
 
     if not sendgrid_api_key or not from_email:
         logger.warning("SendGrid API Key or From Email not configured. Skipping email.")
-        return False
+        return None
 
-    url = "https://api.sendgrid.com/v3/mail/send"
-    
     headers = {
         "Authorization": f"Bearer {sendgrid_api_key}",
         "Content-Type": "application/json"
@@ -39,9 +40,21 @@ def send_otp_via_sendgrid(to_email, otp_code):
             }
         ]
     }
+    return headers, data
+
+
+def send_otp_via_sendgrid(to_email, otp_code):
+    """
+    Send OTP using SendGrid Web API v3.
+    This bypasses SMTP ports which might be blocked on Render/Cloud Run.
+    """
+    prepared = build_otp_request(to_email, otp_code)
+    if prepared is None:
+        return False
+    headers, data = prepared
 
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=10)
+        response = requests.post(SENDGRID_URL, headers=headers, json=data, timeout=10)
         
         if response.status_code >= 200 and response.status_code < 300:
             logger.info(f"OTP sent via SendGrid to {to_email}")
@@ -53,3 +66,27 @@ def send_otp_via_sendgrid(to_email, otp_code):
     except Exception as e:
         logger.error(f"Failed to call SendGrid API: {str(e)}")
         return False
+
+
+async def asend_otp_via_sendgrid(to_email, otp_code):
+    """Async ``send_otp_via_sendgrid`` using the event loop's shared HTTP client."""
+    from recruit_art.async_api import http_client
+
+    prepared = build_otp_request(to_email, otp_code)
+    if prepared is None:
+        return False
+    headers, data = prepared
+
+    try:
+        response = await http_client().post(SENDGRID_URL, headers=headers, json=data)
+
+        if response.status_code >= 200 and response.status_code < 300:
+            logger.info(f"OTP sent via SendGrid to {to_email}")
+            return True
+        else:
+            logger.error(f"SendGrid Error: {response.status_code} - {response.text}")
+            return False
+
+    except Exception as e:
+        logger.error(f"Failed to call SendGrid API: {str(e)}")
+        return False
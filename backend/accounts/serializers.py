@@ -9,6 +9,8 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from accounts.otps import OTP
+from jobs.resumes import attach_resume
+from content.image_derivatives import ImageSrcsetField
 
 User = get_user_model()
 
@@ -124,12 +126,14 @@ class UserLoginSerializer(serializers.Serializer):
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for user details."""
     
+    profile_image_srcset = ImageSrcsetField('profile_image')
+    
     class Meta:
         model = User
         fields = [
             'id', 'email', 'mobile', 'full_name', 'current_position', 'email_verified',
             'mobile_verified', 'date_joined', 'last_login', 'google_id',
-            'resume', 'linkedin_url', 'portfolio_url', 'profile_image'
+            'resume', 'linkedin_url', 'portfolio_url', 'profile_image', 'profile_image_srcset'
         ]
         read_only_fields = ['id', 'email', 'mobile', 'date_joined', 'last_login']
 
@@ -167,7 +171,14 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         instance.portfolio_url = validated_data.get('portfolio_url', instance.portfolio_url)
         
         if 'resume' in validated_data:
-            instance.resume = validated_data.get('resume')
+            resume = validated_data.get('resume')
+            if resume:
+                # Identical resumes are stored once (see jobs.resumes)
+                attach_resume(instance, resume)
+            else:
+                instance.resume = resume
+                instance.resume_sha256 = ''
+                instance.resume_file_name = ''
             
         if 'profile_image' in validated_data:
             instance.profile_image = validated_data.get('profile_image')
@@ -37,3 +37,16 @@ def send_otp(mobile, otp_code, email=None):
         return True
 
     return False
+
+
+async def asend_otp(mobile, otp_code, email=None):
+    """Async ``send_otp`` for views served under ASGI."""
+    if email:
+        from .sendgrid_service import asend_otp_via_sendgrid
+        return await asend_otp_via_sendgrid(email, otp_code)
+
+    if mobile:
+        logger.warning(f"Mobile OTP requested for {mobile} but mobile service is disabled. OTP: {otp_code}")
+        return True
+
+    return False
@@ -0,0 +1,70 @@
+import os
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import path
+
+from accounts.async_views import AsyncFirebaseLoginView, AsyncOTPSendView
+from accounts.firebase_auth import StaticPublicKeys, set_public_keys
+from accounts.otps import OTP
+from accounts.tests.test_firebase_auth import PROJECT_ID, PUBLIC_PEM, make_token
+
+# The views accounts.urls routes to under ASGI_MODE, which tests run without
+urlpatterns = [
+    path('api/accounts/otp/send/', AsyncOTPSendView.as_view(), name='otp-send'),
+    path('api/accounts/firebase/login/', AsyncFirebaseLoginView.as_view(), name='firebase-login'),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncOTPSendTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    async def send(self, **data):
+        return await self.async_client.post('/api/accounts/otp/send/', data, content_type='application/json')
+
+    async def test_registration_otp_is_sent(self):
+        response = await self.send(mobile='9876543210', otp_type='registration', email='asha@example.com')
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertTrue(response.has_header('X-Request-ID'))
+        self.assertEqual(await OTP.objects.filter(mobile='9876543210').acount(), 1)
+
+    async def test_login_otp_for_unknown_mobile(self):
+        response = await self.send(mobile='1111111111', otp_type='login')
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_invalid_request(self):
+        response = await self.send(otp_type='login')
+
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncFirebaseLoginTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.dict(os.environ, {'FIREBASE_PROJECT_ID': PROJECT_ID})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        previous = set_public_keys(StaticPublicKeys({'test-key': PUBLIC_PEM}))
+        self.addCleanup(set_public_keys, previous)
+
+    async def login(self, id_token):
+        return await self.async_client.post(
+            '/api/accounts/firebase/login/', {'id_token': id_token}, content_type='application/json',
+        )
+
+    async def test_valid_token_logs_in(self):
+        response = await self.login(make_token(email='asha@example.com', name='Asha', phone_number=None))
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['user']['email'], 'asha@example.com')
+
+    async def test_invalid_token_is_rejected(self):
+        response = await self.login('not-a-token')
+
+        self.assertEqual(response.status_code, 401)
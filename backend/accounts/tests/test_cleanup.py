@@ -0,0 +1,46 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.cleanup import purge_expired_otps, purge_in_batches
+from accounts.otps import OTP
+
+
+class PurgeExpiredAuthTests(TestCase):
+    def create_otps(self, expired, live):
+        for n in range(expired + live):
+            otp = OTP.objects.create(mobile=f'90000000{n:02d}', otp_type='login')
+            if n < expired:
+                OTP.objects.filter(pk=otp.pk).update(
+                    expires_at=timezone.now() - timedelta(minutes=1)
+                )
+
+    def test_purge_deletes_only_expired_otps(self):
+        self.create_otps(expired=7, live=5)
+
+        self.assertEqual(purge_expired_otps(batch_size=3), 7)
+        self.assertEqual(OTP.objects.count(), 5)
+        self.assertFalse(OTP.objects.filter(expires_at__lt=timezone.now()).exists())
+
+    def test_purge_in_batches_covers_exact_multiples(self):
+        self.create_otps(expired=6, live=0)
+
+        self.assertEqual(purge_in_batches(OTP.objects.all(), batch_size=3), 6)
+        self.assertEqual(OTP.objects.count(), 0)
+
+    def test_command_reports_rows_reclaimed(self):
+        self.create_otps(expired=4, live=2)
+        out = StringIO()
+
+        call_command('purge_expired_auth', '--batch-size', '3', stdout=out)
+
+        self.assertIn('Expired OTPs reclaimed: 4', out.getvalue())
+        self.assertEqual(OTP.objects.count(), 2)
+
+    def test_command_rejects_invalid_batch_size(self):
+        with self.assertRaisesMessage(CommandError, '--batch-size must be at least 1.'):
+            call_command('purge_expired_auth', '--batch-size', '0', stdout=StringIO())
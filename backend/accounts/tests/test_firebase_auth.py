@@ -0,0 +1,120 @@
+import os
+import time
+from unittest import mock
+
+import jwt
+import requests
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.core.cache import cache
+from django.test import TestCase
+
+from accounts import firebase_auth
+from accounts.firebase_auth import (
+    FirebaseTokenError,
+    GooglePublicKeys,
+    StaticPublicKeys,
+    parse_max_age,
+    set_public_keys,
+    verify_firebase_token,
+)
+from accounts.models import CustomUser
+
+PROJECT_ID = 'recruit-art-test'
+SIGNING_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+PUBLIC_PEM = SIGNING_KEY.public_key().public_bytes(
+    serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+).decode()
+
+
+def make_token(kid='test-key', **claims):
+    """Sign an ID token the way Firebase does, with a local key."""
+    now = int(time.time())
+    payload = {
+        'iss': firebase_auth.ID_TOKEN_ISSUER_PREFIX + PROJECT_ID,
+        'aud': PROJECT_ID,
+        'sub': 'firebase-uid-1',
+        'iat': now,
+        'exp': now + 3600,
+        'auth_time': now - 60,
+        'phone_number': '+919876543210',
+    }
+    payload.update(claims)
+    payload = {key: value for key, value in payload.items() if value is not None}
+    return jwt.encode(payload, SIGNING_KEY, algorithm='RS256', headers={'kid': kid})
+
+
+class FirebaseTokenTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {'FIREBASE_PROJECT_ID': PROJECT_ID})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        previous = set_public_keys(StaticPublicKeys({'test-key': PUBLIC_PEM}))
+        self.addCleanup(set_public_keys, previous)
+
+    def test_valid_token(self):
+        decoded = verify_firebase_token(make_token())
+
+        self.assertEqual(decoded['uid'], 'firebase-uid-1')
+
+    def test_rejected_tokens(self):
+        now = int(time.time())
+        cases = {
+            'wrong audience': make_token(aud='other-project'),
+            'wrong issuer': make_token(iss='https://securetoken.google.com/other-project'),
+            'expired': make_token(exp=now - 100),
+            'unknown key': make_token(kid='other-key'),
+            'no auth_time': make_token(auth_time=None),
+            'auth_time in the future': make_token(auth_time=now + 600),
+            'empty subject': make_token(sub=''),
+            'malformed': 'not-a-token',
+        }
+        for name, token in cases.items():
+            with self.subTest(name), self.assertRaises(FirebaseTokenError):
+                verify_firebase_token(token)
+
+    def test_firebase_phone_login(self):
+        CustomUser.objects.create_user(
+            email='phone@example.com', mobile='9876543210', password='x', full_name='Phone User'
+        )
+
+        response = self.client.post(
+            '/api/accounts/login/',
+            {'login_type': 'firebase_phone', 'id_token': make_token()},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+
+class GooglePublicKeysTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_certificates_are_fetched_once_per_max_age(self):
+        keys = GooglePublicKeys()
+        with mock.patch.object(keys, 'fetch', return_value=({'test-key': PUBLIC_PEM}, 120)) as fetch:
+            self.assertIsNotNone(keys.get('test-key'))
+            keys.get('test-key')
+            self.assertIsNone(keys.get('unknown'))
+        self.assertEqual(fetch.call_count, 1)
+
+        # Another process finds the set in the shared cache
+        other = GooglePublicKeys()
+        with mock.patch.object(other, 'fetch') as fetch:
+            self.assertIsNotNone(other.get('test-key'))
+        fetch.assert_not_called()
+
+    def test_fetch_failures_are_token_errors(self):
+        failures = [
+            requests.ConnectionError('unreachable'),
+            requests.HTTPError('503 Server Error'),
+        ]
+        for failure in failures:
+            with self.subTest(failure), mock.patch('accounts.firebase_auth.requests.get', side_effect=failure):
+                with self.assertRaises(FirebaseTokenError):
+                    GooglePublicKeys().get('test-key')
+
+    def test_parse_max_age(self):
+        self.assertEqual(parse_max_age('public, max-age=19204, must-revalidate'), 19204)
+        self.assertEqual(parse_max_age(''), firebase_auth.DEFAULT_CERTS_MAX_AGE)
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from accounts.models import CustomUser, FirebaseUserProfile
+
+
+class ImportUsersTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def run_import(self, path, *args):
+        out, err = StringIO(), StringIO()
+        call_command('import_users', path, *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_jsonl_import_in_batches(self):
+        CustomUser.objects.create_user(email='taken@example.com', mobile='9000000000')
+        rows = []
+        for n in range(50):
+            row = {'email': f'User{n}@Example.com', 'mobile': f'91{n:08d}', 'full_name': f'User {n}'}
+            if n % 2:
+                row['firebase_uid'] = f'uid-{n}'
+            rows.append(json.dumps(row))
+        rows += [
+            json.dumps({'email': 'taken@example.com', 'mobile': '9000000001'}),
+            'not json',
+            json.dumps({'email': 'user0@example.com', 'mobile': '9000000002'}),
+        ]
+        path = self.write('users.jsonl', '\n'.join(rows) + '\n')
+
+        out, err = self.run_import(path, '--batch-size', '20')
+
+        self.assertIn('Created 50 users, skipped 3 rows', out)
+        self.assertIn('email taken@example.com already exists', err)
+        self.assertIn('Invalid JSON', err)
+        self.assertEqual(CustomUser.objects.count(), 51)
+        self.assertEqual(FirebaseUserProfile.objects.count(), 25)
+        user = CustomUser.objects.get(email='user1@example.com')
+        self.assertFalse(user.has_usable_password())
+        self.assertEqual(user.firebase_profile.firebase_uid, 'uid-1')
+
+    def test_jsonl_lines_that_are_not_objects_are_skipped(self):
+        rows = ['[1, 2]', '"x"', 'null', json.dumps({'email': 'a@example.com', 'mobile': '9100000004'})]
+        path = self.write('users.jsonl', '\n'.join(rows) + '\n')
+
+        out, err = self.run_import(path)
+
+        self.assertIn('Created 1 users, skipped 3 rows', out)
+        self.assertEqual(err.count('Expected a JSON object'), 3)
+        self.assertIn('Line 1: Expected a JSON object', err)
+        self.assertTrue(CustomUser.objects.filter(email='a@example.com').exists())
+
+    def test_csv_import_with_passwords(self):
+        path = self.write(
+            'users.csv',
+            'email,mobile,password,role\nAdmin@Example.com,9100000001,secret-pass,admin\nbad,9100000002,,\n',
+        )
+
+        out, err = self.run_import(path)
+
+        self.assertIn('Created 1 users, skipped 1 rows', out)
+        user = CustomUser.objects.get(email='admin@example.com')
+        self.assertTrue(user.check_password('secret-pass'))
+        self.assertEqual(user.role, 'ADMIN')
+
+    def test_dry_run_writes_nothing(self):
+        path = self.write('users.jsonl', json.dumps({'email': 'a@example.com', 'mobile': '9100000003'}) + '\n')
+
+        out, _ = self.run_import(path, '--dry-run')
+
+        self.assertIn('Validated 1 users', out)
+        self.assertFalse(CustomUser.objects.exists())
+
+    def test_invalid_batch_size(self):
+        path = self.write('users.jsonl', '')
+        with self.assertRaises(CommandError):
+            self.run_import(path, '--batch-size', '0')
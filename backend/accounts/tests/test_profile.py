@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import Client, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import CustomUser
+from accounts.serializers import UserSerializer
+from jobs.models import Job, JobApplication
+
+
+def auth_client(user):
+    refresh = RefreshToken.for_user(user)
+    refresh['token_version'] = user.token_version
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+    return client
+
+
+class ProfileViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            email='applicant@example.com', mobile='9876543210', password='x'
+        )
+        deadline = timezone.now() + timedelta(days=3)
+        for n in range(30):
+            job = Job.objects.create(
+                title=f'Job {n}', company_name='Co', description='d',
+                skills_required='s', apply_deadline=deadline,
+            )
+            JobApplication.objects.create(
+                job=job, applicant=self.user, full_name='Applicant',
+                email='applicant@example.com', mobile='9876543210', resume='resume.pdf',
+            )
+        self.client = auth_client(self.user)
+
+    def test_payload_is_capped_and_cached(self):
+        with self.assertNumQueries(3):
+            first = self.client.get('/api/accounts/profile/').json()
+        # Authentication only; the payload comes from the cache
+        with self.assertNumQueries(2):
+            second = self.client.get('/api/accounts/profile/').json()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first['applications_count'], 30)
+        self.assertLess(len(first['applications']), 30)
+
+    def test_login_refreshes_last_login(self):
+        first = self.client.get('/api/accounts/profile/').json()
+        # Saves only last_login, so updated_at does not change
+        Client().force_login(self.user)
+
+        second = self.client.get('/api/accounts/profile/').json()
+
+        self.user.refresh_from_db()
+        self.assertIsNone(first['user']['last_login'])
+        self.assertIsNotNone(second['user']['last_login'])
+        self.assertEqual(second['user']['last_login'], UserSerializer(self.user).data['last_login'])
+
+    def test_limit_parameter(self):
+        payload = self.client.get('/api/accounts/profile/?applications_limit=5').json()
+
+        self.assertEqual(len(payload['applications']), 5)
+
+    def test_application_changes_invalidate_the_cache(self):
+        self.client.get('/api/accounts/profile/?applications_limit=100')
+        application = JobApplication.objects.first()
+        application.status = 'hired'
+        application.save()
+
+        payload = self.client.get('/api/accounts/profile/?applications_limit=100').json()
+
+        self.assertIn('hired', [item['status'] for item in payload['applications']])
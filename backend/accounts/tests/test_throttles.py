@@ -0,0 +1,89 @@
+import copy
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.checks import check_throttle_cache
+from accounts.throttles import IPRateThrottle
+
+REST_FRAMEWORK = copy.deepcopy(settings.REST_FRAMEWORK)
+REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {
+    'feedback.ip': '3/min',
+    'otp_send.mobile': '2/hour',
+    'burst.ip': '5/hour',
+}
+
+
+class BurstView:
+    throttle_scope = 'burst'
+
+
+@override_settings(REST_FRAMEWORK=REST_FRAMEWORK)
+class SlidingWindowThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_submissions_over_the_limit_are_rejected(self):
+        codes = [
+            self.client.post('/api/feedback/feedback/', {'message': 'hi'}, format='json').status_code
+            for _ in range(4)
+        ]
+
+        self.assertEqual(codes, [201, 201, 201, 429])
+        response = self.client.post('/api/feedback/feedback/', {'message': 'hi'}, format='json')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response.headers['Retry-After']), 1)
+        # Reads are not throttled
+        self.assertEqual(self.client.get('/api/feedback/feedback/').status_code, 200)
+
+    def test_mobile_limit_applies_across_formats(self):
+        codes = [
+            self.client.post(
+                '/api/accounts/otp/send/', {'mobile': mobile, 'otp_type': 'login'}, format='json'
+            ).status_code
+            for mobile in ('98765 43210', '9876543210', '98765-43210')
+        ]
+
+        self.assertEqual(codes[2], 429)
+
+    def test_concurrent_requests_cannot_exceed_the_limit(self):
+        request = APIRequestFactory().post('/', REMOTE_ADDR='203.0.113.7')
+        barrier = threading.Barrier(20)
+        allowed = []
+
+        def hit():
+            throttle = IPRateThrottle()
+            barrier.wait()
+            allowed.append(throttle.allow_request(request, BurstView()))
+
+        threads = [threading.Thread(target=hit) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(allowed.count(True), 5)
+
+    def test_rejected_requests_are_not_counted(self):
+        request = APIRequestFactory().post('/', REMOTE_ADDR='203.0.113.8')
+        for _ in range(8):
+            IPRateThrottle().allow_request(request, BurstView())
+
+        throttle = IPRateThrottle()
+        self.assertFalse(throttle.allow_request(request, BurstView()))
+        self.assertEqual(throttle.current, 5)
+
+
+class ThrottleCacheCheckTests(SimpleTestCase):
+    def test_per_process_cache_warns(self):
+        self.assertEqual([w.id for w in check_throttle_cache(None)], ['accounts.W001'])
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://cache'},
+    })
+    def test_shared_cache_passes(self):
+        self.assertEqual(check_throttle_cache(None), [])
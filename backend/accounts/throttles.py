@@ -0,0 +1,162 @@
+"""
+Rate limiting for Recruit Art public endpoints.
+
+This module contains sliding-window throttles backed by Django's cache
+framework. Each throttle counts requests for one identity (client IP,
+mobile number or email address) within a view's ``throttle_scope``.
+
+Rates are configured per scope and identity in
+``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`` using keys of the form
+``'<scope>.<identity>'``, e.g. ``'otp_send.mobile': '5/hour'``. A missing
+rate disables that identity for the scope.
+"""
+
+import hashlib
+import math
+
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Approximate sliding-window limiter using two fixed-window counters.
+
+    The current window's count is added to the previous window's count
+    weighted by how much of it still overlaps the sliding window. Counters
+    are plain integers updated with ``cache.add``/``cache.incr``, so a check
+    costs one increment and one ``get`` regardless of the rate.
+
+    The request is counted before the limit is compared, so concurrent
+    requests each see the others' increments; a rejected request is
+    uncounted again. Counters are only shared between workers when the
+    default cache is (``REDIS_URL``).
+    """
+
+    identity = None
+    cache_format = 'throttle:%(scope)s:%(identity)s:%(ident)s:%(window)d'
+
+    def get_ident_value(self, request):
+        """Return the raw identity value for the request, or None to skip."""
+        raise NotImplementedError('.get_ident_value() must be overridden')
+
+    def get_rate(self):
+        """Look up the rate for this scope and identity, if configured."""
+        return api_settings.DEFAULT_THROTTLE_RATES.get(f'{self.scope}.{self.identity}')
+
+    def get_cache_key(self, request, view):
+        value = self.get_ident_value(request)
+        if not value:
+            return None
+        # Hash identities so emails and phone numbers never appear in cache keys
+        return hashlib.sha256(str(value).encode()).hexdigest()[:32]
+
+    def window_key(self, window):
+        return self.cache_format % {
+            'scope': self.scope,
+            'identity': self.identity,
+            'ident': self.ident,
+            'window': window,
+        }
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, 'throttle_scope', None)
+        if not self.scope:
+            return True
+
+        self.rate = self.get_rate()
+        if self.rate is None:
+            return True
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        self.ident = self.get_cache_key(request, view)
+        if self.ident is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key = self.window_key(window)
+        previous_key = self.window_key(window - 1)
+
+        # Requests counted in this window before this one
+        self.current = self.increment(current_key) - 1
+        self.previous = self.cache.get(previous_key, 0)
+
+        elapsed = self.now - window * self.duration
+        overlap = (self.duration - elapsed) / self.duration
+        if self.previous * overlap + self.current >= self.num_requests:
+            try:
+                self.cache.decr(current_key)
+            except ValueError:
+                pass
+            return self.throttle_failure()
+        return True
+
+    def increment(self, key):
+        """Atomically count a request in ``key`` and return the new count."""
+        # Keep counters for two windows so the next window can still weight them
+        if self.cache.add(key, 1, self.duration * 2):
+            return 1
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Counter expired between add() and incr()
+            self.cache.set(key, 1, self.duration * 2)
+            return 1
+
+    def throttle_failure(self):
+        self.retry_after = self.compute_wait()
+        return False
+
+    def compute_wait(self):
+        """
+        Seconds until the weighted count drops below the limit.
+
+        Within the current window only the previous window's weight decays;
+        if that is not enough, the caller has to wait for the next window.
+        """
+        window_end = (int(self.now // self.duration) + 1) * self.duration
+        if self.previous and self.current < self.num_requests:
+            # Solve previous * (window_end - t) / duration + current < num_requests
+            target = window_end - (self.num_requests - self.current) * self.duration / self.previous
+            return max(1, math.ceil(target - self.now))
+        return max(1, math.ceil(window_end - self.now))
+
+    def wait(self):
+        return getattr(self, 'retry_after', None)
+
+
+class IPRateThrottle(SlidingWindowRateThrottle):
+    """Limit requests per client IP address."""
+
+    identity = 'ip'
+
+    def get_ident_value(self, request):
+        return self.get_ident(request)
+
+
+class MobileRateThrottle(SlidingWindowRateThrottle):
+    """Limit requests per mobile number submitted in the request body."""
+
+    identity = 'mobile'
+
+    def get_ident_value(self, request):
+        mobile = request.data.get('mobile') if hasattr(request.data, 'get') else None
+        if not mobile:
+            return None
+        return ''.join(ch for ch in str(mobile) if ch.isdigit())
+
+
+class EmailRateThrottle(SlidingWindowRateThrottle):
+    """Limit requests per email address submitted in the request body."""
+
+    identity = 'email'
+
+    def get_ident_value(self, request):
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if not email:
+            return None
+        return str(email).strip().lower()
+
+
+PUBLIC_SUBMISSION_THROTTLES = [IPRateThrottle, MobileRateThrottle, EmailRateThrottle]
@@ -4,7 +4,9 @@ URL Configuration for Accounts App
 This module defines the URL patterns for authentication endpoints.
 """
 
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path
+from recruit_art.lazy_urls import lazy_include, urlconf_loader
 from rest_framework_simplejwt.views import TokenVerifyView
 from accounts.views import (
     RegistrationView,
@@ -28,6 +30,15 @@ from accounts.firebase_views import (
     FirebasePhoneLoginView,
     FirebaseGoogleLoginView,
 )
+from accounts.async_views import AsyncOTPSendView, AsyncFirebaseLoginView
+
+# Under ASGI the endpoints that wait on SendGrid/Google run as coroutines
+if settings.ASGI_MODE:
+    otp_send_view = AsyncOTPSendView.as_view()
+    firebase_login_view = AsyncFirebaseLoginView.as_view()
+else:
+    otp_send_view = OTPSendView.as_view()
+    firebase_login_view = FirebaseLoginView
 
 app_name = 'accounts'
 
@@ -39,7 +50,7 @@ urlpatterns = [
     path('dashboard-stats/', DashboardStatsView.as_view(), name='dashboard-stats'),
     
     # OTP endpoints
-    path('otp/send/', OTPSendView.as_view(), name='otp-send'),
+    path('otp/send/', otp_send_view, name='otp-send'),
     path('otp/verify/', OTPVerificationView.as_view(), name='otp-verify'),
     
     # Google OAuth (legacy)
@@ -47,7 +58,7 @@ urlpatterns = [
     # path('google/login/', GoogleAuthView.as_view(), name='google-login'),
     
     # Firebase Authentication endpoints
-    path('firebase/login/', FirebaseLoginView, name='firebase-login'),
+    path('firebase/login/', firebase_login_view, name='firebase-login'),
     path('firebase/verify-token/', FirebaseVerifyTokenView, name='firebase-verify-token'),
     path('firebase/phone/', FirebasePhoneLoginView, name='firebase-phone'),
     path('firebase/google/', FirebaseGoogleLoginView, name='firebase-google'),
@@ -70,6 +81,6 @@ urlpatterns = [
     path('token/verify/', TokenVerifyView.as_view(), name='token-verify'),
     
     # Social Auth URLs (handled by django-social-auth)
-    path('social/', include('social_django.urls', namespace='social')),
+    path('social/', lazy_include(urlconf_loader('social_django.urls'), 'social')),
 ]
 
@@ -13,8 +13,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
-from social_django.utils import psa
 from accounts.otps import OTP
+from accounts.throttles import IPRateThrottle, MobileRateThrottle, EmailRateThrottle
 from accounts.permissions import (
     IsSuperuser,
     IsAdmin,
@@ -43,7 +43,7 @@ from jobs.models import JobApplication
 from jobs.serializers import JobApplicationSummarySerializer
 
 from accounts.services import send_otp
-from firebase_admin import auth
+from accounts.firebase_auth import verify_firebase_token
 
 User = get_user_model()
 
@@ -172,6 +172,8 @@ class OTPSendView(APIView):
     POST: Send OTP to mobile number.
     """
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, MobileRateThrottle, EmailRateThrottle]
+    throttle_scope = 'otp_send'
 
     def post(self, request):
         """Send OTP to mobile number."""
@@ -260,6 +262,8 @@ class LoginView(APIView):
     POST: Login with email/mobile and password, or request OTP.
     """
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, MobileRateThrottle, EmailRateThrottle]
+    throttle_scope = 'login'
 
     def post(self, request):
         """Login user."""
@@ -373,7 +377,7 @@ class LoginView(APIView):
                 id_token = serializer.validated_data['id_token']
                 try:
                     # Verify the ID token
-                    decoded_token = auth.verify_id_token(id_token)
+                    decoded_token = verify_firebase_token(id_token)
                     uid = decoded_token['uid']
                     phone_number = decoded_token.get('phone_number')
 
@@ -503,6 +507,8 @@ class PasswordResetRequestView(APIView):
     POST: Request password reset OTP.
     """
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, MobileRateThrottle, EmailRateThrottle]
+    throttle_scope = 'password_reset'
 
     def post(self, request):
         """Request password reset."""
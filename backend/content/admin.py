@@ -1,5 +1,7 @@
 from django.contrib import admin
+from django.core.cache import cache
 from .models import NewsItem, VisitorCount
+from .visitors import BASE_KEY
 
 @admin.register(NewsItem)
 class NewsItemAdmin(admin.ModelAdmin):
@@ -31,3 +33,8 @@ class VisitorCountAdmin(admin.ModelAdmin):
 
     def has_delete_permission(self, request, obj=None):
         return False
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Drop the cached total so reads pick up the manual edit
+        cache.delete(BASE_KEY)
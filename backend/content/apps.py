@@ -3,3 +3,10 @@ from django.apps import AppConfig
 
 class ContentConfig(AppConfig):
     name = 'content'
+
+    def ready(self):
+        from content import image_derivatives, landing, visitors
+
+        image_derivatives.connect_signals()
+        landing.connect_signals()
+        visitors.connect_signals()
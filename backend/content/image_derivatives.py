@@ -0,0 +1,262 @@
+"""
+Image Derivatives for Recruit Art
+
+This module generates resized WebP and JPEG copies of uploaded images
+(profile pictures, team photos and news covers) so pages can serve a
+width that matches the slot instead of the full upload.
+
+When a registered image field changes, ``post_save`` schedules generation
+after the transaction commits. It runs on a small background thread pool
+(``IMAGE_DERIVATIVE_WORKERS``), or only in ``manage.py
+generate_image_derivatives`` when that setting is 0. Results are
+recorded on the model in ``<field>_variants``:
+
+    {"source": "<original name>", "webp": {"320": "<name>"}, "jpeg": {...}}
+
+An image that cannot be rendered is recorded as ``{"source": ..., "error":
+...}`` so it is not retried on every save; uploading a new image, or
+``generate_image_derivatives --retry-failed``, tries again.
+
+``ImageSrcsetField`` turns that into srcset strings for serializers.
+"""
+
+import io
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
+from rest_framework import serializers
+
+from jobs.storage_urls import resolver
+
+logger = logging.getLogger(__name__)
+
+# (app_label.Model, image field) -> target widths in pixels
+DERIVATIVE_SPECS = {
+    ('accounts.CustomUser', 'profile_image'): (96, 192, 384),
+    ('feedback.TeamMember', 'image'): (160, 320, 640),
+    ('content.NewsItem', 'image'): (320, 640, 1280),
+}
+
+FORMATS = {
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 4},
+    'jpeg': {'format': 'JPEG', 'quality': 82, 'optimize': True, 'progressive': True},
+}
+EXTENSIONS = {'webp': '.webp', 'jpeg': '.jpg'}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def variants_field(field_name):
+    return f'{field_name}_variants'
+
+
+def get_executor():
+    """Return the shared background pool, or None if disabled."""
+    global _executor
+    if not settings.IMAGE_DERIVATIVE_WORKERS:
+        return None
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.IMAGE_DERIVATIVE_WORKERS,
+                    thread_name_prefix='image-derivatives',
+                )
+    return _executor
+
+
+def derivative_name(source, width, fmt):
+    """Storage name for one derivative, e.g. derivatives/team/a_320w.webp."""
+    base = os.path.splitext(source)[0]
+    return f"derivatives/{base}_{width}w{EXTENSIONS[fmt]}"
+
+
+def render_derivatives(data, widths):
+    """
+    Resize image bytes to each width (never upscaling) in every format.
+
+    Returns:
+        dict: {fmt: {width: bytes}}
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        image.load()
+
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    # Always keep at least one size, even for images narrower than every width
+    targets = sorted({min(width, image.width) for width in widths})
+
+    rendered = {fmt: {} for fmt in FORMATS}
+    for width in targets:
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+        for fmt, options in FORMATS.items():
+            frame = resized
+            if fmt == 'jpeg' and frame.mode == 'RGBA':
+                background = Image.new('RGB', frame.size, (255, 255, 255))
+                background.paste(frame, mask=frame.getchannel('A'))
+                frame = background
+            buffer = io.BytesIO()
+            frame.save(buffer, **options)
+            rendered[fmt][width] = buffer.getvalue()
+    return rendered
+
+
+def delete_variants(storage, variants):
+    """Best-effort removal of previously generated files."""
+    for fmt in FORMATS:
+        for name in (variants or {}).get(fmt, {}).values():
+            try:
+                storage.delete(name)
+            except Exception as e:
+                logger.warning(f"Could not delete image derivative {name}: {e}")
+
+
+def generate(model_label, field_name, pk):
+    """
+    Build and record the derivatives of one instance's image.
+
+    The update is conditional on the image not having changed meanwhile;
+    otherwise the freshly written files are discarded.
+    """
+    model = apps.get_model(model_label)
+    widths = DERIVATIVE_SPECS[(model_label, field_name)]
+    vfield = variants_field(field_name)
+
+    instance = model.objects.filter(pk=pk).only(field_name, vfield).first()
+    if instance is None:
+        return
+    file = getattr(instance, field_name)
+    old_variants = getattr(instance, vfield) or {}
+    storage = file.storage
+
+    variants = {}
+    if file:
+        try:
+            with storage.open(file.name, 'rb') as f:
+                rendered = render_derivatives(f.read(), widths)
+        except Exception as e:
+            logger.warning(f"Image derivatives failed for {model_label} {pk} ({file.name}): {e}")
+            # Recorded against this source, so later saves do not retry it
+            variants = {'source': file.name, 'error': str(e)[:500]}
+        else:
+            variants = {'source': file.name}
+            for fmt, sizes in rendered.items():
+                variants[fmt] = {
+                    str(width): storage.save(derivative_name(file.name, width, fmt), ContentFile(data))
+                    for width, data in sizes.items()
+                }
+
+    unchanged = Q(**{field_name: file.name}) if file else Q(**{field_name: ''}) | Q(**{f'{field_name}__isnull': True})
+    # update() skips signals, so recording the result never reschedules work
+    updated = model.objects.filter(unchanged, pk=pk).update(
+        **{vfield: variants, 'updated_at': timezone.now()}
+    )
+    if updated:
+        delete_variants(storage, old_variants)
+        if 'error' not in variants:
+            logger.info(f"Image derivatives ready for {model_label} {pk}")
+        # update() sends no post_save, so refresh the landing bundle's srcsets here
+        from content.landing import invalidate_landing
+        invalidate_landing()
+    else:
+        delete_variants(storage, variants)
+
+
+def needs_derivatives(instance, field_name, retry_failed=False):
+    """
+    True if the recorded derivatives do not match the current image.
+
+    A recorded failure for the current image counts as done unless
+    ``retry_failed`` is set.
+    """
+    name = getattr(instance, field_name).name or ''
+    variants = getattr(instance, variants_field(field_name)) or {}
+    if variants.get('source', '') != name:
+        return True
+    return retry_failed and 'error' in variants
+
+
+def schedule(model_label, field_name, pk):
+    executor = get_executor()
+    if executor is None:
+        return
+
+    def run():
+        try:
+            generate(model_label, field_name, pk)
+        except Exception:
+            logger.exception(f"Image derivatives crashed for {model_label} {pk}")
+        finally:
+            # Pool threads outlive the request, so release their DB connection
+            connection.close()
+
+    executor.submit(run)
+
+
+def image_changed(sender, instance, raw=False, **kwargs):
+    """post_save receiver: schedule derivatives for changed images."""
+    if raw:
+        return
+    label = sender._meta.label
+    for (model_label, field_name) in DERIVATIVE_SPECS:
+        if model_label == label and needs_derivatives(instance, field_name):
+            pk = instance.pk
+            transaction.on_commit(lambda f=field_name: schedule(label, f, pk))
+
+
+def connect_signals():
+    """Connect ``image_changed`` to every model with derivative specs."""
+    for model_label in {label for label, _ in DERIVATIVE_SPECS}:
+        post_save.connect(
+            image_changed,
+            sender=apps.get_model(model_label),
+            dispatch_uid=f'image_derivatives:{model_label}',
+        )
+
+
+class ImageSrcsetField(serializers.Field):
+    """
+    Read-only ``{"webp": srcset, "jpeg": srcset}`` for an image field.
+
+    Returns None until derivatives exist for the current image, so
+    clients fall back to the original URL.
+    """
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        file = getattr(instance, self.image_field)
+        variants = getattr(instance, variants_field(self.image_field)) or {}
+        if not file or variants.get('source') != file.name or 'error' in variants:
+            return None
+
+        request = self.context.get('request')
+        srcset = {}
+        for fmt in FORMATS:
+            entries = []
+            for width, name in sorted(variants.get(fmt, {}).items(), key=lambda item: int(item[0])):
+                url = resolver.url_for(file.storage, name)
+                if request is not None and url.startswith('/'):
+                    url = request.build_absolute_uri(url)
+                entries.append(f"{url} {width}w")
+            srcset[fmt] = ', '.join(entries)
+        return srcset
@@ -0,0 +1,141 @@
+"""
+Landing Page Bundle for Content App
+
+This module assembles everything the public landing page needs (news,
+testimonials, team, featured jobs, contact info and the visitor count)
+into one payload for ``GET /api/content/landing/``.
+
+The content part is cached under a version number. With a shared cache
+(``REDIS_URL``), signals on the underlying models bump the number in
+the cache, so edits show up immediately in every worker and a cached
+request runs no queries. A per-process cache would only see its own
+process's bumps, so without a shared cache the version is instead a
+digest of the database: the row count and latest ``updated_at`` of each
+model in the bundle, plus the number of featured jobs still open. The
+visitor count is read on every request (see visitors.py).
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from content.models import NewsItem
+from content.serializers import NewsItemSerializer
+from enquiries.views import CONTACT_INFO
+from feedback.models import Testimonial, TeamMember
+from feedback.serializers import TestimonialSerializer, TeamMemberSerializer
+from jobs.models import Job
+from jobs.serializers import JobListSerializer
+from recruit_art.caching import cache_is_shared
+
+VERSION_KEY = 'landing:version'
+SOURCE_MODELS = (NewsItem, Testimonial, TeamMember, Job)
+
+
+def featured_jobs():
+    return Job.objects.filter(
+        status='active',
+        is_featured=True,
+        apply_deadline__gt=timezone.now(),
+    )
+
+
+def get_version():
+    """Return the current bundle version."""
+    if not cache_is_shared():
+        return get_database_version()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def get_database_version():
+    """
+    Return a digest of the bundle's source rows.
+
+    One small aggregate query per model; counts catch deletes, which
+    leave no newer ``updated_at`` behind.
+    """
+    stats = [
+        model.objects.aggregate(total=Count('id'), latest=Max('updated_at'))
+        for model in SOURCE_MODELS
+    ]
+    stats.append(featured_jobs().count())
+    return hashlib.md5(json.dumps(stats, cls=DjangoJSONEncoder).encode()).hexdigest()
+
+
+def invalidate_landing(**kwargs):
+    """Signal receiver: retire every cached bundle by bumping the version."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, 1, None)
+
+
+def build_content(request):
+    """Serialize the cacheable part of the bundle."""
+    context = {'request': request}
+    jobs = featured_jobs().order_by('-created_at')[:settings.LANDING_FEATURED_JOBS_LIMIT]
+
+    return {
+        'news': NewsItemSerializer(
+            NewsItem.objects.filter(is_active=True), many=True, context=context
+        ).data,
+        'testimonials': TestimonialSerializer(
+            Testimonial.objects.filter(is_active=True), many=True, context=context
+        ).data,
+        'team': TeamMemberSerializer(
+            TeamMember.objects.filter(is_active=True), many=True, context=context
+        ).data,
+        'featured_jobs': JobListSerializer(jobs, many=True, context=context).data,
+        'contact_info': CONTACT_INFO,
+    }
+
+
+def get_timeout():
+    """
+    Seconds to cache the bundle for.
+
+    A featured job passing its deadline changes no row and sends no
+    signal, so the bundle expires when the first listed job closes.
+    """
+    deadlines = featured_jobs().order_by('-created_at').values_list(
+        'apply_deadline', flat=True
+    )[:settings.LANDING_FEATURED_JOBS_LIMIT]
+    timeout = settings.LANDING_CACHE_TIMEOUT
+    if deadlines:
+        until_closed = (min(deadlines) - timezone.now()).total_seconds()
+        timeout = max(1, min(timeout, int(until_closed) + 1))
+    return timeout
+
+
+def get_content(request):
+    """
+    Return ``(content, etag)`` for the current content version.
+
+    Cached per host because serialized media URLs are absolute.
+    """
+    host = request.get_host()
+    key = f"landing:{get_version()}:{hashlib.md5(host.encode()).hexdigest()}"
+    cached = cache.get(key)
+    if cached is None:
+        content = build_content(request)
+        body = json.dumps(content, cls=DjangoJSONEncoder, sort_keys=True)
+        cached = (json.loads(body), hashlib.md5(body.encode()).hexdigest())
+        cache.set(key, cached, get_timeout())
+    return cached
+
+
+def connect_signals():
+    """Invalidate the bundle whenever landing page content changes."""
+    for model in SOURCE_MODELS:
+        post_save.connect(invalidate_landing, sender=model, dispatch_uid=f'landing:save:{model._meta.label}')
+        post_delete.connect(invalidate_landing, sender=model, dispatch_uid=f'landing:delete:{model._meta.label}')
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from content.visitors import flush, get_total
+from recruit_art.caching import cache_is_shared
+
+
+class Command(BaseCommand):
+    help = 'Folds visitor counts buffered in the cache into the VisitorCount row.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Run as a worker, flushing every N seconds. 0 runs once and exits.',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+
+        if not cache_is_shared():
+            self.stdout.write(
+                'No shared cache (REDIS_URL) is configured, so visits are written '
+                f'to the database directly; total is {get_total()}.'
+            )
+            return
+
+        while True:
+            flushed = flush()
+            self.stdout.write(self.style.SUCCESS(
+                f"Flushed {flushed} visit(s); total is now {get_total()}."
+            ))
+            if not interval:
+                break
+            time.sleep(interval)
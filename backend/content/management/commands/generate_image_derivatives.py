@@ -0,0 +1,66 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from content.image_derivatives import (
+    DERIVATIVE_SPECS,
+    generate,
+    needs_derivatives,
+    variants_field,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates resized WebP/JPEG copies for profile, team and news images '
+        'whose derivatives are missing or out of date.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Run as a worker, checking for new images every N seconds. 0 runs once and exits.',
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='Also retry images whose derivatives failed before.',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        retry_failed = options['retry_failed']
+
+        while True:
+            self.backfill(retry_failed)
+            # Only the first pass retries; later passes pick up new images
+            retry_failed = False
+            if not interval:
+                break
+            time.sleep(interval)
+
+    def backfill(self, retry_failed=False):
+        started = time.monotonic()
+        total = 0
+
+        for (model_label, field_name) in DERIVATIVE_SPECS:
+            model = apps.get_model(model_label)
+            instances = model.objects.only('pk', field_name, variants_field(field_name))
+            pending = [
+                instance.pk for instance in instances.iterator()
+                if needs_derivatives(instance, field_name, retry_failed)
+            ]
+            for pk in pending:
+                generate(model_label, field_name, pk)
+            if pending:
+                self.stdout.write(f"{model_label}.{field_name}: {len(pending)} image(s) processed")
+            total += len(pending)
+
+        if total:
+            elapsed = time.monotonic() - started
+            self.stdout.write(self.style.SUCCESS(
+                f"Generated derivatives for {total} image(s) in {elapsed:.2f}s."
+            ))
@@ -8,6 +8,7 @@ class NewsItem(models.Model):
     description = models.TextField('Short Description', blank=True, help_text="Brief summary shown on the card")
     content = models.TextField('Full Content', blank=True, help_text="Detailed news content")
     image = models.ImageField('Cover Image', upload_to='news_images/', blank=True, null=True)
+    image_variants = models.JSONField('Image Variants', default=dict, blank=True, editable=False)
     link_url = models.URLField('External Link', blank=True, null=True, help_text="Link to full article or external site")
     is_active = models.BooleanField('Is Active', default=True)
     created_at = models.DateTimeField(auto_now_add=True)
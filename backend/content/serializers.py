@@ -1,10 +1,13 @@
 from rest_framework import serializers
+from .image_derivatives import ImageSrcsetField
 from .models import NewsItem, VisitorCount
 
 class NewsItemSerializer(serializers.ModelSerializer):
+    image_srcset = ImageSrcsetField('image')
+
     class Meta:
         model = NewsItem
-        fields = ['id', 'title', 'description', 'content', 'image', 'link_url', 'created_at']
+        fields = ['id', 'title', 'description', 'content', 'image', 'image_srcset', 'link_url', 'created_at']
 
 class VisitorCountSerializer(serializers.ModelSerializer):
     class Meta:
@@ -0,0 +1,90 @@
+import io
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from content.image_derivatives import generate, needs_derivatives
+from feedback.models import TeamMember
+from feedback.serializers import TeamMemberSerializer
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def png(width, height, mode='RGBA'):
+    buffer = io.BytesIO()
+    color = (200, 10, 10, 128) if mode == 'RGBA' else (1, 2, 3)
+    Image.new(mode, (width, height), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_DERIVATIVE_WORKERS=0)
+class ImageDerivativeTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def create_member(self, data, name='photo.png'):
+        return TeamMember.objects.create(
+            name='Member', role='Recruiter', image=SimpleUploadedFile(name, data, 'image/png')
+        )
+
+    def test_generates_each_width_and_format(self):
+        member = self.create_member(png(1000, 500))
+
+        generate('feedback.TeamMember', 'image', member.pk)
+
+        member.refresh_from_db()
+        self.assertEqual(member.image_variants['source'], member.image.name)
+        for fmt in ('webp', 'jpeg'):
+            self.assertEqual(sorted(member.image_variants[fmt], key=int), ['160', '320', '640'])
+            for width, name in member.image_variants[fmt].items():
+                with Image.open(os.path.join(MEDIA_ROOT, name)) as image:
+                    self.assertEqual(image.width, int(width))
+        srcset = TeamMemberSerializer(member).data['image_srcset']
+        self.assertIn('640w', srcset['webp'])
+
+    def test_new_image_replaces_old_derivatives(self):
+        member = self.create_member(png(400, 400))
+        generate('feedback.TeamMember', 'image', member.pk)
+        member.refresh_from_db()
+        old = member.image_variants
+
+        member.image = SimpleUploadedFile('new.png', png(100, 80, 'RGB'), 'image/png')
+        member.save()
+        self.assertIsNone(TeamMemberSerializer(member).data['image_srcset'])
+        call_command('generate_image_derivatives', stdout=StringIO())
+
+        member.refresh_from_db()
+        self.assertEqual(member.image_variants['source'], member.image.name)
+        self.assertFalse(os.path.exists(os.path.join(MEDIA_ROOT, old['webp']['160'])))
+
+    def test_failure_is_recorded_and_not_retried(self):
+        member = self.create_member(b'not an image')
+
+        generate('feedback.TeamMember', 'image', member.pk)
+
+        member.refresh_from_db()
+        self.assertEqual(member.image_variants['source'], member.image.name)
+        self.assertIn('error', member.image_variants)
+        self.assertFalse(needs_derivatives(member, 'image'))
+        self.assertIsNone(TeamMemberSerializer(member).data['image_srcset'])
+
+        # Later saves and the backfill leave it alone
+        with self.captureOnCommitCallbacks() as callbacks:
+            member.save()
+        self.assertEqual(callbacks, [])
+        with mock.patch('content.management.commands.generate_image_derivatives.generate') as retried:
+            call_command('generate_image_derivatives', stdout=StringIO())
+        retried.assert_not_called()
+
+        with mock.patch('content.management.commands.generate_image_derivatives.generate') as retried:
+            call_command('generate_image_derivatives', '--retry-failed', stdout=StringIO())
+        retried.assert_called_once_with('feedback.TeamMember', 'image', member.pk)
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from content.models import NewsItem
+from feedback.models import Testimonial
+from jobs.models import Job
+
+
+class LandingBundleTests(TestCase):
+    """Without a shared cache the version comes from the database."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.news = NewsItem.objects.create(title='Opening')
+        Testimonial.objects.create(author_name='Asha', author_position='Editor', content='Great')
+        self.job = Job.objects.create(
+            title='Colorist',
+            company_name='Studio',
+            location='Chennai',
+            description='Grade footage',
+            number_of_openings=1,
+            status='active',
+            is_featured=True,
+            apply_deadline=timezone.now() + timedelta(days=3),
+        )
+
+    def get(self, **extra):
+        return self.client.get('/api/content/landing/', **extra)
+
+    def test_repeat_requests_reuse_the_bundle(self):
+        with CaptureQueriesContext(connection) as first:
+            response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([n['title'] for n in response.json()['news']], ['Opening'])
+        self.assertEqual(len(response.json()['featured_jobs']), 1)
+
+        with CaptureQueriesContext(connection) as second:
+            repeat = self.get(HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(repeat.status_code, 304)
+        self.assertLess(len(second), len(first))
+
+    def test_writes_that_send_no_signal_still_change_the_bundle(self):
+        # Another worker's write leaves this process's cache untouched
+        etag = self.get()['ETag']
+        NewsItem.objects.filter(pk=self.news.pk).update(title='Closing', updated_at=timezone.now())
+
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([n['title'] for n in response.json()['news']], ['Closing'])
+
+    def test_deletes_change_the_bundle(self):
+        self.get()
+        NewsItem.objects.create(title='Later')
+        self.assertEqual(len(self.get().json()['news']), 2)
+
+        NewsItem.objects.filter(title='Later').delete()
+
+        self.assertEqual([n['title'] for n in self.get().json()['news']], ['Opening'])
+
+    def test_featured_job_drops_out_at_its_deadline(self):
+        self.assertEqual(len(self.get().json()['featured_jobs']), 1)
+        # Passing the deadline changes no row
+        Job.objects.filter(pk=self.job.pk).update(
+            apply_deadline=timezone.now() - timedelta(minutes=1),
+            updated_at=self.job.updated_at,
+        )
+
+        self.assertEqual(self.get().json()['featured_jobs'], [])
+
+    def test_visits_change_the_etag(self):
+        etag = self.get()['ETag']
+        self.client.post('/api/content/visitors/')
+
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['visitors']['count'], 1001)
+
+
+@patch('content.visitors.cache_is_shared', return_value=True)
+@patch('content.landing.cache_is_shared', return_value=True)
+class SharedCacheLandingBundleTests(TestCase):
+    """With a shared cache the version is bumped by signals."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.news = NewsItem.objects.create(title='Opening')
+        self.job = Job.objects.create(
+            title='Colorist',
+            company_name='Studio',
+            location='Chennai',
+            description='Grade footage',
+            number_of_openings=1,
+            status='active',
+            is_featured=True,
+            apply_deadline=timezone.now() + timedelta(days=3),
+        )
+
+    def get(self, **extra):
+        return self.client.get('/api/content/landing/', **extra)
+
+    def test_cached_bundle_runs_no_queries(self, *mocks):
+        response = self.get()
+
+        with self.assertNumQueries(0):
+            repeat = self.get(HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(repeat.status_code, 304)
+
+    def test_saves_and_deletes_change_the_bundle(self, *mocks):
+        etag = self.get()['ETag']
+        self.news.title = 'Closing'
+        self.news.save()
+
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([n['title'] for n in response.json()['news']], ['Closing'])
+
+        self.job.delete()
+
+        self.assertEqual(self.get().json()['featured_jobs'], [])
+
+    @override_settings(LANDING_CACHE_TIMEOUT=300)
+    def test_bundle_expires_when_a_featured_job_closes(self, *mocks):
+        Job.objects.filter(pk=self.job.pk).update(apply_deadline=timezone.now() + timedelta(seconds=30))
+
+        with patch('content.landing.cache.set', wraps=cache.set) as cache_set:
+            self.get()
+
+        [timeout] = [c.args[2] for c in cache_set.call_args_list if c.args[0].startswith('landing:')]
+        self.assertLessEqual(timeout, 31)
+        self.assertGreater(timeout, 0)
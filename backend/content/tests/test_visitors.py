@@ -0,0 +1,115 @@
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+
+from content import visitors
+from content.models import VisitorCount
+
+
+def use_shared_cache(test):
+    """Treat the test cache as shared, as a Redis cache would be."""
+    for target in (
+        'content.visitors.cache_is_shared',
+        'content.management.commands.flush_visitor_count.cache_is_shared',
+    ):
+        patcher = mock.patch(target, return_value=True)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+
+
+class DirectVisitorCountTests(TestCase):
+    """Without a shared cache every visit goes straight to the row."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_visits_are_written_immediately(self):
+        self.assertEqual(self.client.get('/api/content/visitors/').json()['count'], 1000)
+
+        for _ in range(3):
+            self.client.post('/api/content/visitors/')
+
+        self.assertEqual(VisitorCount.objects.get().count, 1003)
+        self.assertEqual(self.client.get('/api/content/visitors/').json()['count'], 1003)
+        self.assertFalse(cache.get(visitors.PENDING_KEY))
+
+    def test_flush_command_explains_there_is_nothing_to_flush(self):
+        out = StringIO()
+        call_command('flush_visitor_count', stdout=out)
+        self.assertIn('written to the database directly', out.getvalue())
+
+
+class BufferedVisitorCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        use_shared_cache(self)
+
+    def test_visits_are_buffered_and_flushed(self):
+        self.assertEqual(self.client.get('/api/content/visitors/').json()['count'], 1000)
+        # The first visit flushes, later ones stay in the cache
+        self.client.post('/api/content/visitors/')
+        with self.assertNumQueries(0):
+            for _ in range(50):
+                self.client.post('/api/content/visitors/')
+            self.assertEqual(self.client.get('/api/content/visitors/').json()['count'], 1051)
+        self.assertEqual(VisitorCount.objects.get().count, 1001)
+
+        call_command('flush_visitor_count', stdout=StringIO())
+
+        self.assertEqual(VisitorCount.objects.get().count, 1051)
+        self.assertEqual(self.client.get('/api/content/visitors/').json()['count'], 1051)
+
+    def test_flush_skips_while_another_flush_holds_the_lock(self):
+        visitors.ensure_counter()
+        cache.set(visitors.PENDING_KEY, 5, None)
+        cache.add(visitors.FLUSH_LOCK_KEY, 1)
+
+        self.assertEqual(visitors.flush(), 0)
+        cache.delete(visitors.FLUSH_LOCK_KEY)
+        self.assertEqual(visitors.flush(), 5)
+        self.assertEqual(visitors.flush(), 0)
+        self.assertEqual(cache.get(visitors.PENDING_KEY), 0)
+        self.assertEqual(VisitorCount.objects.get().count, 1005)
+
+    def test_put_drops_the_cached_total(self):
+        self.assertEqual(self.client.get('/api/content/visitors/').json()['count'], 1000)
+
+        self.client.put('/api/content/visitors/', {'count': 5000}, format='json')
+
+        self.assertEqual(self.client.get('/api/content/visitors/').json()['count'], 5000)
+
+
+class ConcurrentFlushTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        use_shared_cache(self)
+
+    @override_settings(VISITOR_FLUSH_INTERVAL=0)
+    def test_concurrent_flushes_apply_visits_once(self):
+        visitors.ensure_counter()
+        cache.set(visitors.PENDING_KEY, 40, None)
+        barrier = threading.Barrier(8)
+
+        def run():
+            barrier.wait()
+            try:
+                visitors.flush()
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cache.get(visitors.PENDING_KEY), 0)
+        self.assertEqual(VisitorCount.objects.get().count, 1040)
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import NewsItemViewSet, VisitorStatsView
+from .views import NewsItemViewSet, VisitorStatsView, LandingView
 
 router = DefaultRouter()
 router.register(r'news', NewsItemViewSet, basename='news')
@@ -8,4 +8,5 @@ router.register(r'news', NewsItemViewSet, basename='news')
 urlpatterns = [
     path('', include(router.urls)),
     path('visitors/', VisitorStatsView.as_view(), name='visitor-stats'),
+    path('landing/', LandingView.as_view(), name='landing'),
 ]
@@ -1,13 +1,16 @@
-from rest_framework import viewsets, status, generics
+from rest_framework import viewsets, status, generics, views
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.db import transaction
+from django.utils.http import parse_etags, quote_etag
+from recruit_art.db_routing import ReplicaReadMixin
+from .landing import get_content
 from .models import NewsItem, VisitorCount
 from .serializers import NewsItemSerializer, VisitorCountSerializer
+from .visitors import ensure_counter, get_total, record_visit
 
-class NewsItemViewSet(viewsets.ReadOnlyModelViewSet):
+class NewsItemViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
-    Public ViewSet for active News Items.
+    Public ViewSet for active News Items, served from the read replica.
     """
     queryset = NewsItem.objects.all().filter(is_active=True)
     serializer_class = NewsItemSerializer
@@ -15,28 +18,52 @@ class NewsItemViewSet(viewsets.ReadOnlyModelViewSet):
 
 class VisitorStatsView(generics.RetrieveUpdateAPIView):
     """
-    View to get and atomically increment site visitor count.
+    View to get and increment site visitor count.
+
+    With a shared cache, visits are buffered there and flushed to the
+    database periodically; otherwise each visit is one atomic update (see
+    content/visitors.py). A PUT or PATCH saves the row, which drops the
+    cached total.
     """
     serializer_class = VisitorCountSerializer
     permission_classes = [AllowAny]
 
     def get_object(self):
-        obj, created = VisitorCount.objects.get_or_create(id=1)
-        if created:
-            obj.count = 1000
-            obj.save()
-        return obj
+        return ensure_counter()
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return the total, including visits not yet flushed."""
+        return Response({'count': get_total()}, status=status.HTTP_200_OK)
 
     def post(self, request, *args, **kwargs):
         """
-        Increment the visitor count atomically.
+        Count a visit without locking the counter row.
         """
-        with transaction.atomic():
-            obj, created = VisitorCount.objects.select_for_update().get_or_create(id=1)
-            if created:
-                obj.count = 1000 # Start at 1000
-            else:
-                obj.count += 1
-            obj.save()
-            
-        return Response({'count': obj.count}, status=status.HTTP_200_OK)
+        return Response({'count': record_visit()}, status=status.HTTP_200_OK)
+
+
+class LandingView(views.APIView):
+    """
+    Everything the public landing page needs in one cached response.
+
+    GET: News, testimonials, team, featured jobs, contact info and visitor
+    count. Supports ``If-None-Match`` for 304 responses.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        content, content_etag = get_content(request)
+        count = get_total()
+        etag = quote_etag(f"{content_etag}-{count}")
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == '*'):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response({**content, 'visitors': {'count': count}})
+
+        response['ETag'] = etag
+        # Browsers may keep the bundle but must revalidate it with the ETag
+        response['Cache-Control'] = 'no-cache'
+        return response
@@ -0,0 +1,148 @@
+"""
+Visitor Counter for Content App
+
+This module counts visits without a locking read-modify-write of the
+single ``VisitorCount`` row on every page view.
+
+With a shared cache (``REDIS_URL``), each visit is one atomic
+``cache.incr`` on a pending counter. At most once per
+``VISITOR_FLUSH_INTERVAL`` seconds, a visit (or ``manage.py
+flush_visitor_count``) folds the pending count into the database with a
+single ``F()`` update. Flushes take a lock in the cache, so a request and
+the command never apply the same visits twice. Reads add the pending
+count to a cached copy of the stored total, so they never touch the
+database either.
+
+A per-process cache would give each worker its own buffer, lose visits
+whenever a worker restarts and show a different total in each worker.
+Without a shared cache, every visit is therefore written straight to the
+row with an atomic ``F()`` update and reads come from the database.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from content.models import VisitorCount
+from recruit_art.caching import cache_is_shared
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = 'visitors:pending'
+BASE_KEY = 'visitors:base'
+FLUSH_INTERVAL_KEY = 'visitors:flush-interval'
+FLUSH_LOCK_KEY = 'visitors:flush-lock'
+FLUSH_LOCK_TIMEOUT = 30
+INITIAL_COUNT = 1000
+
+
+def ensure_counter():
+    """Return the counter row, creating it at the initial count."""
+    obj, _ = VisitorCount.objects.get_or_create(id=1, defaults={'count': INITIAL_COUNT})
+    return obj
+
+
+def add_visits(count):
+    """Add ``count`` visits to the stored total with one atomic update."""
+    with transaction.atomic():
+        ensure_counter()
+        VisitorCount.objects.filter(id=1).update(
+            count=F('count') + count,
+            updated_at=timezone.now(),
+        )
+    return VisitorCount.objects.values_list('count', flat=True).get(id=1)
+
+
+def get_base():
+    """Stored total, cached until the next flush."""
+    base = cache.get(BASE_KEY)
+    if base is None:
+        base = ensure_counter().count
+        cache.set(BASE_KEY, base, None)
+    return base
+
+
+def get_total():
+    """Stored total plus visits not yet flushed."""
+    if not cache_is_shared():
+        return ensure_counter().count
+    values = cache.get_many([BASE_KEY, PENDING_KEY])
+    base = values.get(BASE_KEY)
+    if base is None:
+        base = get_base()
+    return base + values.get(PENDING_KEY, 0)
+
+
+def record_visit():
+    """
+    Count one visit and return the new total.
+
+    Also triggers a flush if none has run in the last flush interval.
+    """
+    if not cache_is_shared():
+        return add_visits(1)
+
+    try:
+        cache.incr(PENDING_KEY)
+    except ValueError:
+        cache.add(PENDING_KEY, 0, None)
+        cache.incr(PENDING_KEY)
+
+    if cache.add(FLUSH_INTERVAL_KEY, 1, settings.VISITOR_FLUSH_INTERVAL):
+        flush()
+    return get_total()
+
+
+def flush():
+    """
+    Fold pending visits into ``VisitorCount`` with one ``F()`` update.
+
+    Returns:
+        int: Number of visits flushed (0 if another flush is running)
+    """
+    if not cache_is_shared():
+        return 0
+    # Reading and then subtracting the pending count is only an atomic
+    # swap while no other flush does the same
+    if not cache.add(FLUSH_LOCK_KEY, 1, FLUSH_LOCK_TIMEOUT):
+        return 0
+    try:
+        pending = cache.get(PENDING_KEY) or 0
+        if not pending:
+            return 0
+
+        # Subtract only what we read, so visits counted meanwhile stay pending
+        cache.decr(PENDING_KEY, pending)
+        try:
+            cache.incr(BASE_KEY, pending)
+        except ValueError:
+            pass
+
+        try:
+            total = add_visits(pending)
+        except Exception:
+            # Put the visits back so the next flush retries them
+            cache.delete(BASE_KEY)
+            cache.incr(PENDING_KEY, pending)
+            raise
+
+        cache.set(BASE_KEY, total, None)
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+
+    logger.info("Flushed %s visit(s) to the visitor counter", pending)
+    return pending
+
+
+def counter_saved(**kwargs):
+    """post_save receiver: drop the cached total after a direct edit (API PUT, admin)."""
+    cache.delete(BASE_KEY)
+
+
+def connect_signals():
+    post_save.connect(counter_saved, sender=VisitorCount, dispatch_uid='visitors:counter-saved')
@@ -9,6 +9,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAdminUser
 from django.shortcuts import get_object_or_404
+from accounts.throttles import IPRateThrottle, EmailRateThrottle
 from enquiries.models import CorporateEnquiry
 from enquiries.serializers import (
     CorporateEnquirySerializer,
@@ -17,6 +18,18 @@ from enquiries.serializers import (
     EnquiryAdminSerializer,
 )
 
+# Company contact details (also embedded in the landing page bundle)
+CONTACT_INFO = {
+    "company_name": "Recruit Art",
+    "email": "hr@recruitart.in",
+    "phone": "+91 98765 43210",
+    "address": "123, Tech Park, Bangalore, India",
+    "socials": {
+        "linkedin": "https://linkedin.com/company/recruit-art",
+        "twitter": "https://twitter.com/recruitart"
+    }
+}
+
 
 class CorporateEnquiryViewSet(viewsets.ModelViewSet):
     """
@@ -28,6 +41,7 @@ class CorporateEnquiryViewSet(viewsets.ModelViewSet):
     
     queryset = CorporateEnquiry.objects.all()
     permission_classes = [AllowAny]
+    throttle_scope = 'enquiry'
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -70,6 +84,12 @@ class CorporateEnquiryViewSet(viewsets.ModelViewSet):
             return [IsAdminUser()]
         return [AllowAny()]
     
+    def get_throttles(self):
+        """Throttle public submissions only."""
+        if self.action == 'create':
+            return [IPRateThrottle(), EmailRateThrottle()]
+        return super().get_throttles()
+    
     def create(self, request, *args, **kwargs):
         """Submit a new corporate enquiry."""
         serializer = self.get_serializer(data=request.data)
@@ -148,6 +168,8 @@ class EnquirySubmitView(views.APIView):
     POST: Submit new enquiry
     """
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
+    throttle_scope = 'enquiry'
     
     def post(self, request):
         """Submit a new corporate enquiry."""
@@ -176,14 +198,5 @@ class ContactInfoView(views.APIView):
     
     def get(self, request):
         """Return company contact details."""
-        return Response({
-            "company_name": "Recruit Art",
-            "email": "hr@recruitart.in",
-            "phone": "+91 98765 43210",
-            "address": "123, Tech Park, Bangalore, India",
-            "socials": {
-                "linkedin": "https://linkedin.com/company/recruit-art",
-                "twitter": "https://twitter.com/recruitart"
-            }
-        })
+        return Response(CONTACT_INFO)
 
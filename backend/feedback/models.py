@@ -130,6 +130,7 @@ class TeamMember(models.Model):
     name = models.CharField('Name', max_length=255)
     role = models.CharField('Role', max_length=255)
     image = models.ImageField('Image', upload_to='team/', help_text='Arched profile image')
+    image_variants = models.JSONField('Image Variants', default=dict, blank=True, editable=False)
     linkedin_url = models.URLField('LinkedIn URL', blank=True, null=True)
     order = models.PositiveIntegerField('Display Order', default=0)
     is_active = models.BooleanField('Is Active', default=True)
@@ -5,6 +5,7 @@ This module contains serializers for user feedback.
 """
 
 from rest_framework import serializers
+from content.image_derivatives import ImageSrcsetField
 from feedback.models import Feedback, Testimonial, TeamMember
 
 
@@ -87,10 +88,12 @@ class TestimonialSerializer(serializers.ModelSerializer):
 class TeamMemberSerializer(serializers.ModelSerializer):
     """Serializer for TeamMember model."""
     
+    image_srcset = ImageSrcsetField('image')
+    
     class Meta:
         model = TeamMember
         fields = [
-            'id', 'name', 'role', 'image', 
+            'id', 'name', 'role', 'image', 'image_srcset',
             'linkedin_url', 'order', 'is_active'
         ]
         read_only_fields = ['id']
@@ -8,6 +8,8 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAdminUser
+from accounts.throttles import IPRateThrottle, EmailRateThrottle
+from recruit_art.db_routing import ReplicaReadMixin
 from feedback.models import Feedback, Testimonial, TeamMember
 from feedback.serializers import (
     FeedbackSerializer,
@@ -29,6 +31,7 @@ class FeedbackViewSet(viewsets.ModelViewSet):
     
     queryset = Feedback.objects.all()
     permission_classes = [AllowAny]
+    throttle_scope = 'feedback'
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -73,6 +76,12 @@ class FeedbackViewSet(viewsets.ModelViewSet):
             return [IsAdminUser()]
         return [AllowAny()]
     
+    def get_throttles(self):
+        """Throttle public submissions only."""
+        if self.action == 'create':
+            return [IPRateThrottle(), EmailRateThrottle()]
+        return super().get_throttles()
+    
     def create(self, request, *args, **kwargs):
         """Submit new feedback."""
         serializer = self.get_serializer(data=request.data)
@@ -149,11 +158,11 @@ class FeedbackViewSet(viewsets.ModelViewSet):
         )
 
 
-class TestimonialViewSet(viewsets.ModelViewSet):
+class TestimonialViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing testimonials.
     
-    GET: List active testimonials (public)
+    GET: List active testimonials (public, served from the read replica)
     Others: Admin only
     """
     queryset = Testimonial.objects.all()
@@ -174,11 +183,11 @@ class TestimonialViewSet(viewsets.ModelViewSet):
 
 
 
-class TeamMemberViewSet(viewsets.ModelViewSet):
+class TeamMemberViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing team members.
     
-    GET: List active team members (public)
+    GET: List active team members (public, served from the read replica)
     Others: Admin only
     """
     queryset = TeamMember.objects.all()
@@ -0,0 +1,170 @@
+"""
+Gunicorn Configuration for Recruit Art
+
+Gunicorn loads this file automatically when started from ``backend/``
+(``gunicorn`` with no arguments), or explicitly with ``-c gunicorn.conf.py``.
+
+Worker class (``GUNICORN_WORKER_CLASS``):
+
+- ``gthread`` (default): threaded WSGI workers. Requests mostly wait on the
+  database, SendGrid or Cloudinary, so threads keep a worker busy while
+  one of them waits.
+- ``sync``: one request per worker.
+- ``uvicorn``: ASGI workers serving ``recruit_art.asgi`` (ASGI mode, async
+  views for OTP send, Firebase login and the notification stream).
+
+Worker count is ``WEB_CONCURRENCY`` if set, otherwise derived from the CPUs
+and memory available to the container (cgroup limits included), capped so
+``GUNICORN_WORKER_MEMORY_MB`` per worker fits in 80% of memory.
+
+The app and its URLconf are preloaded in the master so workers share
+them copy-on-write and answer their first request without importing
+anything; connections and DB pools opened while loading are closed
+before forking.
+Compare worker classes with ``manage.py benchmark_workers``.
+"""
+
+import multiprocessing
+import os
+
+
+def env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def cpu_count():
+    """CPUs this process may use, honouring affinity and cgroup v2/v1 quotas."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = multiprocessing.cpu_count()
+
+    quota = None
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            limit, period = f.read().split()
+            if limit != 'max':
+                quota = int(limit) / int(period)
+    except (OSError, ValueError):
+        try:
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+                limit = int(f.read())
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+                period = int(f.read())
+            if limit > 0:
+                quota = limit / period
+        except (OSError, ValueError):
+            pass
+
+    if quota:
+        cpus = min(cpus, max(1, int(quota + 0.5)))
+    return max(1, cpus)
+
+
+def memory_mb():
+    """Memory available to this container in MB, or None if unknown."""
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        # cgroup v1 reports "no limit" as a huge number
+        if value != 'max' and int(value) < 1 << 50:
+            return int(value) // (1024 * 1024)
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    'uvicorn': 'uvicorn_worker.UvicornWorker',
+}
+
+worker_type = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+if worker_type not in WORKER_CLASSES:
+    raise RuntimeError(
+        f"GUNICORN_WORKER_CLASS must be one of {', '.join(WORKER_CLASSES)}, not {worker_type!r}"
+    )
+worker_class = WORKER_CLASSES[worker_type]
+wsgi_app = 'recruit_art.asgi:application' if worker_type == 'uvicorn' else 'recruit_art.wsgi:application'
+
+if worker_type == 'gthread':
+    threads = env_int('GUNICORN_THREADS', 4)
+
+
+def default_workers():
+    cpus = cpu_count()
+    if worker_type == 'sync':
+        # Sync workers block on I/O, so run more of them than CPUs
+        workers = 2 * cpus + 1
+    elif worker_type == 'gthread':
+        workers = cpus + 1
+    else:
+        # One event loop per CPU
+        workers = cpus
+
+    available = memory_mb()
+    if available:
+        per_worker = env_int('GUNICORN_WORKER_MEMORY_MB', 150)
+        workers = min(workers, max(1, int(available * 0.8) // per_worker))
+    return workers
+
+
+workers = env_int('WEB_CONCURRENCY', 0) or default_workers()
+
+bind = os.getenv('GUNICORN_BIND', f"0.0.0.0:{os.getenv('PORT', '8000')}")
+
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True').lower() == 'true'
+
+# Outbound calls (SendGrid, Firebase key refresh) time out after 10 seconds,
+# so 30 leaves room for one of them plus the request's own work
+timeout = env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+# Longer than the platform proxy's idle timeout, so the proxy closes first
+keepalive = env_int('GUNICORN_KEEPALIVE', 75)
+
+# Recycle workers to bound slow memory growth; jitter avoids restarting
+# them all at once
+max_requests = env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+# Heartbeat files on tmpfs; a disk-backed /tmp can stall workers in containers
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# Application logs go through Django's LOGGING; gunicorn only reports errors
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def pre_fork(server, worker):
+    """Keep DB and cache connections opened while preloading out of the workers."""
+    if not preload_app:
+        return
+    from django.core.cache import caches
+    from django.db import connections
+
+    connections.close_all()
+    for connection in connections.all(initialized_only=True):
+        # A pool's worker threads do not survive fork; children open their own
+        if connection.settings_dict.get('OPTIONS', {}).get('pool'):
+            connection.close_pool()
+    for cache in caches.all(initialized_only=True):
+        cache.close()
+
+
+def when_ready(server):
+    if preload_app:
+        # Import the URLconf once in the master; otherwise every worker
+        # imports it on its first request
+        from django.urls import get_resolver
+
+        get_resolver().url_patterns
+    server.log.info(
+        f"Serving {wsgi_app} with {workers} {worker_type} worker(s)"
+        + (f" x {threads} threads" if worker_type == 'gthread' else '')
+    )
@@ -1,10 +1,12 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from import_export import resources, fields
 from import_export.admin import ExportMixin
-from jobs.models import Job, JobRequirement, JobApplication, ApplicationResponse
+from jobs.models import Job, JobRequirement, JobApplication, ApplicationResponse, ResumeBlob
 from django.db.models import Prefetch
 from django.utils.html import format_html
 from django.http import HttpResponse
+from jobs.storage_urls import resolver, resolve_resume_urls
 
 class JobRequirementInline(admin.TabularInline):
     """Inline admin for JobRequirement model."""
@@ -67,18 +69,8 @@ class JobApplicationResource(resources.ModelResource):
             return "No resume"
         
         try:
-            resume_url = obj.resume.url
-            from django.conf import settings as django_settings
-            
-            # Use same fallback logic as resume_link for robustness
-            if resume_url.startswith('/media/') and not django_settings.DEBUG:
-                cloud_name = getattr(django_settings, 'CLOUDINARY_STORAGE', {}).get('CLOUD_NAME')
-                if cloud_name:
-                    path = resume_url.replace('/media/', '')
-                    resume_url = f"https://res.cloudinary.com/{cloud_name}/raw/upload/{path}"
-            
-            return resume_url
-        except:
+            return resolver.url(obj.resume)
+        except Exception:
             return "Link Error"
 
     def dehydrate_responses(self, obj):
@@ -100,6 +92,9 @@ class JobApplicationResource(resources.ModelResource):
         Note: This is a simplified approach. For highly dynamic columns, 
         one would usually override ExportMixin's get_export_data.
         """
+        if queryset is not None:
+            # Resolve every distinct resume URL up front, once per file
+            resolve_resume_urls(queryset)
         data = super().export(queryset, *args, **kwargs)
         
         # If we have queryset, we can try to add dynamic headers
@@ -153,6 +148,14 @@ class JobAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
 
+class JobApplicationChangeList(ChangeList):
+    """Changelist that resolves the page's resume URLs in one batch."""
+    
+    def get_results(self, request):
+        super().get_results(request)
+        resolve_resume_urls(self.result_list)
+
+
 @admin.register(JobApplication)
 class JobApplicationAdmin(ExportMixin, admin.ModelAdmin):
     """Admin for JobApplication model with Excel Export."""
@@ -161,10 +164,11 @@ class JobApplicationAdmin(ExportMixin, admin.ModelAdmin):
     actions = ['export_selected_to_excel']
     
     list_display = [
-        'full_name', 'email', 'job', 'status', 'applied_at'
+        'full_name', 'email', 'job', 'status', 'applied_at', 'resume_link'
     ]
-    list_filter = ['status', 'job__job_type', 'applied_at', 'job__category']
+    list_filter = ['status', 'job__job_type', 'applied_at', 'job__category', 'resume_text_status']
     search_fields = ['full_name', 'email', 'mobile', 'job__title']
+    list_select_related = ['job']
     date_hierarchy = 'applied_at'
     ordering = ['-applied_at']
     
@@ -196,6 +200,9 @@ class JobApplicationAdmin(ExportMixin, admin.ModelAdmin):
     
     readonly_fields = ['applied_at', 'updated_at', 'resume']
     
+    def get_changelist(self, request, **kwargs):
+        return JobApplicationChangeList
+    
     def get_inlines(self, request, obj):
         """Only show ApplicationResponse inline when editing an existing application."""
         if obj:
@@ -227,25 +234,13 @@ class JobApplicationAdmin(ExportMixin, admin.ModelAdmin):
     def resume_link(self, obj):
         """
         Safely render a link to the resume. Handles Cloudinary vs Local storage.
-        If it's a relative URL in production, we try to construct a Cloudinary link.
+        URLs come from the memoized resolver (see jobs/storage_urls.py).
         """
         if not obj.resume:
             return "No resume uploaded"
         
         try:
-            resume_url = obj.resume.url
-            
-            # If we're on Render and the URL is relative (starts with /media/),
-            # it means the storage backend failed to return the absolute Cloudinary URL.
-            if resume_url.startswith('/media/') and not settings.DEBUG:
-                # Try to get cloud name to build a fallback link
-                from django.conf import settings as django_settings
-                cloud_name = getattr(django_settings, 'CLOUDINARY_STORAGE', {}).get('CLOUD_NAME')
-                if cloud_name:
-                    # Construct manual Cloudinary RAW URL as fallback
-                    # Pattern for raw files: res.cloudinary.com/<cloud>/raw/upload/<path>
-                    path = resume_url.replace('/media/', '')
-                    resume_url = f"https://res.cloudinary.com/{cloud_name}/raw/upload/{path}"
+            resume_url = resolver.url(obj.resume)
 
             return format_html(
                 '<a href="{}" target="_blank" style="font-weight: bold; color: #264b5d; text-decoration: underline;" title="Opens in new tab">'
@@ -283,3 +278,11 @@ class ApplicationResponseAdmin(admin.ModelAdmin):
     list_filter = ['requirement', 'application__job']
     search_fields = ['response_value', 'application__full_name']
 
+
+@admin.register(ResumeBlob)
+class ResumeBlobAdmin(admin.ModelAdmin):
+    """Admin for deduplicated resume files."""
+    
+    list_display = ['sha256', 'file', 'size', 'content_type', 'created_at']
+    search_fields = ['sha256', 'file']
+    readonly_fields = ['sha256', 'file', 'size', 'content_type', 'created_at']
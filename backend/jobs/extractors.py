@@ -0,0 +1,87 @@
+"""
+Resume Text Extractors for Jobs App
+
+This module turns PDF and DOCX resume bytes into plain text. It has no
+Django imports so its functions can run in ``ProcessPoolExecutor`` worker
+processes regardless of the multiprocessing start method.
+"""
+
+import io
+import os
+import re
+import zipfile
+from xml.etree import ElementTree
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class UnsupportedResumeFormat(ValueError):
+    """Raised for resume files we cannot extract text from (images, .doc)."""
+
+
+def pdf_text(data):
+    """Return the text layer of a PDF."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def docx_text(data):
+    """Return the paragraph text of a DOCX file without python-docx."""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        root = ElementTree.fromstring(archive.read('word/document.xml'))
+
+    paragraphs = []
+    for paragraph in root.iter(f'{WORD_NAMESPACE}p'):
+        paragraphs.append(''.join(node.text or '' for node in paragraph.iter(f'{WORD_NAMESPACE}t')))
+    return '\n'.join(paragraphs)
+
+
+EXTRACTORS = {
+    '.pdf': pdf_text,
+    '.docx': docx_text,
+}
+
+
+def extract_text(data, name, max_chars=None):
+    """
+    Extract normalized plain text from resume bytes.
+
+    Args:
+        data (bytes): File content
+        name (str): File name, used to pick the extractor
+        max_chars (int, optional): Truncate the text to this length
+
+    Returns:
+        str: Whitespace-normalized text
+
+    Raises:
+        UnsupportedResumeFormat: If the file type has no extractor
+    """
+    ext = os.path.splitext(name)[1].lower()
+    extractor = EXTRACTORS.get(ext)
+    if extractor is None:
+        raise UnsupportedResumeFormat(f'No text extractor for "{ext or name}" files.')
+
+    text = extractor(data)
+    # Postgres text cannot hold NUL bytes, which some PDFs emit
+    text = re.sub(r'[ \t\r\f\v\x00]+', ' ', text)
+    text = re.sub(r'\s*\n\s*', '\n', text).strip()
+    return text[:max_chars] if max_chars else text
+
+
+def extract_resume(data, name, max_chars=None):
+    """
+    Pool-friendly wrapper around ``extract_text`` that never raises.
+
+    Returns:
+        tuple: (status, text, error) where status is one of
+        ``'done'``, ``'unsupported'`` or ``'failed'``
+    """
+    try:
+        return 'done', extract_text(data, name, max_chars), None
+    except UnsupportedResumeFormat as e:
+        return 'unsupported', '', str(e)
+    except Exception as e:
+        return 'failed', '', f'{type(e).__name__}: {e}'
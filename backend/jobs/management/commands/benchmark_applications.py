@@ -0,0 +1,356 @@
+import json
+import logging
+import math
+import os
+import statistics
+import tempfile
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from jobs.models import Job, JobRequirement
+
+User = get_user_model()
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'benchmarks',
+    'application_submit.json',
+)
+
+# Config keys that must match for a baseline comparison to mean anything
+COMPARABLE_CONFIG = ('jobs', 'requirements', 'requests', 'authenticated_ratio')
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(samples, elapsed=None):
+    """Latency percentiles, query counts and error count for a list of samples."""
+    latencies = sorted(sample['ms'] for sample in samples)
+    queries = [sample['queries'] for sample in samples]
+    summary = {
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample['status'] != 201),
+        'latency_ms': {
+            'p50': round(percentile(latencies, 0.50), 2),
+            'p95': round(percentile(latencies, 0.95), 2),
+            'p99': round(percentile(latencies, 0.99), 2),
+            'mean': round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        },
+        'queries': {
+            'min': min(queries, default=0),
+            'max': max(queries, default=0),
+            'mean': round(statistics.fmean(queries), 2) if queries else 0.0,
+        },
+    }
+    if elapsed:
+        summary['throughput_rps'] = round(len(samples) / elapsed, 2)
+    return summary
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks job application submission end to end (validation, resume '
+        'save, responses, notification) against a throwaway test database and '
+        'compares latency and query counts with a committed baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=5, help='Jobs to seed.')
+        parser.add_argument(
+            '--requirements',
+            type=int,
+            default=20,
+            help='Custom requirements per job, each answered in every submission.',
+        )
+        parser.add_argument('--requests', type=int, default=200, help='Measured submissions.')
+        parser.add_argument('--warmup', type=int, default=10, help='Unmeasured submissions sent first.')
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=0,
+            help='Target submissions per second. 0 sends them back to back.',
+        )
+        parser.add_argument(
+            '--authenticated-ratio',
+            type=float,
+            default=0.5,
+            help='Share of submissions sent by logged-in users (0-1).',
+        )
+        parser.add_argument(
+            '--baseline',
+            default=DEFAULT_BASELINE,
+            help='Baseline JSON to compare against (or write with --write-baseline).',
+        )
+        parser.add_argument(
+            '--write-baseline',
+            action='store_true',
+            help='Save this run as the new baseline instead of comparing.',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.5,
+            help='Allowed p95 latency growth over the baseline, as a fraction.',
+        )
+        parser.add_argument('--output', help='Also write the results JSON to this path.')
+
+    def handle(self, *args, **options):
+        if options['jobs'] < 1 or options['requests'] < 1 or options['requirements'] < 0:
+            raise CommandError('--jobs and --requests must be at least 1, --requirements at least 0.')
+        if not 0 <= options['authenticated_ratio'] <= 1:
+            raise CommandError('--authenticated-ratio must be between 0 and 1.')
+
+        config = {
+            'jobs': options['jobs'],
+            'requirements': options['requirements'],
+            'requests': options['requests'],
+            'warmup': options['warmup'],
+            'rate': options['rate'],
+            'authenticated_ratio': options['authenticated_ratio'],
+            'database': connection.vendor,
+        }
+
+        results = self.run_isolated(config)
+        report = {'config': config, 'results': results}
+        self.print_report(results)
+
+        if options['output']:
+            self.write_json(options['output'], report)
+
+        if options['write_baseline']:
+            self.write_json(options['baseline'], report)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+            return
+
+        self.compare(report, options['baseline'], options['tolerance'])
+
+    def run_isolated(self, config):
+        """Run the benchmark on a fresh test database with local media storage."""
+        logging.disable(logging.INFO)
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(
+                MEDIA_ROOT=media_root,
+                STORAGES={
+                    'default': {
+                        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+                        'OPTIONS': {'location': media_root},
+                    },
+                    'staticfiles': {
+                        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+                    },
+                },
+                CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+            ):
+                return self.run(config)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+            logging.disable(logging.NOTSET)
+
+    def seed(self, config, total):
+        """Create jobs with requirements and the users who will apply."""
+        jobs = Job.objects.bulk_create([
+            Job(
+                title=f'Benchmark Job {n}',
+                company_name='Benchmark Co',
+                location='Remote',
+                description='Seeded by benchmark_applications.',
+                status='active',
+                apply_deadline=timezone.now() + timedelta(days=30),
+            )
+            for n in range(config['jobs'])
+        ])
+        JobRequirement.objects.bulk_create([
+            JobRequirement(
+                job=job,
+                question_text=f'Question {n}',
+                field_name=f'question_{n}',
+                is_required=n % 2 == 0,
+                display_order=n,
+            )
+            for job in jobs
+            for n in range(config['requirements'])
+        ])
+        requirements = {}
+        for job_id, requirement_id in JobRequirement.objects.values_list('job_id', 'id'):
+            requirements.setdefault(job_id, []).append(requirement_id)
+
+        authenticated = math.ceil(total * config['authenticated_ratio'])
+        users = User.objects.bulk_create([
+            User(email=f'bench{n}@example.com', mobile=f'9{n:09d}', is_active=True, token_version=1)
+            for n in range(authenticated)
+        ])
+        tokens = []
+        for user in users:
+            refresh = RefreshToken.for_user(user)
+            refresh['token_version'] = user.token_version
+            tokens.append(str(refresh.access_token))
+
+        return [job.id for job in jobs], requirements, tokens
+
+    def build_payload(self, n, job_id, requirement_ids):
+        """Multipart form for one submission, with a unique small PDF resume."""
+        resume = SimpleUploadedFile(
+            f'resume_{n}.pdf',
+            b'%PDF-1.4\n% benchmark resume ' + str(n).encode() + b'\n%%EOF\n',
+            content_type='application/pdf',
+        )
+
+        payload = {
+            'job': job_id,
+            'full_name': f'Applicant {n}',
+            'email': f'applicant{n}@example.com',
+            'mobile': f'8{n:09d}',
+            'preferred_job_designation': 'Engineer',
+            'preferred_job_location': 'Remote',
+            'expected_salary': '100000',
+            'join_after': '30 days',
+            'total_experience': '5 years',
+            'resume': resume,
+        }
+        for index, requirement_id in enumerate(requirement_ids):
+            payload[f'responses[{index}]requirement'] = requirement_id
+            payload[f'responses[{index}]response_value'] = f'Answer {index}'
+        return payload
+
+    def run(self, config):
+        total = config['warmup'] + config['requests']
+        job_ids, requirements, tokens = self.seed(config, total)
+        # Spread authenticated submissions evenly through the run
+        step = total / len(tokens) if tokens else 0
+        authenticated_at = {math.floor(i * step): token for i, token in enumerate(tokens)}
+
+        client = Client()
+        samples = []
+        started = None
+        interval = 1 / config['rate'] if config['rate'] else 0
+
+        for n in range(total):
+            if n == config['warmup']:
+                started = time.perf_counter()
+            if interval and started is not None:
+                # Open-loop pacing: wait for this request's slot, never catch up by bursting
+                delay = started + (n - config['warmup']) * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            job_id = job_ids[n % len(job_ids)]
+            payload = self.build_payload(n, job_id, requirements.get(job_id, []))
+            headers = {'REMOTE_ADDR': f'10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}'}
+            token = authenticated_at.get(n)
+            if token:
+                headers['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+
+            # The query log is capped, so start each request from an empty one
+            reset_queries()
+            with CaptureQueriesContext(connection) as queries:
+                request_started = time.perf_counter()
+                response = client.post('/api/jobs/applications/', payload, **headers)
+                elapsed_ms = (time.perf_counter() - request_started) * 1000
+
+            if response.status_code != 201:
+                self.stderr.write(f"Submission {n} failed ({response.status_code}): {response.content[:500]!r}")
+            if n >= config['warmup']:
+                samples.append({
+                    'scenario': 'authenticated' if token else 'anonymous',
+                    'status': response.status_code,
+                    'ms': elapsed_ms,
+                    'queries': len(queries.captured_queries),
+                })
+
+        elapsed = time.perf_counter() - started
+        results = {'all': summarize(samples, elapsed)}
+        for scenario in ('anonymous', 'authenticated'):
+            scenario_samples = [sample for sample in samples if sample['scenario'] == scenario]
+            if scenario_samples:
+                results[scenario] = summarize(scenario_samples)
+        return results
+
+    def print_report(self, results):
+        for scenario, summary in results.items():
+            latency = summary['latency_ms']
+            queries = summary['queries']
+            line = (
+                f"{scenario:>13}: {summary['requests']} req, {summary['errors']} errors, "
+                f"p50 {latency['p50']}ms p95 {latency['p95']}ms p99 {latency['p99']}ms, "
+                f"queries {queries['min']}-{queries['max']} (mean {queries['mean']})"
+            )
+            if 'throughput_rps' in summary:
+                line += f", {summary['throughput_rps']} req/s"
+            self.stdout.write(line)
+
+    def write_json(self, path, report):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    def compare(self, report, path, tolerance):
+        """
+        Fail on errors, on any query count above the baseline, or on p95
+        latency beyond the tolerance.
+        """
+        problems = [
+            f"{scenario}: {summary['errors']} submission(s) failed"
+            for scenario, summary in report['results'].items()
+            if scenario != 'all' and summary['errors']
+        ]
+
+        if not os.path.exists(path):
+            self.stdout.write(self.style.WARNING(f"No baseline at {path}; run with --write-baseline to create one."))
+        else:
+            with open(path) as f:
+                baseline = json.load(f)
+            mismatched = [
+                key for key in COMPARABLE_CONFIG
+                if baseline['config'].get(key) != report['config'].get(key)
+            ]
+            if mismatched:
+                raise CommandError(
+                    f"Run config differs from the baseline in {', '.join(mismatched)}; "
+                    f"rerun with matching options or --write-baseline."
+                )
+
+            for scenario, expected in baseline['results'].items():
+                actual = report['results'].get(scenario)
+                if actual is None:
+                    continue
+                if actual['queries']['max'] > expected['queries']['max']:
+                    problems.append(
+                        f"{scenario}: up to {actual['queries']['max']} queries per submission "
+                        f"(baseline {expected['queries']['max']})"
+                    )
+                limit = expected['latency_ms']['p95'] * (1 + tolerance)
+                if actual['latency_ms']['p95'] > limit:
+                    problems.append(
+                        f"{scenario}: p95 {actual['latency_ms']['p95']}ms exceeds "
+                        f"{limit:.2f}ms (baseline {expected['latency_ms']['p95']}ms + {tolerance:.0%})"
+                    )
+
+        if problems:
+            raise CommandError('Benchmark regression:\n  ' + '\n  '.join(problems))
+        self.stdout.write(self.style.SUCCESS('No regressions against the baseline.'))
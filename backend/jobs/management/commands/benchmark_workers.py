@@ -0,0 +1,250 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from urllib.parse import quote
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from jobs.management.commands.benchmark_applications import percentile
+from jobs.models import Job
+
+WORKER_CLASSES = ('sync', 'gthread', 'uvicorn')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = (
+        'Starts gunicorn with each worker class from gunicorn.conf.py (sync, '
+        'gthread, uvicorn) against a throwaway seeded database and load tests '
+        'the job list endpoint, reporting throughput and latency percentiles.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--worker-classes',
+            default=','.join(WORKER_CLASSES),
+            help='Comma-separated worker classes to compare.',
+        )
+        parser.add_argument('--workers', type=int, default=2, help='Gunicorn workers per run (WEB_CONCURRENCY).')
+        parser.add_argument('--threads', type=int, default=4, help='Threads per gthread worker.')
+        parser.add_argument('--concurrency', type=int, default=32, help='Concurrent client connections.')
+        parser.add_argument('--duration', type=float, default=10, help='Seconds of measured load per worker class.')
+        parser.add_argument('--warmup', type=float, default=2, help='Seconds of unmeasured load first.')
+        parser.add_argument('--jobs', type=int, default=50, help='Active jobs to seed.')
+        parser.add_argument('--path', default='/api/jobs/jobs/', help='Endpoint to load test.')
+        parser.add_argument(
+            '--db-pools',
+            default='',
+            help='Comma-separated DB_POOL modes to compare on Postgres (native, pgbouncer, persistent).',
+        )
+        parser.add_argument('--output', help='Also write the results JSON to this path.')
+
+    def handle(self, *args, **options):
+        classes = [name.strip() for name in options['worker_classes'].split(',') if name.strip()]
+        unknown = set(classes) - set(WORKER_CLASSES)
+        if unknown:
+            raise CommandError(f"Unknown worker classes: {', '.join(sorted(unknown))}")
+        if options['concurrency'] < 1 or options['duration'] <= 0:
+            raise CommandError('--concurrency must be at least 1 and --duration positive.')
+        pools = [name.strip() for name in options['db_pools'].split(',') if name.strip()]
+        if pools and connection.vendor != 'postgresql':
+            raise CommandError('--db-pools needs a Postgres database.')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            old_name = self.create_database(tmp)
+            try:
+                self.seed(options['jobs'])
+                env = self.server_env(options)
+                results = {}
+                for worker_class in classes:
+                    for pool in pools or [None]:
+                        label = f'{worker_class}/{pool}' if pool else worker_class
+                        self.stdout.write(f"Benchmarking {label}...")
+                        run_env = dict(env, DB_POOL=pool) if pool else env
+                        results[label] = self.run_server(worker_class, run_env, options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.print_report(results)
+        if options['output']:
+            config = {
+                key: options[key]
+                for key in ('workers', 'threads', 'concurrency', 'duration', 'jobs', 'path', 'db_pools')
+            }
+            with open(options['output'], 'w') as f:
+                json.dump({'config': config, 'results': results}, f, indent=2, sort_keys=True)
+                f.write('\n')
+
+    def create_database(self, tmp):
+        """Create a migrated throwaway database the servers can reach."""
+        if connection.vendor == 'sqlite':
+            # The default SQLite test database lives in memory; use a file
+            connection.settings_dict.setdefault('TEST', {})['NAME'] = os.path.join(tmp, 'benchmark.sqlite3')
+        elif connection.vendor != 'postgresql':
+            raise CommandError(f'Unsupported database for worker benchmarks: {connection.vendor}')
+        return connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+
+    def seed(self, count):
+        Job.objects.bulk_create([
+            Job(
+                title=f'Benchmark Job {n}',
+                company_name='Benchmark Co',
+                location='Remote',
+                description='Seeded by benchmark_workers.',
+                status='active',
+                apply_deadline=timezone.now() + timedelta(days=30),
+            )
+            for n in range(count)
+        ])
+
+    def server_env(self, options):
+        """Environment pointing gunicorn at the throwaway database."""
+        db = connection.settings_dict
+        env = dict(os.environ)
+        if connection.vendor == 'sqlite':
+            env['SQLITE_PATH'] = str(db['NAME'])
+        else:
+            credentials = quote(db['USER'] or '')
+            if db['PASSWORD']:
+                credentials += ':' + quote(db['PASSWORD'])
+            # Unix socket directories must be escaped to fit in the host part
+            host = quote(db['HOST'] or 'localhost', safe='')
+            port = f":{db['PORT']}" if db['PORT'] else ''
+            env['DATABASE_URL'] = f"postgres://{credentials}@{host}{port}/{quote(db['NAME'])}"
+
+        env.update({
+            'WEB_CONCURRENCY': str(options['workers']),
+            'GUNICORN_THREADS': str(options['threads']),
+            'GUNICORN_LOG_LEVEL': 'warning',
+            'LOG_LEVEL': 'WARNING',
+            # Workers must not recycle mid-run
+            'GUNICORN_MAX_REQUESTS': '0',
+        })
+        return env
+
+    def run_server(self, worker_class, env, options):
+        port = free_port()
+        env = dict(env, GUNICORN_WORKER_CLASS=worker_class, GUNICORN_BIND=f'127.0.0.1:{port}')
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'],
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+        try:
+            url = f'http://127.0.0.1:{port}{options["path"]}'
+            self.wait_until_ready(server, url)
+            return asyncio.run(self.load(url, options))
+        finally:
+            server.send_signal(signal.SIGTERM)
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    def wait_until_ready(self, server, url, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f'gunicorn exited with status {server.returncode}')
+            try:
+                response = httpx.get(url, timeout=2)
+                if response.status_code == 200:
+                    return
+                raise CommandError(f'{url} returned {response.status_code}: {response.text[:200]}')
+            except httpx.TransportError:
+                time.sleep(0.2)
+        raise CommandError(f'gunicorn did not answer {url} within {timeout}s')
+
+    async def load(self, url, options):
+        """Closed-loop load: each connection sends its next request on reply."""
+        latencies = []
+        errors = 0
+        limits = httpx.Limits(max_connections=options['concurrency'])
+
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            async def run(until, record):
+                nonlocal errors
+                while time.perf_counter() < until:
+                    started = time.perf_counter()
+                    try:
+                        response = await client.get(url)
+                        ok = response.status_code == 200
+                    except httpx.HTTPError:
+                        ok = False
+                    if record:
+                        if ok:
+                            latencies.append((time.perf_counter() - started) * 1000)
+                        else:
+                            errors += 1
+
+            warmup_until = time.perf_counter() + options['warmup']
+            await asyncio.gather(*(run(warmup_until, False) for _ in range(options['concurrency'])))
+
+            sessions = await sync_to_async(self.sessions_opened)()
+            started = time.perf_counter()
+            until = started + options['duration']
+            await asyncio.gather(*(run(until, True) for _ in range(options['concurrency'])))
+            elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        summary = {
+            'requests': len(latencies),
+            'errors': errors,
+            'throughput_rps': round(len(latencies) / elapsed, 1),
+            'latency_ms': {
+                'p50': round(percentile(latencies, 0.50), 2),
+                'p95': round(percentile(latencies, 0.95), 2),
+                'p99': round(percentile(latencies, 0.99), 2),
+            },
+        }
+        if sessions is not None:
+            opened = await sync_to_async(self.sessions_opened)() - sessions
+            summary['db_connections_opened'] = opened
+            summary['db_connections_per_request'] = round(opened / max(1, len(latencies)), 3)
+        return summary
+
+    def sessions_opened(self):
+        """Postgres sessions ever opened on the benchmark database, or None."""
+        if connection.vendor != 'postgresql':
+            return None
+        # Session counts reach the statistics views within about a second
+        time.sleep(1.1)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_stat_clear_snapshot()')
+                cursor.execute('SELECT sessions FROM pg_stat_database WHERE datname = current_database()')
+                return cursor.fetchone()[0]
+        finally:
+            # Runs in an executor thread; release its connection so the
+            # benchmark database can be dropped afterwards
+            connection.close()
+
+    def print_report(self, results):
+        for worker_class, summary in results.items():
+            latency = summary['latency_ms']
+            self.stdout.write(
+                f"{worker_class:>18}: {summary['throughput_rps']} req/s, {summary['requests']} req, "
+                f"{summary['errors']} errors, p50 {latency['p50']}ms p95 {latency['p95']}ms "
+                f"p99 {latency['p99']}ms"
+                + (
+                    f", {summary['db_connections_per_request']} new DB connections/request"
+                    if 'db_connections_per_request' in summary else ''
+                )
+            )
@@ -0,0 +1,95 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Case, Count, IntegerField, Value, When
+from django.db.models.functions import Lower
+
+from jobs.models import JobApplication, ResumeBlob
+from jobs.resumes import discard_resume
+
+
+class Command(BaseCommand):
+    help = (
+        'Finds applications that break the one-application-per-job rule '
+        '(same job and applicant, or same job and email for anonymous '
+        'applications) and, with --apply, deletes all but one of each. '
+        'Run it when migration jobs.0006 refuses to add the unique constraints.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='Delete the duplicates. Without it, only lists what would be deleted.',
+        )
+
+    def handle(self, *args, **options):
+        apply = options['apply']
+        removed = 0
+
+        for label, applications in self.duplicate_groups():
+            keep, *duplicates = applications
+            self.stdout.write(
+                f"{label}: keeping #{keep.id} ({keep.status}), "
+                f"removing {', '.join(f'#{a.id}' for a in duplicates)}"
+            )
+            if apply:
+                self.remove(duplicates)
+            removed += len(duplicates)
+
+        if not removed:
+            self.stdout.write(self.style.SUCCESS('No duplicate applications found.'))
+        elif apply:
+            self.stdout.write(self.style.SUCCESS(f"Removed {removed} duplicate application(s)."))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"{removed} duplicate application(s) would be removed; rerun with --apply."
+            ))
+
+    def duplicate_groups(self):
+        """
+        Yield ``(label, applications)`` per duplicate group, best first.
+
+        The application to keep is the one a recruiter has already acted
+        on, otherwise the earliest.
+        """
+        ordered = JobApplication.objects.annotate(
+            unreviewed=Case(When(status='pending', then=Value(1)), default=Value(0), output_field=IntegerField()),
+        ).order_by('unreviewed', 'applied_at', 'id')
+
+        by_applicant = (
+            JobApplication.objects.filter(applicant__isnull=False)
+            .values('job_id', 'applicant_id').annotate(n=Count('id')).filter(n__gt=1)
+        )
+        for group in by_applicant:
+            yield (
+                f"Job {group['job_id']}, applicant {group['applicant_id']}",
+                list(ordered.filter(job_id=group['job_id'], applicant_id=group['applicant_id'])),
+            )
+
+        by_email = (
+            JobApplication.objects.filter(applicant__isnull=True)
+            .values('job_id', email_lower=Lower('email')).annotate(n=Count('id')).filter(n__gt=1)
+        )
+        for group in by_email:
+            yield (
+                f"Job {group['job_id']}, email {group['email_lower']}",
+                list(ordered.filter(job_id=group['job_id'], applicant__isnull=True, email__iexact=group['email_lower'])),
+            )
+
+    def remove(self, applications):
+        """Delete applications, then any resume files only they used."""
+        with transaction.atomic():
+            JobApplication.objects.filter(id__in=[a.id for a in applications]).delete()
+
+        User = get_user_model()
+        for application in applications:
+            if application.resume_sha256:
+                blob = ResumeBlob.objects.filter(sha256=application.resume_sha256).first()
+                if blob:
+                    discard_resume(blob)
+            elif application.resume and not (
+                JobApplication.objects.filter(resume=application.resume.name).exists()
+                or User.objects.filter(resume=application.resume.name).exists()
+            ):
+                application.resume.delete(save=False)
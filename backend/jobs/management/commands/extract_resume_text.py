@@ -0,0 +1,71 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.resume_text import ParserPool, extract_pending
+
+
+class Command(BaseCommand):
+    help = (
+        'Extracts text from pending PDF/DOCX resumes in a process pool and '
+        'indexes it for recruiter search.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.RESUME_TEXT_BATCH_SIZE,
+            help='Applications fetched and updated per batch.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.RESUME_TEXT_WORKERS or os.cpu_count(),
+            help='Parser processes. Defaults to the number of CPUs.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Run as a worker, polling for new resumes every N seconds. 0 drains the queue and exits.',
+        )
+        parser.add_argument(
+            '--backfill',
+            action='store_true',
+            help='Also index applications submitted before resume search existed (one download each).',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        workers = options['workers']
+        interval = options['interval']
+
+        statuses = ('pending', 'backlog') if options['backfill'] else ('pending',)
+
+        if batch_size < 1 or workers < 1:
+            raise CommandError('--batch-size and --workers must be at least 1.')
+
+        with ParserPool(workers) as pool:
+            while True:
+                self.drain(pool, batch_size, statuses)
+                if not interval:
+                    break
+                time.sleep(interval)
+
+    def drain(self, pool, batch_size, statuses):
+        started = time.monotonic()
+        total = 0
+        while True:
+            processed = extract_pending(pool, batch_size=batch_size, statuses=statuses)
+            total += processed
+            if processed < batch_size:
+                break
+
+        if total:
+            elapsed = time.monotonic() - started
+            self.stdout.write(self.style.SUCCESS(
+                f"Processed {total} resume(s) in {elapsed:.2f}s."
+            ))
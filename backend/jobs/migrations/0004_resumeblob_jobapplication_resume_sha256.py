@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:22
+
+import jobs.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_remove_jobapplication_linkedin_url_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('file', models.FileField(max_length=255, upload_to=jobs.models.resume_blob_path, verbose_name='File')),
+                ('size', models.PositiveIntegerField(verbose_name='Size (bytes)')),
+                ('content_type', models.CharField(blank=True, max_length=100, verbose_name='Content Type')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Resume Blob',
+                'verbose_name_plural': 'Resume Blobs',
+                'db_table': 'jobs_resume_blob',
+            },
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_sha256',
+            field=models.CharField(blank=True, db_index=True, max_length=64, verbose_name='Resume SHA-256'),
+        ),
+    ]
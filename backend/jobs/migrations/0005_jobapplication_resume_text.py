@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:24
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+GIN_INDEX = 'jobs_application_resume_search_gin'
+
+
+def create_search_index(apps, schema_editor):
+    # GIN indexes are PostgreSQL only; SQLite falls back to LIKE search
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {GIN_INDEX} ON jobs_application USING gin (resume_search)'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {GIN_INDEX}')
+
+
+def mark_existing_as_backlog(apps, schema_editor):
+    # Existing applications are indexed on demand with
+    # `extract_resume_text --backfill`, not by the worker's first run
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+    JobApplication.objects.using(schema_editor.connection.alias).update(resume_text_status='backlog')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_resumeblob_jobapplication_resume_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_search',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='Resume Text'),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_text_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('backlog', 'Not Indexed (submitted before resume search)'), ('done', 'Extracted'), ('unsupported', 'Unsupported Format'), ('failed', 'Failed')], db_index=True, default='pending', max_length=12, verbose_name='Resume Text Status'),
+        ),
+        migrations.RunPython(mark_existing_as_backlog, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
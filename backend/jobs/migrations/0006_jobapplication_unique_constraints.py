@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:42
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_duplicates(apps, schema_editor):
+    """Refuse to migrate over duplicate applications rather than delete any."""
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+    by_applicant = (
+        JobApplication.objects.filter(applicant__isnull=False)
+        .values('job_id', 'applicant_id').annotate(n=Count('id')).filter(n__gt=1)
+    )
+    by_email = (
+        JobApplication.objects.filter(applicant__isnull=True)
+        .values('job_id', email_lower=Lower('email')).annotate(n=Count('id')).filter(n__gt=1)
+    )
+    duplicates = list(by_applicant[:20]) + list(by_email[:20])
+    if duplicates:
+        raise RuntimeError(
+            'Duplicate job applications must be removed before adding the unique '
+            f'constraints: {duplicates}. Run "python manage.py dedupe_applications" '
+            'to list them and "python manage.py dedupe_applications --apply" to '
+            'keep one application per group, then migrate again.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_jobapplication_resume_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='jobapplication',
+            constraint=models.UniqueConstraint(condition=models.Q(('applicant__isnull', False)), fields=('job', 'applicant'), name='jobs_application_unique_applicant'),
+        ),
+        migrations.AddConstraint(
+            model_name='jobapplication',
+            constraint=models.UniqueConstraint(models.F('job'), django.db.models.functions.text.Lower('email'), condition=models.Q(('applicant__isnull', True)), name='jobs_application_unique_email'),
+        ),
+    ]
@@ -5,8 +5,12 @@ This module defines the models for job vacancies, applications,
 and custom requirements per job.
 """
 
+import os
+
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -191,6 +195,35 @@ class JobRequirement(models.Model):
         return []
 
 
+def resume_blob_path(instance, filename):
+    """Content-addressed storage path: resumes/sha256/<ab>/<digest><ext>."""
+    ext = os.path.splitext(filename)[1].lower()
+    return f"resumes/sha256/{instance.sha256[:2]}/{instance.sha256}{ext}"
+
+
+class ResumeBlob(models.Model):
+    """
+    A resume file stored once per distinct content.
+    
+    Applications and user profiles that upload identical bytes share one
+    blob, referenced by its SHA-256 digest.
+    """
+    
+    sha256 = models.CharField('SHA-256', max_length=64, unique=True)
+    file = models.FileField('File', upload_to=resume_blob_path, max_length=255)
+    size = models.PositiveIntegerField('Size (bytes)')
+    content_type = models.CharField('Content Type', max_length=100, blank=True)
+    created_at = models.DateTimeField('Created At', auto_now_add=True)
+    
+    class Meta:
+        db_table = 'jobs_resume_blob'
+        verbose_name = 'Resume Blob'
+        verbose_name_plural = 'Resume Blobs'
+    
+    def __str__(self):
+        return self.sha256
+
+
 class JobApplication(models.Model):
     """
     Job application model for storing applicant submissions.
@@ -204,6 +237,14 @@ class JobApplication(models.Model):
         ('hired', 'Hired'),
     ]
     
+    RESUME_TEXT_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('backlog', 'Not Indexed (submitted before resume search)'),
+        ('done', 'Extracted'),
+        ('unsupported', 'Unsupported Format'),
+        ('failed', 'Failed'),
+    ]
+    
     # Job reference
     job = models.ForeignKey(
         Job,
@@ -226,6 +267,24 @@ class JobApplication(models.Model):
         max_length=255,
         blank=True
     )
+    resume_sha256 = models.CharField(
+        'Resume SHA-256',
+        max_length=64,
+        blank=True,
+        db_index=True
+    )
+    
+    # Resume text, filled in by `manage.py extract_resume_text`
+    resume_text = models.TextField('Resume Text', blank=True, editable=False)
+    resume_text_status = models.CharField(
+        'Resume Text Status',
+        max_length=12,
+        choices=RESUME_TEXT_STATUS_CHOICES,
+        default='pending',
+        db_index=True
+    )
+    # PostgreSQL tsvector of resume_text (GIN indexed); unused on SQLite
+    resume_search = SearchVectorField(null=True, editable=False)
     
     # Additional Information
     alternative_mobile = models.CharField(
@@ -291,13 +350,31 @@ class JobApplication(models.Model):
         verbose_name = 'Job Application'
         verbose_name_plural = 'Job Applications'
         ordering = ['-applied_at']
+        constraints = [
+            # One application per job: by account for logged-in applicants,
+            # by case-insensitive email for anonymous ones. The email rule
+            # only compares anonymous rows, so an anonymous application can
+            # reuse the email of a registered applicant for the same job.
+            models.UniqueConstraint(
+                fields=['job', 'applicant'],
+                condition=models.Q(applicant__isnull=False),
+                name='jobs_application_unique_applicant',
+            ),
+            models.UniqueConstraint(
+                'job',
+                Lower('email'),
+                condition=models.Q(applicant__isnull=True),
+                name='jobs_application_unique_email',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.full_name} - {self.job.title}"
     
     def save(self, *args, **kwargs):
         """Override save to store resume file name."""
-        if self.resume:
+        # Deduplicated resumes keep the uploaded name, not the content-addressed one
+        if self.resume and not (self.resume_sha256 and self.resume_file_name):
             self.resume_file_name = self.resume.name
         super().save(*args, **kwargs)
 
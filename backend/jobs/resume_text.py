@@ -0,0 +1,217 @@
+"""
+Resume Text Indexing for Jobs App
+
+This module extracts text from uploaded resumes in the background and
+searches it for recruiters.
+
+Extraction is run by ``manage.py extract_resume_text``, never on a request
+thread: new applications start as ``resume_text_status='pending'`` and the
+worker parses them in a process pool. In production the worker runs as
+the ``recruit-art-resume-indexer`` service in render.yaml, polling with
+``--interval``; without it, nothing is ever indexed. On PostgreSQL the text is also
+stored as a GIN-indexed ``tsvector`` and searches are ranked with
+``ts_rank``; other databases fall back to substring matching.
+
+Applications that existed before resume search are marked ``'backlog'``
+rather than ``'pending'``, so the worker does not download every old
+resume on its first run; ``extract_resume_text --backfill`` indexes them.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.db.models import Case, F, FloatField, Q, Value, When
+
+from jobs.extractors import extract_resume
+from jobs.models import JobApplication
+
+logger = logging.getLogger(__name__)
+
+MAX_SEARCH_TERMS = 10
+
+
+def uses_postgres_search(using='default'):
+    return connections[using].vendor == 'postgresql'
+
+
+def read_resume(name):
+    """Read a stored resume's bytes (an HTTP download on Cloudinary)."""
+    with default_storage.open(name, 'rb') as f:
+        return f.read()
+
+
+class ParserPool:
+    """
+    Process pool for resume parsers that can be replaced after a crash.
+
+    A parser that kills its worker process (a segfault or the OOM killer
+    in a native PDF library) breaks the whole ``ProcessPoolExecutor``:
+    every unfinished task fails with ``BrokenProcessPool`` and no further
+    work can be submitted. ``restart`` swaps in a fresh executor.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+
+    def submit(self, fn, *args):
+        return self.executor.submit(fn, *args)
+
+    def restart(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def parse(pool, data, name):
+    """Parse one resume in ``pool``; a crashed worker raises BrokenProcessPool."""
+    return pool.submit(extract_resume, data, name, settings.RESUME_TEXT_MAX_CHARS).result()
+
+
+def extract_pending(pool, batch_size=None, statuses=('pending',)):
+    """
+    Extract text for one batch of pending applications.
+
+    Files are downloaded here and parsed in ``pool``'s worker processes.
+    Applications sharing a resume (same SHA-256 or stored name) are parsed
+    once, and text already extracted for an identical resume is reused
+    without downloading it again.
+
+    If a parser crashes its worker, the resumes whose parsing was lost are
+    parsed again one at a time in a fresh pool, so only the resume that
+    crashes it is marked ``'failed'`` and the batch still completes.
+
+    Args:
+        pool (ParserPool): Pool used for parsing
+        batch_size (int): Maximum applications per batch
+        statuses (tuple): Statuses to process; add ``'backlog'`` to index
+            applications from before resume search
+
+    Returns:
+        int: Number of applications processed
+    """
+    batch_size = batch_size or settings.RESUME_TEXT_BATCH_SIZE
+    applications = list(
+        JobApplication.objects.filter(resume_text_status__in=statuses)
+        .only('id', 'resume', 'resume_sha256')
+        .order_by('pk')[:batch_size]
+    )
+    if not applications:
+        return 0
+
+    groups = {}
+    for application in applications:
+        groups.setdefault(application.resume_sha256 or application.resume.name, []).append(application)
+
+    shas = [key for key in groups if len(key) == 64 and key.isalnum()]
+    known = dict(
+        JobApplication.objects.filter(resume_sha256__in=shas, resume_text_status='done')
+        .values_list('resume_sha256', 'resume_text')
+    )
+
+    files = {}
+    futures = {}
+    results = {}
+    for key, members in groups.items():
+        name = members[0].resume.name
+        if key in known:
+            results[key] = ('done', known[key], None)
+            continue
+        if not name:
+            results[key] = ('unsupported', '', 'No resume file.')
+            continue
+        try:
+            data = read_resume(name)
+        except Exception as e:
+            results[key] = ('failed', '', f'Could not read {name}: {e}')
+            continue
+        files[key] = (data, name)
+        futures[key] = pool.submit(extract_resume, data, name, settings.RESUME_TEXT_MAX_CHARS)
+
+    lost = []
+    for key, future in futures.items():
+        try:
+            results[key] = future.result()
+        except BrokenProcessPool:
+            lost.append(key)
+        except Exception as e:
+            results[key] = ('failed', '', f'{type(e).__name__}: {e}')
+
+    if lost:
+        logger.warning(f"A resume parser crashed; parsing {len(lost)} resume(s) one at a time")
+        pool.restart()
+        for key in lost:
+            try:
+                results[key] = parse(pool, *files[key])
+            except BrokenProcessPool:
+                results[key] = ('failed', '', 'The parser process crashed.')
+                pool.restart()
+            except Exception as e:
+                results[key] = ('failed', '', f'{type(e).__name__}: {e}')
+
+    extracted_ids = []
+    for key, (status, text, error) in results.items():
+        if status == 'failed':
+            logger.warning(f"Resume text extraction failed for {key}: {error}")
+        for application in groups[key]:
+            application.resume_text = text
+            application.resume_text_status = status
+            if status == 'done':
+                extracted_ids.append(application.pk)
+
+    with transaction.atomic():
+        JobApplication.objects.bulk_update(applications, ['resume_text', 'resume_text_status'])
+        if extracted_ids and uses_postgres_search():
+            JobApplication.objects.filter(pk__in=extracted_ids).update(
+                resume_search=SearchVector('resume_text', config=settings.RESUME_SEARCH_CONFIG)
+            )
+
+    logger.info(f"Extracted resume text for {len(extracted_ids)}/{len(applications)} application(s)")
+    return len(applications)
+
+
+def search_applications(queryset, query):
+    """
+    Filter ``queryset`` to applications whose resume matches ``query``.
+
+    Results are annotated with ``rank`` and ordered by relevance.
+    """
+    if uses_postgres_search(queryset.db):
+        search_query = SearchQuery(
+            query,
+            config=settings.RESUME_SEARCH_CONFIG,
+            search_type='websearch',
+        )
+        return queryset.filter(resume_search=search_query).annotate(
+            rank=SearchRank(F('resume_search'), search_query)
+        ).order_by('-rank', '-applied_at')
+
+    # Fallback: fraction of query terms found in the text
+    terms = query.split()[:MAX_SEARCH_TERMS]
+    if not terms:
+        return queryset.none()
+    matches = Q()
+    rank = Value(0.0)
+    for term in terms:
+        matches |= Q(resume_text__icontains=term)
+        rank = rank + Case(
+            When(resume_text__icontains=term, then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+    return queryset.filter(matches).annotate(
+        rank=rank / len(terms)
+    ).order_by('-rank', '-applied_at')
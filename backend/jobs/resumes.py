@@ -0,0 +1,147 @@
+"""
+Content-Addressed Resume Store for Jobs App
+
+This module stores resume files once per distinct content. Uploads are
+hashed with SHA-256 while Django streams the request body (see the upload
+handlers below), and ``store_resume`` reuses an existing ``ResumeBlob``
+when the digest is already known, so repeat applicants cost no extra
+storage or Cloudinary upload.
+"""
+
+import hashlib
+import logging
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+from django.db import IntegrityError, transaction
+
+from jobs.models import JobApplication, ResumeBlob
+
+logger = logging.getLogger(__name__)
+
+
+class Sha256UploadMixin:
+    """
+    Hash file uploads chunk by chunk as they are received.
+
+    Only the handler that actually consumes the chunks hashes them, and the
+    hex digest is attached to the resulting file as ``sha256``.
+    """
+
+    def new_file(self, *args, **kwargs):
+        self._sha256 = hashlib.sha256()
+        return super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        remaining = super().receive_data_chunk(raw_data, start)
+        if remaining is None:
+            self._sha256.update(raw_data)
+        return remaining
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.sha256 = self._sha256.hexdigest()
+        return file
+
+
+class Sha256MemoryFileUploadHandler(Sha256UploadMixin, MemoryFileUploadHandler):
+    """In-memory upload handler that records the SHA-256 of each file."""
+
+
+class Sha256TemporaryFileUploadHandler(Sha256UploadMixin, TemporaryFileUploadHandler):
+    """Temporary-file upload handler that records the SHA-256 of each file."""
+
+
+def file_sha256(file):
+    """
+    Return the SHA-256 hex digest of ``file``.
+
+    Uses the digest computed during upload when available, otherwise
+    hashes the file in chunks and rewinds it.
+    """
+    digest = getattr(file, 'sha256', None)
+    if digest:
+        return digest
+
+    sha256 = hashlib.sha256()
+    for chunk in file.chunks():
+        sha256.update(chunk)
+    file.seek(0)
+    file.sha256 = sha256.hexdigest()
+    return file.sha256
+
+
+def store_resume(file):
+    """
+    Store an uploaded resume, reusing an identical existing blob.
+
+    Args:
+        file (UploadedFile): The uploaded resume
+
+    Returns:
+        tuple: (ResumeBlob holding the file's content, True if it was
+        stored by this call)
+    """
+    digest = file_sha256(file)
+
+    blob = ResumeBlob.objects.filter(sha256=digest).first()
+    if blob:
+        logger.info(f"Resume {digest[:12]} already stored, reusing {blob.file.name}")
+        return blob, False
+
+    blob = ResumeBlob(
+        sha256=digest,
+        size=file.size,
+        content_type=getattr(file, 'content_type', '') or '',
+    )
+    blob.file.save(file.name, file, save=False)
+    try:
+        with transaction.atomic():
+            blob.save()
+    except IntegrityError:
+        # A concurrent upload of the same content won the race
+        blob.file.delete(save=False)
+        return ResumeBlob.objects.get(sha256=digest), False
+    return blob, True
+
+
+def attach_resume(instance, file):
+    """
+    Point ``instance.resume`` at the deduplicated blob for ``file``.
+
+    Works for both JobApplication and CustomUser; the original file name
+    is kept in ``resume_file_name``.
+
+    Returns:
+        tuple: (ResumeBlob, True if it was stored for this instance)
+    """
+    blob, created = store_resume(file)
+    instance.resume = blob.file.name
+    instance.resume_sha256 = blob.sha256
+    instance.resume_file_name = file.name
+    return blob, created
+
+
+def discard_resume(blob):
+    """
+    Delete a blob stored for a record that was never saved.
+
+    Nothing is deleted if an application or profile uses the blob by now,
+    e.g. a concurrent upload of the same content.
+
+    Returns:
+        bool: True if the blob and its file were deleted
+    """
+    if (
+        JobApplication.objects.filter(resume_sha256=blob.sha256).exists()
+        or get_user_model().objects.filter(resume_sha256=blob.sha256).exists()
+    ):
+        return False
+    blob.delete()
+    blob.file.delete(save=False)
+    logger.info(f"Discarded unused resume {blob.sha256[:12]}")
+    return True
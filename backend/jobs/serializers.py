@@ -5,8 +5,18 @@ This module contains serializers for job vacancies, applications,
 and custom requirements.
 """
 
+import os
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from jobs.models import Job, JobRequirement, JobApplication, ApplicationResponse
+from jobs.uploads import (
+    RESUME_CONTENT_TYPES,
+    RESUME_MAX_SIZE,
+    ResumeUploadError,
+    resolve_resume_upload,
+)
+from jobs.resumes import attach_resume, discard_resume
 
 
 class JobRequirementSerializer(serializers.ModelSerializer):
@@ -82,7 +92,14 @@ class JobListSerializer(serializers.ModelSerializer):
 
 
 class ApplicationResponseSerializer(serializers.ModelSerializer):
-    """Serializer for ApplicationResponse model."""
+    """
+    Serializer for ApplicationResponse model.
+    
+    ``requirement`` is a plain id here; the application serializer checks
+    all of them against the job in one query instead of one per response.
+    """
+    
+    requirement = serializers.IntegerField(source='requirement_id')
     
     class Meta:
         model = ApplicationResponse
@@ -94,14 +111,15 @@ class JobApplicationCreateSerializer(serializers.ModelSerializer):
     
     responses = ApplicationResponseSerializer(many=True, required=False)
     resume = serializers.FileField(required=False, allow_null=True)
+    resume_upload = serializers.CharField(write_only=True, required=False)
     
     class Meta:
         model = JobApplication
         fields = [
             'job', 'full_name', 'email', 'mobile', 'alternative_mobile',
             'preferred_job_designation', 'preferred_job_location',
-            'resume', 'expected_salary', 'join_after', 'total_experience',
-            'notice_period', 'cover_letter', 'responses'
+            'resume', 'resume_upload', 'expected_salary', 'join_after',
+            'total_experience', 'notice_period', 'cover_letter', 'responses'
         ]
     
     def validate_resume(self, value):
@@ -110,51 +128,118 @@ class JobApplicationCreateSerializer(serializers.ModelSerializer):
             return value
 
         # Check file type
-        allowed_types = [
-            'application/pdf', 
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'image/jpeg',
-            'image/png',
-            'image/webp'
-        ]
-        if value.content_type not in allowed_types:
+        if value.content_type not in RESUME_CONTENT_TYPES:
             raise serializers.ValidationError('Resume must be a PDF, Word document, or Image.')
         
         # Check file size (max 5MB)
-        max_size = 5 * 1024 * 1024
-        if value.size > max_size:
+        if value.size > RESUME_MAX_SIZE:
             raise serializers.ValidationError('Resume file size must be less than 5MB.')
         
         return value
     
+    def validate_resume_upload(self, value):
+        """Verify a directly uploaded resume and return its storage key."""
+        try:
+            return resolve_resume_upload(value)
+        except ResumeUploadError as e:
+            raise serializers.ValidationError(str(e))
+    
+    def validate(self, attrs):
+        """
+        Check responses against the job's requirements.
+        
+        Every requirement must belong to the job and appear at most once,
+        and every required requirement must have a non-blank answer.
+        """
+        responses = attrs.get('responses', [])
+        requirements = {
+            requirement.pk: requirement
+            for requirement in attrs['job'].requirements.order_by()
+        }
+        
+        errors = []
+        answered = {}
+        for response in responses:
+            requirement_id = response['requirement_id']
+            if requirement_id not in requirements:
+                errors.append(f'Requirement {requirement_id} does not belong to this job.')
+            elif requirement_id in answered:
+                errors.append(f'Requirement {requirement_id} was answered more than once.')
+            answered[requirement_id] = response['response_value']
+        
+        for requirement_id, requirement in requirements.items():
+            if requirement.is_required and not answered.get(requirement_id, '').strip():
+                errors.append(f'"{requirement.question_text}" is required.')
+        
+        if errors:
+            raise serializers.ValidationError({'responses': errors})
+        return attrs
+    
     def create(self, validated_data):
         """Create job application with responses and optional profile resume fallback."""
         responses_data = validated_data.pop('responses', [])
-        resume = validated_data.get('resume')
+        resume_key = validated_data.pop('resume_upload', None)
+        if resume_key:
+            # Already in storage; assigning the name skips a second upload
+            validated_data['resume'] = resume_key
+        resume = validated_data.pop('resume', None)
         request = self.context.get('request')
 
         # Fallback to user profile resume if not provided and user is logged in
         if not resume and request and request.user.is_authenticated:
             if hasattr(request.user, 'resume') and request.user.resume:
+                # Share the profile's stored file instead of copying it
                 validated_data['resume'] = request.user.resume
+                validated_data['resume_sha256'] = request.user.resume_sha256
+                validated_data['resume_file_name'] = (
+                    request.user.resume_file_name or os.path.basename(request.user.resume.name)
+                )
             else:
                 raise serializers.ValidationError({'resume': 'Resume is required.'})
         elif not resume:
             # Mandatory for all, especially anonymous
             raise serializers.ValidationError({'resume': 'Resume is required.'})
 
-        application = JobApplication.objects.create(**validated_data)
+        application = JobApplication(**validated_data)
+        stored_blob = None
+        if isinstance(resume, str):
+            application.resume = resume
+        elif resume:
+            blob, created = attach_resume(application, resume)
+            if created:
+                stored_blob = blob
         
-        for response_data in responses_data:
-            ApplicationResponse.objects.create(
-                application=application,
-                **response_data
-            )
+        try:
+            with transaction.atomic():
+                application.save()
+                ApplicationResponse.objects.bulk_create([
+                    ApplicationResponse(application=application, **response_data)
+                    for response_data in responses_data
+                ])
+        except IntegrityError:
+            # A rejected duplicate must not leave the resume it stored behind
+            if stored_blob is not None:
+                discard_resume(stored_blob)
+            raise
         
         return application
 
 
+class ResumeUploadTargetSerializer(serializers.Serializer):
+    """Serializer for requesting a direct resume upload target."""
+    
+    filename = serializers.CharField(max_length=255)
+    content_type = serializers.ChoiceField(
+        choices=list(RESUME_CONTENT_TYPES),
+        error_messages={'invalid_choice': 'Resume must be a PDF, Word document, or Image.'}
+    )
+    size = serializers.IntegerField(
+        min_value=1,
+        max_value=RESUME_MAX_SIZE,
+        error_messages={'max_value': 'Resume file size must be less than 5MB.'}
+    )
+
+
 class ApplicationResponseDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for application responses."""
     
@@ -218,6 +303,36 @@ class JobApplicationSummarySerializer(serializers.ModelSerializer):
         ]
 
 
+class JobApplicationProfileSerializer(serializers.Serializer):
+    """
+    Slim read-only serializer for profile application rows.
+
+    Works on the dicts produced by ``.values()`` so the profile endpoint
+    never instantiates JobApplication or Job models.
+    """
+    
+    id = serializers.IntegerField()
+    job_title = serializers.CharField()
+    company_name = serializers.CharField()
+    status = serializers.CharField()
+    applied_at = serializers.DateTimeField()
+
+
+class JobApplicationSearchSerializer(serializers.ModelSerializer):
+    """Serializer for recruiter resume search results."""
+    
+    job_title = serializers.CharField(source='job.title')
+    rank = serializers.FloatField(read_only=True)
+    
+    class Meta:
+        model = JobApplication
+        fields = [
+            'id', 'job', 'job_title', 'full_name', 'email', 'mobile',
+            'preferred_job_designation', 'total_experience',
+            'resume', 'resume_file_name', 'status', 'applied_at', 'rank'
+        ]
+
+
 class ApplicationStatusUpdateSerializer(serializers.Serializer):
     """Serializer for updating application status."""
     
@@ -0,0 +1,140 @@
+"""
+Storage URL Resolver for Jobs App
+
+This module resolves public URLs for stored files (resumes in particular)
+once per unique file. Results are memoized per process, keyed by storage
+backend and file name. ``resolve_many`` resolves a whole admin page or
+export in one pass, so each distinct file costs one storage call at most.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from jobs.models import JobApplication
+
+logger = logging.getLogger(__name__)
+
+
+def storage_key(storage):
+    """Identify a storage backend (class and base URL) for memo keys."""
+    cls = type(storage)
+    return f"{cls.__module__}.{cls.__qualname__}:{getattr(storage, 'base_url', '')}"
+
+
+def cloudinary_fallback_url(url):
+    """
+    Turn a relative ``/media/...`` URL into a Cloudinary raw URL.
+
+    Used in production when the storage backend hands back a local path
+    (e.g. files saved before Cloudinary was configured).
+    """
+    if not url.startswith('/media/') or settings.DEBUG:
+        return url
+    cloud_name = getattr(settings, 'CLOUDINARY_STORAGE', {}).get('CLOUD_NAME')
+    if not cloud_name:
+        return url
+    path = url.replace('/media/', '', 1)
+    return f"https://res.cloudinary.com/{cloud_name}/raw/upload/{path}"
+
+
+class StorageURLResolver:
+    """
+    Bounded, thread-safe LRU memo of ``storage.url(name)`` results.
+
+    Args:
+        maxsize (int): Maximum number of URLs kept per process
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize or settings.STORAGE_URL_CACHE_SIZE
+        self._urls = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            url = self._urls.get(key)
+            if url is not None:
+                self._urls.move_to_end(key)
+            return url
+
+    def _set(self, key, url):
+        with self._lock:
+            self._urls[key] = url
+            self._urls.move_to_end(key)
+            while len(self._urls) > self.maxsize:
+                self._urls.popitem(last=False)
+
+    def url_for(self, storage, name):
+        """
+        Return the URL of ``name`` in ``storage``.
+
+        Raises whatever the storage backend raises on failure; failures
+        are not memoized.
+        """
+        key = (storage_key(storage), name)
+        url = self._get(key)
+        if url is None:
+            url = cloudinary_fallback_url(storage.url(name))
+            self._set(key, url)
+        return url
+
+    def url(self, file):
+        """Return the URL of a FieldFile, or None if it is empty."""
+        if not file:
+            return None
+        return self.url_for(file.storage, file.name)
+
+    def resolve_names(self, storage, names):
+        """
+        Resolve URLs for many file names in one storage at once.
+
+        Each distinct name is resolved once; names whose URL cannot be
+        built are logged and left out.
+
+        Returns:
+            dict: File name -> URL
+        """
+        urls = {}
+        for name in names:
+            if not name or name in urls:
+                continue
+            try:
+                urls[name] = self.url_for(storage, name)
+            except Exception as e:
+                logger.warning(f"Could not resolve URL for {name}: {e}")
+        return urls
+
+    def resolve_many(self, files):
+        """Resolve URLs for many FieldFiles at once (see ``resolve_names``)."""
+        urls = {}
+        by_storage = {}
+        for file in files:
+            if file:
+                by_storage.setdefault(file.storage, []).append(file.name)
+        for storage, names in by_storage.items():
+            urls.update(self.resolve_names(storage, names))
+        return urls
+
+    def clear(self):
+        with self._lock:
+            self._urls.clear()
+
+
+resolver = StorageURLResolver()
+
+
+def resolve_resume_urls(applications):
+    """
+    Resolve resume URLs for JobApplications in one pass.
+
+    Accepts model instances or a queryset; querysets only fetch the
+    distinct resume names.
+    """
+    if hasattr(applications, 'values_list'):
+        storage = JobApplication._meta.get_field('resume').storage
+        names = applications.order_by().values_list('resume', flat=True).distinct()
+        return resolver.resolve_names(storage, names)
+    return resolver.resolve_many(application.resume for application in applications)
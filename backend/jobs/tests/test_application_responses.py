@@ -0,0 +1,97 @@
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobs.models import ApplicationResponse, Job, JobApplication, JobRequirement
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ApplicationResponseTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.job = self.create_job()
+        self.requirements = [
+            JobRequirement.objects.create(job=self.job, question_text=f'Q{i}', field_name=f'f{i}', is_required=i == 0)
+            for i in range(3)
+        ]
+        self.other = JobRequirement.objects.create(job=self.create_job(), question_text='Other', field_name='o')
+
+    def create_job(self):
+        return Job.objects.create(
+            title='Editor', company_name='Studio', location='Chennai', description='d',
+            status='active', apply_deadline=timezone.now() + timedelta(days=3),
+        )
+
+    def apply(self, responses, email='asha@example.com', job=None):
+        data = {
+            'job': (job or self.job).id, 'full_name': 'Asha', 'email': email, 'mobile': '9999999999',
+            'preferred_job_designation': 'Editor', 'preferred_job_location': 'Chennai',
+            'expected_salary': '1', 'join_after': '1', 'total_experience': '1',
+            'resume': SimpleUploadedFile(f'{email}.pdf', b'%PDF-1.4 ' + email.encode(), content_type='application/pdf'),
+        }
+        for i, (requirement_id, value) in enumerate(responses):
+            data[f'responses[{i}]requirement'] = requirement_id
+            data[f'responses[{i}]response_value'] = value
+        return APIClient().post('/api/jobs/applications/', data, format='multipart')
+
+    def assert_rejected(self, response, message):
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'responses': [message]})
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_required_answer_is_enforced(self):
+        self.assert_rejected(self.apply([(self.requirements[1].id, 'x')]), '"Q0" is required.')
+
+        response = self.apply([(self.requirements[0].id, '  ')])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_requirement_of_another_job_is_rejected(self):
+        response = self.apply([(self.requirements[0].id, 'x'), (self.other.id, 'y')])
+
+        self.assert_rejected(response, f'Requirement {self.other.id} does not belong to this job.')
+
+    def test_duplicate_answers_are_rejected(self):
+        requirement = self.requirements[0]
+
+        response = self.apply([(requirement.id, 'x'), (requirement.id, 'y')])
+
+        self.assert_rejected(response, f'Requirement {requirement.id} was answered more than once.')
+
+    def test_valid_answers_are_saved(self):
+        response = self.apply([(self.requirements[0].id, 'x'), (self.requirements[2].id, 'z')])
+
+        self.assertEqual(response.status_code, 201, response.content)
+        saved = response.json()['application']['responses']
+        self.assertEqual([(r['question_text'], r['response_value']) for r in saved], [('Q0', 'x'), ('Q2', 'z')])
+        self.assertEqual(ApplicationResponse.objects.count(), 2)
+
+    def test_query_count_does_not_grow_with_answers(self):
+        job = self.create_job()
+        requirements = JobRequirement.objects.bulk_create([
+            JobRequirement(job=job, question_text=f'Q{i}', field_name=f'f{i}') for i in range(20)
+        ])
+
+        with CaptureQueriesContext(connection) as few:
+            response = self.apply([(r.id, 'x') for r in requirements[:2]], email='few@example.com', job=job)
+        self.assertEqual(response.status_code, 201, response.content)
+        with CaptureQueriesContext(connection) as many:
+            response = self.apply([(r.id, 'x') for r in requirements], email='many@example.com', job=job)
+        self.assertEqual(response.status_code, 201, response.content)
+
+        self.assertEqual(len(many), len(few))
@@ -0,0 +1,110 @@
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from jobs.management.commands.benchmark_applications import (
+    DEFAULT_BASELINE,
+    Command,
+    percentile,
+    summarize,
+)
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def sample(ms, queries, status=201):
+    return {'scenario': 'anonymous', 'ms': ms, 'queries': queries, 'status': status}
+
+
+class SummaryTests(SimpleTestCase):
+    def test_percentile_uses_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile([7], 0.99), 7)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_summarize_counts_errors_and_queries(self):
+        summary = summarize([sample(10, 11), sample(20, 13), sample(30, 11, status=400)], elapsed=1.5)
+
+        self.assertEqual(summary['requests'], 3)
+        self.assertEqual(summary['errors'], 1)
+        self.assertEqual(summary['queries'], {'min': 11, 'max': 13, 'mean': 11.67})
+        self.assertEqual(summary['latency_ms']['p50'], 20)
+        self.assertEqual(summary['throughput_rps'], 2.0)
+
+
+class CompareTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.path = os.path.join(self.directory, 'baseline.json')
+        self.config = {'jobs': 1, 'requirements': 2, 'requests': 3, 'authenticated_ratio': 0}
+        self.command = Command(stdout=StringIO(), stderr=StringIO())
+        self.command.write_json(self.path, self.report([sample(10, 11)]))
+
+    def report(self, samples, **config):
+        return {'config': {**self.config, **config}, 'results': {'all': summarize(samples)}}
+
+    def test_within_baseline_passes(self):
+        self.command.compare(self.report([sample(10.5, 11)]), self.path, tolerance=0.25)
+
+        self.assertIn('No regressions', self.command.stdout.getvalue())
+
+    def test_extra_queries_fail(self):
+        with self.assertRaisesMessage(CommandError, 'up to 12 queries per submission (baseline 11)'):
+            self.command.compare(self.report([sample(10, 12)]), self.path, tolerance=0.25)
+
+    def test_slower_p95_fails(self):
+        with self.assertRaisesMessage(CommandError, 'p95 20ms exceeds 12.50ms'):
+            self.command.compare(self.report([sample(20, 11)]), self.path, tolerance=0.25)
+
+    def test_mismatched_config_is_refused(self):
+        with self.assertRaisesMessage(CommandError, 'differs from the baseline in requests'):
+            self.command.compare(self.report([sample(10, 11)], requests=4), self.path, tolerance=0.25)
+
+    def test_invalid_options_are_refused(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_applications', requests=0)
+        with self.assertRaises(CommandError):
+            call_command('benchmark_applications', authenticated_ratio=2)
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    STORAGES={
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+)
+class BenchmarkRunTests(TestCase):
+    """A short run must succeed within the committed baseline's query counts."""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def test_submissions_stay_within_baseline_queries(self):
+        cache.clear()
+        command = Command(stdout=StringIO(), stderr=StringIO())
+        config = {
+            'jobs': 2, 'requirements': 5, 'requests': 8, 'warmup': 2,
+            'rate': 0, 'authenticated_ratio': 0.5,
+        }
+
+        results = command.run(config)
+
+        with open(DEFAULT_BASELINE) as f:
+            baseline = json.load(f)['results']
+        self.assertEqual(results['all']['errors'], 0, command.stderr.getvalue())
+        self.assertEqual(set(results), {'all', 'anonymous', 'authenticated'})
+        for scenario, summary in results.items():
+            self.assertLessEqual(summary['queries']['max'], baseline[scenario]['queries']['max'], scenario)
@@ -0,0 +1,126 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from jobs.models import Job, JobApplication
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+def create_job():
+    return Job.objects.create(
+        title='Editor', company_name='Studio', location='Chennai', description='d',
+        status='active', apply_deadline=timezone.now() + timedelta(days=3),
+    )
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class DuplicateApplicationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.job = create_job()
+
+    def apply(self, email, client=None):
+        data = {
+            'job': self.job.id, 'full_name': 'Asha', 'email': email, 'mobile': '9999999999',
+            'preferred_job_designation': 'Editor', 'preferred_job_location': 'Chennai',
+            'expected_salary': '1', 'join_after': '1', 'total_experience': '1',
+            'resume': SimpleUploadedFile('cv.pdf', b'%PDF-1.4 ' + email.encode(), content_type='application/pdf'),
+        }
+        return (client or APIClient()).post('/api/jobs/applications/', data, format='multipart')
+
+    def test_anonymous_duplicates_match_email_case_insensitively(self):
+        self.assertEqual(self.apply('Asha@Example.com').status_code, 201)
+
+        response = self.apply('asha@example.COM')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'You have already applied for this job.'})
+        self.assertEqual(JobApplication.objects.count(), 1)
+
+    def test_registered_applicant_applies_once(self):
+        user = CustomUser.objects.create_user(email='user@example.com', mobile='8888888888', password='x')
+        client = APIClient()
+        client.force_authenticate(user)
+        self.assertEqual(self.apply('user@example.com', client).status_code, 201)
+
+        self.assertEqual(self.apply('other@example.com', client).status_code, 400)
+        # Anonymous applications are only compared with each other
+        self.assertEqual(self.apply('user@example.com').status_code, 201)
+        self.assertEqual(JobApplication.objects.count(), 2)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class DedupeApplicationsCommandTests(TransactionTestCase):
+    """Rows that predate the unique constraints, which are dropped here."""
+
+    def setUp(self):
+        self.job = create_job()
+        with connection.schema_editor() as editor:
+            for constraint in JobApplication._meta.constraints:
+                editor.remove_constraint(JobApplication, constraint)
+
+    def tearDown(self):
+        JobApplication.objects.all().delete()
+        with connection.schema_editor() as editor:
+            for constraint in JobApplication._meta.constraints:
+                editor.add_constraint(JobApplication, constraint)
+
+    def create_application(self, email, status='pending', applicant=None):
+        application = JobApplication(
+            job=self.job, applicant=applicant, full_name='Asha', email=email, mobile='9999999999',
+            status=status,
+        )
+        application.resume.save(f'{email}.pdf', ContentFile(b'%PDF-1.4'), save=False)
+        application.save()
+        return application
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('dedupe_applications', *args, stdout=out)
+        return out.getvalue()
+
+    def test_dry_run_changes_nothing(self):
+        self.create_application('asha@example.com')
+        self.create_application('ASHA@example.com')
+
+        output = self.run_command()
+
+        self.assertIn('1 duplicate application(s) would be removed', output)
+        self.assertEqual(JobApplication.objects.count(), 2)
+
+    def test_apply_keeps_the_reviewed_or_earliest_application(self):
+        user = CustomUser.objects.create_user(email='user@example.com', mobile='8888888888', password='x')
+        first = self.create_application('asha@example.com')
+        later = self.create_application('Asha@example.com')
+        pending = self.create_application('user@example.com', applicant=user)
+        reviewed = self.create_application('user@example.com', status='shortlisted', applicant=user)
+        unrelated = self.create_application('other@example.com')
+
+        output = self.run_command('--apply')
+
+        self.assertIn('Removed 2 duplicate application(s).', output)
+        self.assertEqual(
+            set(JobApplication.objects.values_list('id', flat=True)),
+            {first.id, reviewed.id, unrelated.id},
+        )
+        storage = later.resume.storage
+        self.assertFalse(storage.exists(later.resume.name))
+        self.assertFalse(storage.exists(pending.resume.name))
+        self.assertTrue(storage.exists(first.resume.name))
+        self.assertIn('No duplicate applications found.', self.run_command())
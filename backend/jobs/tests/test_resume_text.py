@@ -0,0 +1,181 @@
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from jobs.extractors import extract_resume
+from jobs.models import Job, JobApplication
+from jobs.resume_text import ParserPool, extract_pending
+
+MEDIA_ROOT = tempfile.mkdtemp()
+DOCX = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+
+def make_pdf(text):
+    """A one-page PDF showing ``text``."""
+    content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def make_docx(text):
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w') as docx:
+        docx.writestr(
+            'word/document.xml',
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:body></w:document>',
+        )
+    return out.getvalue()
+
+
+class StopWorker(Exception):
+    pass
+
+
+def crashing_extract(data, name, max_chars=None):
+    """Kill the worker process on resumes containing CRASH, like a segfaulting parser."""
+    if b'CRASH' in data:
+        os._exit(1)
+    return extract_resume(data, name, max_chars)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ResumeTextTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.job = Job.objects.create(
+            title='Developer', company_name='Co', location='Remote', description='d',
+            status='active', apply_deadline=timezone.now() + timedelta(days=3),
+        )
+        self.applicants = 0
+
+    def apply(self, name, data, content_type='application/pdf'):
+        self.applicants += 1
+        response = self.client.post('/api/jobs/applications/', {
+            'job': self.job.id, 'full_name': 'Applicant', 'email': f'applicant{self.applicants}@example.com',
+            'mobile': '9876543210', 'resume': SimpleUploadedFile(name, data, content_type=content_type),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 201, response.content)
+
+    def statuses(self):
+        return list(JobApplication.objects.order_by('pk').values_list('resume_text_status', flat=True))
+
+    def test_extract_and_search(self):
+        self.apply('a.pdf', make_pdf('Senior Python Django developer'))
+        self.apply('b.docx', make_docx('Python nurse ICU'), DOCX)
+        self.apply('c.png', b'\x89PNG', 'image/png')
+        self.apply('d.pdf', make_pdf('Senior Python Django developer'))
+        self.assertEqual(self.statuses(), ['pending'] * 4)
+
+        call_command('extract_resume_text', workers=2, stdout=StringIO())
+
+        self.assertEqual(self.statuses(), ['done', 'done', 'unsupported', 'done'])
+        self.assertIn('Django', JobApplication.objects.order_by('pk').first().resume_text)
+
+        admin = CustomUser.objects.create_superuser(
+            email='admin@example.com', mobile='9000000000', password='pw12345678', full_name='Admin'
+        )
+        self.client.force_authenticate(admin)
+        results = self.client.get('/api/jobs/applications/search/?q=python django').json()['results']
+        django_resumes = set(
+            JobApplication.objects.filter(resume_text__contains='Django').values_list('id', flat=True)
+        )
+        self.assertEqual({result['id'] for result in results[:2]}, django_resumes)
+        # Postgres full-text search needs every term; the fallback also
+        # returns partial matches, ranked lower
+        self.assertEqual(len(results), 2 if connection.vendor == 'postgresql' else 3)
+        self.assertEqual(self.client.get('/api/jobs/applications/search/').status_code, 400)
+
+        self.client.force_authenticate(None)
+        self.assertIn(self.client.get('/api/jobs/applications/search/?q=python').status_code, (401, 403))
+
+    def test_crashing_parser_fails_only_its_resume(self):
+        self.apply('a.pdf', make_pdf('Python developer'))
+        self.apply('crash.pdf', make_pdf('CRASH'))
+        self.apply('b.docx', make_docx('Django developer'), DOCX)
+
+        with mock.patch('jobs.resume_text.extract_resume', crashing_extract), ParserPool(2) as pool:
+            self.assertEqual(extract_pending(pool), 3)
+            # The restarted pool still works
+            self.apply('c.docx', make_docx('Next'), DOCX)
+            self.assertEqual(extract_pending(pool), 1)
+
+        self.assertEqual(self.statuses(), ['done', 'failed', 'done', 'done'])
+
+    def test_backlog_is_only_indexed_on_backfill(self):
+        self.apply('a.pdf', make_pdf('Python developer'))
+        JobApplication.objects.update(resume_text_status='backlog')
+
+        call_command('extract_resume_text', workers=1, stdout=StringIO())
+        self.assertEqual(self.statuses(), ['backlog'])
+
+        call_command('extract_resume_text', '--backfill', workers=1, stdout=StringIO())
+        self.assertEqual(self.statuses(), ['done'])
+
+    def test_worker_indexes_direct_uploads(self):
+        body = make_pdf('Cinematographer with drone experience')
+        target = self.client.post(
+            '/api/jobs/applications/resume-upload/',
+            {'filename': 'cv.pdf', 'content_type': 'application/pdf', 'size': len(body)},
+            format='json',
+        ).json()
+        self.assertEqual(
+            self.client.put(target['url'], body, content_type='application/octet-stream').status_code, 201
+        )
+        response = self.client.post('/api/jobs/applications/', {
+            'job': self.job.id, 'full_name': 'Applicant', 'email': 'applicant@example.com',
+            'mobile': '9876543210', 'resume_upload': target['token'],
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(self.statuses(), ['pending'])
+
+        # One poll of the worker that render.yaml runs
+        with mock.patch('jobs.management.commands.extract_resume_text.time.sleep', side_effect=StopWorker):
+            with self.assertRaises(StopWorker):
+                call_command('extract_resume_text', interval=30, workers=1, stdout=StringIO())
+
+        self.assertEqual(self.statuses(), ['done'])
+        admin = CustomUser.objects.create_superuser(
+            email='admin@example.com', mobile='9000000000', password='pw12345678', full_name='Admin'
+        )
+        self.client.force_authenticate(admin)
+        results = self.client.get('/api/jobs/applications/search/?q=drone').json()['results']
+        self.assertEqual([result['id'] for result in results], [JobApplication.objects.get().id])
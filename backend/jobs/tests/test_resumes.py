@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from jobs.models import Job, JobApplication, ResumeBlob
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def stored_files():
+    return sorted(name for _, _, names in os.walk(MEDIA_ROOT) for name in names)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ResumeDeduplicationTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        self.client = APIClient()
+        self.jobs = [
+            Job.objects.create(
+                title=f'Job {n}', company_name='Co', location='Remote', description='d',
+                status='active', apply_deadline=timezone.now() + timedelta(days=3),
+            )
+            for n in range(3)
+        ]
+
+    def apply(self, job, email, content=b'%PDF-1.4 same bytes', name='My CV.pdf'):
+        return self.client.post('/api/jobs/applications/', {
+            'job': job.id, 'full_name': 'Applicant', 'email': email, 'mobile': '9876543210',
+            'resume': SimpleUploadedFile(name, content, content_type='application/pdf'),
+        }, format='multipart')
+
+    def test_identical_resumes_are_stored_once(self):
+        for n, job in enumerate(self.jobs):
+            response = self.apply(job, f'applicant{n}@example.com')
+            self.assertEqual(response.status_code, 201, response.content)
+
+        self.assertEqual(ResumeBlob.objects.count(), 1)
+        self.assertEqual(len(set(JobApplication.objects.values_list('resume', flat=True))), 1)
+        self.assertEqual(
+            set(JobApplication.objects.values_list('resume_file_name', flat=True)), {'My CV.pdf'}
+        )
+        self.assertEqual(len(stored_files()), 1)
+
+    def test_rejected_duplicate_discards_its_new_resume(self):
+        self.assertEqual(self.apply(self.jobs[0], 'applicant@example.com').status_code, 201)
+
+        response = self.apply(self.jobs[0], 'Applicant@Example.com', content=b'%PDF-1.4 other bytes')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ResumeBlob.objects.count(), 1)
+        self.assertEqual(len(stored_files()), 1)
+
+    def test_rejected_duplicate_keeps_a_shared_resume(self):
+        self.assertEqual(self.apply(self.jobs[0], 'applicant@example.com').status_code, 201)
+
+        self.assertEqual(self.apply(self.jobs[0], 'applicant@example.com').status_code, 400)
+
+        self.assertEqual(ResumeBlob.objects.count(), 1)
+        self.assertEqual(len(stored_files()), 1)
+
+    def test_profile_resume_fallback_keeps_the_original_name(self):
+        user = CustomUser.objects.create_user(
+            email='member@example.com', mobile='9876543210', password='pw12345678', full_name='Member'
+        )
+        self.client.force_authenticate(user)
+        response = self.client.put('/api/accounts/profile/', {
+            'resume': SimpleUploadedFile('Member CV.pdf', b'%PDF-1.4 profile', content_type='application/pdf'),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 200, response.content)
+
+        response = self.client.post('/api/jobs/applications/', {
+            'job': self.jobs[0].id, 'full_name': 'Member', 'email': 'member@example.com', 'mobile': '9876543210',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 201, response.content)
+        user.refresh_from_db()
+        application = JobApplication.objects.get()
+        self.assertEqual(application.resume.name, user.resume.name)
+        self.assertEqual(application.resume_sha256, user.resume_sha256)
+        self.assertEqual(application.resume_file_name, 'Member CV.pdf')
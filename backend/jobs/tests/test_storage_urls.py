@@ -0,0 +1,65 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.admin import JobApplicationResource
+from jobs.models import Job, JobApplication
+from jobs.storage_urls import StorageURLResolver, resolve_resume_urls, resolver
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+def count_url_calls():
+    return mock.patch.object(
+        FileSystemStorage, 'url', autospec=True, side_effect=lambda storage, name: f'/media/{name}'
+    )
+
+
+@override_settings(STORAGES=STORAGES)
+class StorageURLResolverTests(TestCase):
+    def setUp(self):
+        resolver.clear()
+        job = Job.objects.create(
+            title='Developer', company_name='Co', location='Remote', description='d',
+            status='active', apply_deadline=timezone.now() + timedelta(days=3),
+        )
+        JobApplication.objects.bulk_create([
+            JobApplication(
+                job=job, full_name='Applicant', email=f'applicant{n}@example.com',
+                mobile='9876543210', resume=f'resumes/shared{n % 3}.pdf',
+            )
+            for n in range(30)
+        ])
+
+    def test_each_file_is_resolved_once(self):
+        with count_url_calls() as url:
+            urls = resolve_resume_urls(JobApplication.objects.all())
+            resolve_resume_urls(list(JobApplication.objects.all()))
+
+        self.assertEqual(url.call_count, 3)
+        self.assertEqual(urls['resumes/shared0.pdf'], '/media/resumes/shared0.pdf')
+
+    def test_export_resolves_each_file_once(self):
+        with count_url_calls() as url:
+            dataset = JobApplicationResource().export(JobApplication.objects.all())
+
+        self.assertEqual(url.call_count, 3)
+        self.assertTrue(dataset.dict[0]['Resume Link'].endswith('.pdf'))
+
+    def test_lru_is_bounded_and_skips_failures(self):
+        small = StorageURLResolver(maxsize=2)
+        storage = FileSystemStorage()
+        with count_url_calls():
+            for name in ('a.pdf', 'b.pdf', 'c.pdf'):
+                small.url_for(storage, name)
+        self.assertEqual(len(small._urls), 2)
+
+        with mock.patch.object(FileSystemStorage, 'url', side_effect=ValueError('no url')):
+            self.assertEqual(small.resolve_names(storage, ['d.pdf']), {})
+        self.assertEqual(len(small._urls), 2)
@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobs.models import Job, JobApplication
+from jobs.uploads import build_resume_key
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class DirectResumeUploadTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.job = Job.objects.create(
+            title='Designer', company_name='Co', location='Remote', description='d',
+            status='active', apply_deadline=timezone.now() + timedelta(days=3),
+        )
+
+    def request_target(self, filename='My CV.pdf', content_type='application/pdf', size=100):
+        return self.client.post(
+            '/api/jobs/applications/resume-upload/',
+            {'filename': filename, 'content_type': content_type, 'size': size},
+            format='json',
+        )
+
+    def upload(self, target, body):
+        return self.client.put(target['url'], body, content_type='application/octet-stream')
+
+    def apply(self, **data):
+        data = {'job': self.job.id, 'full_name': 'Applicant', 'email': 'a@example.com', 'mobile': '9876543210', **data}
+        return self.client.post('/api/jobs/applications/', data, format='json')
+
+    def test_upload_then_apply(self):
+        body = b'%PDF-1.4 resume' * 100
+        target = self.request_target(size=len(body)).json()
+
+        self.assertEqual(self.upload(target, body).status_code, 201)
+        response = self.apply(resume_upload=target['token'])
+
+        self.assertEqual(response.status_code, 201, response.content)
+        application = JobApplication.objects.get()
+        self.assertEqual(application.resume.name, target['key'])
+        self.assertEqual(application.resume.read(), body)
+
+    def test_extension_follows_the_declared_content_type(self):
+        self.assertTrue(build_resume_key('cv.html', 'application/pdf').endswith('_cv.pdf'))
+        self.assertTrue(build_resume_key('photo', 'image/png').endswith('_photo.png'))
+
+        target = self.request_target(filename='cv.html').json()
+        self.assertTrue(target['key'].endswith('_cv.pdf'))
+
+    def test_token_uploads_once(self):
+        body = b'%PDF-1.4'
+        target = self.request_target(size=len(body)).json()
+
+        self.assertEqual(self.upload(target, body).status_code, 201)
+        self.assertEqual(self.upload(target, b'%PDF-1.4 other').status_code, 400)
+        with default_storage.open(target['key']) as f:
+            self.assertEqual(f.read(), body)
+
+    def test_concurrent_upload_does_not_store_under_another_name(self):
+        body = b'%PDF-1.4'
+        target = self.request_target(size=len(body)).json()
+        self.assertEqual(self.upload(target, body).status_code, 201)
+
+        # The second request passed the existence check before the first saved
+        exists = FileSystemStorage.exists
+        checks = iter([False])
+        with mock.patch.object(
+            FileSystemStorage, 'exists', autospec=True,
+            side_effect=lambda storage, name: next(checks, None) or exists(storage, name),
+        ):
+            self.assertEqual(self.upload(target, body).status_code, 400)
+
+        folder = os.path.join(MEDIA_ROOT, os.path.dirname(target['key']))
+        stored = [name for name in os.listdir(folder) if name.startswith(os.path.basename(target['key'])[:32])]
+        self.assertEqual(stored, [os.path.basename(target['key'])])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.request_target(content_type='application/x-msdownload').status_code, 400)
+        self.assertEqual(self.request_target(size=10 ** 8).status_code, 400)
+        self.assertEqual(self.apply(resume_upload='garbage').status_code, 400)
+
+        target = self.request_target(size=5).json()
+        # Larger than declared
+        self.assertEqual(self.upload(target, b'0123456789').status_code, 400)
+        # Never uploaded
+        self.assertEqual(self.apply(resume_upload=target['token']).status_code, 400)
@@ -0,0 +1,213 @@
+"""
+Direct Resume Uploads for Jobs App
+
+This module implements the two-phase resume upload flow:
+
+1. The client asks for an upload target (``POST /api/jobs/applications/resume-upload/``)
+   and receives a signed token plus the URL and form fields to upload to.
+2. The client uploads the file straight to storage and then submits the
+   application with ``resume_upload=<token>``.
+
+The server never proxies the file body. On submission it only verifies the
+signed token and that the object exists in storage, then stores its key
+on the application.
+
+With Cloudinary configured, targets are signed Cloudinary upload requests.
+Without it (local development and tests) a stand-in endpoint accepts the
+file with a ``PUT`` and writes it to the default storage.
+"""
+
+import os
+import re
+import time
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from django.utils import timezone
+
+RESUME_UPLOAD_SALT = 'jobs.resume-upload'
+RESUME_UPLOAD_DIR = 'resumes/%Y/%m/'
+RESUME_MAX_SIZE = 5 * 1024 * 1024
+RESUME_CONTENT_TYPES = {
+    'application/pdf': '.pdf',
+    'application/msword': '.doc',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+}
+
+
+class ResumeUploadError(ValueError):
+    """Raised when an upload token is invalid or its object is missing."""
+
+
+def build_resume_key(filename, content_type):
+    """
+    Return a unique storage key for a new resume upload.
+
+    The original file name is kept (sanitized) so admins still see it, and
+    a random prefix makes keys unguessable and collision free. The
+    extension always comes from the declared ``content_type``, never from
+    the client's file name, so an upload cannot be stored (and later
+    served) as HTML or script.
+    """
+    base = os.path.splitext(os.path.basename(filename or ''))[0]
+    base = re.sub(r'[^A-Za-z0-9_-]+', '_', base).strip('_')[:80] or 'resume'
+    folder = timezone.now().strftime(RESUME_UPLOAD_DIR)
+    return f"{folder}{uuid.uuid4().hex}_{base}{RESUME_CONTENT_TYPES[content_type]}"
+
+
+def create_upload_token(key, content_type, size):
+    """Sign the key and declared metadata of an upload."""
+    return signing.dumps(
+        {'key': key, 'content_type': content_type, 'size': size},
+        salt=RESUME_UPLOAD_SALT,
+        compress=True,
+    )
+
+
+def read_upload_token(token):
+    """
+    Return the payload of a signed upload token.
+
+    Raises:
+        ResumeUploadError: If the token is tampered with or expired
+    """
+    try:
+        return signing.loads(
+            token,
+            salt=RESUME_UPLOAD_SALT,
+            max_age=settings.RESUME_UPLOAD_MAX_AGE,
+        )
+    except signing.SignatureExpired:
+        raise ResumeUploadError('Resume upload has expired, please upload the file again.')
+    except signing.BadSignature:
+        raise ResumeUploadError('Invalid resume upload token.')
+
+
+def uses_cloudinary(storage=None):
+    """Return True if resumes are stored on Cloudinary."""
+    storage = storage or default_storage
+    return type(storage).__module__.startswith('cloudinary_storage')
+
+
+def cloudinary_upload_target(key, request=None):
+    """Return a signed direct-to-Cloudinary upload for ``key``."""
+    import cloudinary
+    import cloudinary.utils
+
+    config = cloudinary.config()
+    public_id = default_storage._prepend_prefix(key)
+    params = {
+        'public_id': public_id,
+        'tags': default_storage.TAG,
+        'timestamp': int(time.time()),
+        # Replaying the signed upload must not replace the stored file
+        'overwrite': 'false',
+    }
+    params['signature'] = cloudinary.utils.api_sign_request(params, config.api_secret)
+    params['api_key'] = config.api_key
+
+    return {
+        'method': 'POST',
+        'url': f"https://api.cloudinary.com/v1_1/{config.cloud_name}/{default_storage.RESOURCE_TYPE}/upload",
+        'fields': params,
+        'file_field': 'file',
+    }
+
+
+def local_upload_target(key, token, request=None):
+    """Return the stand-in upload endpoint used without Cloudinary."""
+    url = reverse('jobs:resume-upload-local', kwargs={'token': token})
+    if request is not None:
+        url = request.build_absolute_uri(url)
+    return {
+        'method': 'PUT',
+        'url': url,
+        'fields': {},
+        'file_field': None,
+    }
+
+
+def create_upload_target(filename, content_type, size, request=None):
+    """
+    Issue an upload target for a resume.
+
+    Args:
+        filename (str): Original file name
+        content_type (str): One of RESUME_CONTENT_TYPES
+        size (int): Declared file size in bytes
+        request (HttpRequest, optional): Used to build absolute URLs
+
+    Returns:
+        dict: ``token``, ``key``, ``expires_in`` and the upload
+        ``method``, ``url``, ``fields`` and ``file_field``
+    """
+    key = build_resume_key(filename, content_type)
+    token = create_upload_token(key, content_type, size)
+
+    if uses_cloudinary():
+        target = cloudinary_upload_target(key, request)
+    else:
+        target = local_upload_target(key, token, request)
+
+    return {
+        'token': token,
+        'key': key,
+        'expires_in': settings.RESUME_UPLOAD_MAX_AGE,
+        **target,
+    }
+
+
+def save_local_upload(token, stream, content_length):
+    """
+    Write a stand-in upload to the default storage.
+
+    The body is streamed to storage in chunks, never read into memory.
+    Each token uploads once: the file is written to exactly the signed
+    key, and a second upload for the same key is rejected.
+
+    Returns:
+        str: The stored key
+    """
+    payload = read_upload_token(token)
+    key = payload['key']
+    if content_length is None or content_length > min(payload['size'], RESUME_MAX_SIZE):
+        raise ResumeUploadError('Uploaded file is larger than declared.')
+    if default_storage.exists(key):
+        raise ResumeUploadError('This upload has already been used.')
+
+    name = default_storage.save(key, File(stream, name=key))
+    if name != key:
+        # The storage creates files exclusively and renamed this one, so a
+        # concurrent upload with the same token got the key first
+        default_storage.delete(name)
+        raise ResumeUploadError('This upload has already been used.')
+    return name
+
+
+def resolve_resume_upload(token):
+    """
+    Verify an uploaded resume and return its storage key.
+
+    A single storage lookup (an HTTP ``HEAD`` on Cloudinary) checks both
+    that the object exists and that it is within the size limit.
+
+    Raises:
+        ResumeUploadError: If the token is invalid or the file is missing or too large
+    """
+    key = read_upload_token(token)['key']
+    try:
+        size = default_storage.size(key)
+    except OSError:
+        size = None
+    if size is None:
+        raise ResumeUploadError('Uploaded resume was not found, please upload it again.')
+    if size > RESUME_MAX_SIZE:
+        raise ResumeUploadError('Resume file size must be less than 5MB.')
+    return key
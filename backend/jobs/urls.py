@@ -11,6 +11,8 @@ from jobs.views import (
     JobRequirementViewSet,
     JobApplicationViewSet,
     JobApplicationDetailView,
+    ResumeUploadTargetView,
+    LocalResumeUploadView,
 )
 
 app_name = 'jobs'
@@ -20,6 +22,14 @@ router.register(r'jobs', JobViewSet, basename='job')
 router.register(r'applications', JobApplicationViewSet, basename='application')
 
 urlpatterns = [
+    # Direct resume uploads (before the router so they are not taken as application IDs)
+    path('applications/resume-upload/',
+         ResumeUploadTargetView.as_view(),
+         name='resume-upload'),
+    path('applications/resume-upload/<str:token>/',
+         LocalResumeUploadView.as_view(),
+         name='resume-upload-local'),
+    
     # Router URLs
     path('', include(router.urls)),
     
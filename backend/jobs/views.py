@@ -10,9 +10,12 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db import IntegrityError
+from django.db.models import Prefetch, Q, prefetch_related_objects
 from django.utils import timezone
 from django.conf import settings
+from accounts.throttles import IPRateThrottle, EmailRateThrottle
+from recruit_art.db_routing import ReplicaReadMixin
 from jobs.models import Job, JobRequirement, JobApplication, ApplicationResponse
 from jobs.serializers import (
     JobSerializer,
@@ -22,17 +25,26 @@ from jobs.serializers import (
     JobApplicationSerializer,
     JobApplicationCreateSerializer,
     ApplicationStatusUpdateSerializer,
+    ResumeUploadTargetSerializer,
+    JobApplicationSearchSerializer,
+)
+from jobs.resume_text import search_applications
+from jobs.uploads import (
+    ResumeUploadError,
+    create_upload_target,
+    save_local_upload,
+    uses_cloudinary,
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing job vacancies.
     
-    GET: List all active jobs (public)
+    GET: List all active jobs (public, served from the read replica)
     POST: Create new job (admin only)
     PUT/PATCH: Update job (admin only)
     DELETE: Delete job (admin only)
@@ -238,6 +250,7 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
     
     queryset = JobApplication.objects.all()
     permission_classes = [AllowAny]
+    throttle_scope = 'job_application'
     
     def get_serializer_class(self):
         """Return appropriate serializer."""
@@ -280,17 +293,34 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
     
     def get_permissions(self):
         """Set permissions based on action."""
-        if self.action in ['update', 'partial_update', 'destroy', 'status']:
+        if self.action in ['update', 'partial_update', 'destroy', 'status', 'search']:
             return [IsAdminUser()]
         return [AllowAny()]
     
+    def get_throttles(self):
+        """Throttle public submissions only."""
+        if self.action == 'create':
+            return [IPRateThrottle(), EmailRateThrottle()]
+        return super().get_throttles()
+    
+    def has_applied(self, job, applicant, email):
+        """True if an application matching the unique constraints exists."""
+        if applicant is not None:
+            return JobApplication.objects.filter(job=job, applicant=applicant).exists()
+        return JobApplication.objects.filter(
+            job=job, applicant__isnull=True, email__iexact=email
+        ).exists()
+    
     def create(self, request, *args, **kwargs):
         """Submit a new job application."""
         try:
             # Validate serializer
             serializer = self.get_serializer(data=request.data)
             if not serializer.is_valid():
-                logger.error(f"Job application validation failed: {serializer.errors}")
+                logger.warning(
+                    "Job application validation failed",
+                    extra={'errors': serializer.errors},
+                )
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
             # Get the job
@@ -303,32 +333,31 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Check for duplicate applications
-            if request.user.is_authenticated:
-                existing = JobApplication.objects.filter(
-                    job=job,
-                    applicant=request.user
-                ).exists()
-            else:
-                # For anonymous users, check by email
-                existing = JobApplication.objects.filter(
-                    job=job,
-                    email=serializer.validated_data.get('email')
-                ).exists()
-
-            if existing:
+            # Insert first; the unique constraints on (job, applicant) and
+            # (job, lower(email)) reject duplicates, even concurrent ones.
+            # Anonymous applications are only compared with each other, so
+            # one using a registered applicant's email is accepted.
+            applicant = request.user if request.user.is_authenticated else None
+            try:
+                application = serializer.save(applicant=applicant)
+            except IntegrityError:
+                if not self.has_applied(job, applicant, serializer.validated_data.get('email')):
+                    raise
                 return Response(
                     {'error': 'You have already applied for this job.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Save application
-            applicant = request.user if request.user.is_authenticated else None
-            application = serializer.save(applicant=applicant)
-
-            # Safe logging for both auth and anonymous users
-            user_info = f"User {applicant.id}" if applicant else "Anonymous"
-            logger.info(f"Job application submitted: {user_info} ({application.email}) applied for job '{job.title}' (ID: {job.id})")
+            # Sampled via LOG_SAMPLE_RATES; lazy %-args skip formatting for dropped records
+            logger.info(
+                "Job application %s submitted for job %s",
+                application.id, job.id,
+                extra={
+                    'application_id': application.id,
+                    'job_id': job.id,
+                    'applicant_id': applicant.id if applicant else None,
+                },
+            )
 
             # Create notification for application submission
             if applicant:
@@ -339,11 +368,16 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                         job_title=job.title,
                         application_id=application.id
                     )
-                    logger.info(f"Application notification created for user {applicant.id}")
+                    logger.debug("Application notification created for user %s", applicant.id)
                 except Exception as e:
                     logger.warning(f"Failed to create notification for user {applicant.id}: {e}")
 
-            # Return full application details
+            # Return full application details, loading responses with their
+            # requirements in one query rather than one per response
+            prefetch_related_objects(
+                [application],
+                Prefetch('responses', queryset=ApplicationResponse.objects.select_related('requirement')),
+            )
             output_serializer = JobApplicationSerializer(application)
 
             return Response(
@@ -457,6 +491,29 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                 'status': application.status
             }
         )
+    
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Search applications by resume content (admin only).
+        
+        Query params: ``q`` (required), ``job_id`` and ``status``.
+        Results are ranked by relevance.
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {'error': 'Query parameter "q" is required.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        queryset = search_applications(
+            self.get_queryset().select_related('job'),
+            query
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = JobApplicationSearchSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class JobApplicationDetailView(views.APIView):
@@ -493,3 +550,55 @@ class JobApplicationDetailView(views.APIView):
         serializer = JobApplicationSerializer(application)
         return Response(serializer.data)
 
+
+
+class ResumeUploadTargetView(views.APIView):
+    """
+    API view for starting a direct resume upload.
+    
+    POST: Get a signed upload target for a resume (public)
+    
+    The client uploads the file to the returned ``url`` and then submits
+    the application with ``resume_upload`` set to the returned ``token``.
+    """
+    permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle]
+    throttle_scope = 'resume_upload'
+    
+    def post(self, request):
+        """Issue a signed upload target."""
+        serializer = ResumeUploadTargetSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        target = create_upload_target(request=request, **serializer.validated_data)
+        return Response(target, status=status.HTTP_201_CREATED)
+
+
+class LocalResumeUploadView(views.APIView):
+    """
+    Stand-in for direct storage uploads when Cloudinary is not configured.
+    
+    PUT: Stream the raw file body into the default storage
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    
+    def put(self, request, token):
+        """Store an uploaded resume under the key signed into ``token``."""
+        if uses_cloudinary():
+            return Response(
+                {'error': 'Direct uploads go to Cloudinary.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0) or None
+        except ValueError:
+            content_length = None
+        
+        try:
+            key = save_local_upload(token, request.stream, content_length)
+        except ResumeUploadError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({'key': key}, status=status.HTTP_201_CREATED)
@@ -0,0 +1,98 @@
+"""
+Notification Stream for Notifications App
+
+This module serves new notifications as Server-Sent Events at
+``GET /api/notifications/notifications/stream/``, next to the other
+notification endpoints. It is only routed under ASGI, where an open
+stream costs a suspended coroutine rather than a worker.
+
+Each event carries one notification (``NotificationListSerializer``) with
+its ID as the SSE ``id``, so a reconnecting client resumes after
+``Last-Event-ID``. Streams close after ``NOTIFICATION_STREAM_MAX_SECONDS``
+and clients reconnect, which keeps long-lived connections bounded.
+
+The database connection is released after every poll. A stream would
+otherwise keep one from the worker's pool (``DB_POOL_MAX_SIZE``) until it
+closes, and a few open streams would starve every other request.
+"""
+
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+
+from notifications.models import Notification
+from notifications.serializers import NotificationListSerializer
+from recruit_art.async_api import AsyncAPIView
+
+BATCH_SIZE = 50
+
+
+def release_connection():
+    """Close this thread's connection, returning it to the pool if there is one."""
+    # Never mid-transaction (e.g. ATOMIC_REQUESTS or a test case)
+    if not connection.in_atomic_block:
+        connection.close()
+
+
+def format_event(notification):
+    data = json.dumps(NotificationListSerializer(notification).data, cls=DjangoJSONEncoder)
+    return f"id: {notification.id}\nevent: notification\ndata: {data}\n\n"
+
+
+class NotificationStreamView(AsyncAPIView):
+    """
+    Stream the user's new notifications as Server-Sent Events.
+
+    GET: ``text/event-stream`` of notifications created after
+    ``Last-Event-ID`` (or after the stream opens, without one)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        user_id = request.user.id
+        last_id = request.headers.get('Last-Event-ID', '')
+        if last_id.isdigit():
+            last_id = int(last_id)
+        else:
+            latest = await Notification.objects.filter(user_id=user_id).order_by('-id').afirst()
+            last_id = latest.id if latest else 0
+
+        response = StreamingHttpResponse(
+            self.events(user_id, last_id),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Stop reverse proxies from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def events(self, user_id, last_id):
+        deadline = time.monotonic() + settings.NOTIFICATION_STREAM_MAX_SECONDS
+        yield f"retry: {settings.NOTIFICATION_STREAM_POLL_SECONDS * 1000}\n\n"
+
+        while time.monotonic() < deadline:
+            notifications = [
+                notification
+                async for notification in Notification.objects.filter(
+                    user_id=user_id, id__gt=last_id
+                ).order_by('id')[:BATCH_SIZE]
+            ]
+            for notification in notifications:
+                last_id = notification.id
+                yield format_event(notification)
+
+            if len(notifications) < BATCH_SIZE:
+                # Async ORM calls run in this request's thread, so close
+                # its connection there before idling
+                await sync_to_async(release_connection)()
+                # Comment line keeps idle connections open through proxies
+                yield ": keep-alive\n\n"
+                await asyncio.sleep(settings.NOTIFICATION_STREAM_POLL_SECONDS)
@@ -0,0 +1,61 @@
+from django.test import TestCase, override_settings
+from django.urls import path
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import CustomUser
+from notifications.models import Notification
+from notifications.stream_views import NotificationStreamView
+
+STREAM_URL = '/api/notifications/notifications/stream/'
+
+# notifications.urls only routes the stream under ASGI_MODE
+urlpatterns = [
+    path(STREAM_URL.lstrip('/'), NotificationStreamView.as_view(), name='notification-stream'),
+]
+
+
+@override_settings(
+    ROOT_URLCONF=__name__,
+    NOTIFICATION_STREAM_MAX_SECONDS=0.3,
+    NOTIFICATION_STREAM_POLL_SECONDS=0.1,
+)
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='asha@example.com', mobile='9000000001', password='x')
+        refresh = RefreshToken.for_user(self.user)
+        refresh['token_version'] = self.user.token_version
+        self.authorization = f'Bearer {refresh.access_token}'
+
+    async def notify(self, title):
+        return await Notification.objects.acreate(
+            user=self.user, title=title, message='m', notification_type='system',
+        )
+
+    async def read_stream(self, **headers):
+        response = await self.async_client.get(STREAM_URL, headers={'Authorization': self.authorization, **headers})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        return b''.join([chunk async for chunk in response]).decode()
+
+    async def test_streams_notifications_after_last_event_id(self):
+        first = await self.notify('first')
+        second = await self.notify('second')
+
+        body = await self.read_stream(**{'Last-Event-ID': str(first.id)})
+
+        self.assertNotIn(f'id: {first.id}\n', body)
+        self.assertIn(f'id: {second.id}\nevent: notification\n', body)
+        self.assertIn('"title": "second"', body)
+
+    async def test_without_last_event_id_only_new_notifications_are_sent(self):
+        await self.notify('old')
+
+        body = await self.read_stream()
+
+        self.assertNotIn('"title": "old"', body)
+        self.assertIn('retry: ', body)
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(STREAM_URL)
+
+        self.assertEqual(response.status_code, 401)
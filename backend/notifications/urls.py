@@ -4,9 +4,11 @@ URL Configuration for Notifications App
 This module defines the URL patterns for notifications.
 """
 
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from notifications.views import NotificationViewSet
+from notifications.stream_views import NotificationStreamView
 
 app_name = 'notifications'
 
@@ -17,3 +19,7 @@ urlpatterns = [
     path('', include(router.urls)),
 ]
 
+# An open stream would hold a whole WSGI worker, so it is ASGI only
+if settings.ASGI_MODE:
+    urlpatterns.insert(0, path('notifications/stream/', NotificationStreamView.as_view(), name='notification-stream'))
+
@@ -0,0 +1,25 @@
+from django.apps import AppConfig
+from django.contrib.admin import apps as admin_apps
+from django.contrib.admin.checks import check_dependencies
+from django.core import checks
+
+
+class RecruitArtConfig(AppConfig):
+    """Project-level app: management commands and checks that span every app."""
+
+    name = 'recruit_art'
+
+
+class LazyAdminConfig(admin_apps.SimpleAdminConfig):
+    """
+    Admin without autodiscovery at startup; the admin URLconf runs it on
+    first use. Its checks run autodiscovery first (recruit_art/checks.py).
+    """
+
+    default = False
+
+    def ready(self):
+        from recruit_art.checks import check_admin_app
+
+        checks.register(check_dependencies, checks.Tags.admin)
+        checks.register(check_admin_app, checks.Tags.admin)
@@ -3,6 +3,13 @@ ASGI config for recruit_art project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve it with uvicorn workers: ``GUNICORN_WORKER_CLASS=uvicorn gunicorn``
+(see gunicorn.conf.py).
+
+Importing this module turns on ``ASGI_MODE``, which routes OTP send,
+Firebase login and the notification stream to async views. Sync views
+still work; Django runs each request's sync code in a thread of its own.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
@@ -12,5 +19,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'recruit_art.settings')
+os.environ.setdefault('ASGI_MODE', 'True')
 
 application = get_asgi_application()
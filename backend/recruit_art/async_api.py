@@ -0,0 +1,118 @@
+"""
+Async API Support for Recruit Art
+
+This module lets I/O-bound endpoints run as coroutines when the project is
+served through ``recruit_art.asgi`` (``ASGI_MODE``), so one worker can hold
+many in-flight calls to SendGrid or Google without a thread each.
+
+``AsyncAPIView`` keeps DRF's request parsing, authentication, permissions,
+throttles, exception handling and renderers; only the handler is awaited.
+The checks in ``initial()`` touch the database and cache, so they run in
+the request's sync thread, the same place the async ORM methods run.
+
+``http_client()`` returns an ``httpx.AsyncClient`` shared by every request
+on the running event loop, so connections to external APIs are pooled.
+
+Every middleware must be async-capable for async views to stay on the
+event loop; ``AsyncWhiteNoiseMiddleware`` stands in for WhiteNoise's
+sync-only middleware.
+"""
+
+import asyncio
+import inspect
+import weakref
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from rest_framework.views import APIView
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+_clients = weakref.WeakKeyDictionary()
+
+
+def http_client():
+    """Return the shared async HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        # Imported here so WSGI workers, which load this module for the
+        # middleware, never pay for httpx
+        import httpx
+
+        client = _clients[loop] = httpx.AsyncClient(
+            timeout=settings.ASYNC_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.ASYNC_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.ASYNC_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+    return client
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are ``async def``.
+
+    Every handler, including ``options``, must be a coroutine function so
+    Django marks the view as async.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def options(self, request, *args, **kwargs):
+        return super().options(request, *args, **kwargs)
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise middleware that also runs in async chains.
+
+    File lookups are in-memory unless autorefresh is on; serving opens the
+    file, so it runs in a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
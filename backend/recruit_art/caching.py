@@ -0,0 +1,21 @@
+"""
+Cache Helpers for Recruit Art
+
+Without ``REDIS_URL`` the default cache is a per-process memory cache:
+each gunicorn worker (and each management command) sees only its own
+entries, and they are lost when the worker restarts. Features whose
+cached state must be shared, such as throttle counters and buffered
+visitor counts, check ``cache_is_shared()`` first.
+"""
+
+from django.conf import settings
+
+PER_PROCESS_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def cache_is_shared(alias='default'):
+    """True if every process sees the same entries in cache ``alias``."""
+    return settings.CACHES.get(alias, {}).get('BACKEND') not in PER_PROCESS_CACHES
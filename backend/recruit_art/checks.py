@@ -0,0 +1,18 @@
+"""
+System Checks for Recruit Art
+
+The admin is installed as ``SimpleAdminConfig`` so process startup does
+not import every app's admin module (recruit_art/lazy_urls.py). Django's
+admin checks only inspect registered ModelAdmins, so on their own they
+would pass with an empty registry. ``check_admin_app`` loads the admin
+modules first, so ``manage.py check`` and the test run still validate
+every ModelAdmin.
+"""
+
+from django.contrib import admin
+from django.contrib.admin import checks
+
+
+def check_admin_app(app_configs, **kwargs):
+    admin.autodiscover()
+    return checks.check_admin_app(app_configs, **kwargs)
@@ -0,0 +1,161 @@
+"""
+Read-Replica Routing for Recruit Art
+
+This module sends the heavy public reads (job listings, news,
+testimonials, team members) to an optional ``replica`` database while
+every write, and every other read, stays on ``default``.
+
+- ``ReplicaRoutingMiddleware`` starts a routing state for each request.
+- ``ReplicaReadMixin`` marks a viewset's safe actions (``list`` and
+  ``retrieve`` by default) as replica reads once authentication and
+  permission checks, which run on ``default``, have passed.
+- ``ReplicaRouter`` (``DATABASE_ROUTERS``) sends marked reads to the
+  replica and all writes to ``default``. After the first write in a
+  request, the rest of that request reads from ``default``.
+
+Read-your-writes: when an authenticated user's request writes, that user
+is pinned to ``default`` for ``DATABASE_REPLICA_PIN_SECONDS`` so they
+see their own change even if the replica lags. Pins live in the cache,
+so set ``REDIS_URL`` for them to hold across gunicorn workers.
+
+Without ``DATABASE_REPLICA_URL`` there is no ``replica`` alias and every
+query uses ``default`` as before. The cached landing bundle is
+deliberately not routed: it is rebuilt as soon as a write on
+``default`` changes its version, and a lagging replica would cache
+stale content.
+"""
+
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+REPLICA = 'replica'
+
+current_state = ContextVar('db_routing_state', default=None)
+
+
+class RoutingState:
+    """
+    Routing decisions for one request.
+
+    A mutable object rather than separate context variables, so changes
+    made in a sync view's thread under ASGI are seen by the middleware.
+    """
+
+    __slots__ = ('use_replica', 'wrote')
+
+    def __init__(self):
+        self.use_replica = False
+        self.wrote = False
+
+
+def replica_configured():
+    return REPLICA in settings.DATABASES
+
+
+def pin_key(user):
+    return f'db-routing:pinned:{user.pk}'
+
+
+def is_pinned(user):
+    """True if the user wrote recently and must read from ``default``."""
+    return bool(user and user.is_authenticated and cache.get(pin_key(user)))
+
+
+def pin_to_primary(user):
+    cache.set(pin_key(user), 1, settings.DATABASE_REPLICA_PIN_SECONDS)
+
+
+class ReplicaRouter:
+    """Route marked reads to the replica; everything else to ``default``."""
+
+    def db_for_read(self, model, **hints):
+        state = current_state.get()
+        if state is not None and state.use_replica and not state.wrote and replica_configured():
+            return REPLICA
+        # None lets Django follow the instance hint, so related lookups
+        # stay on the database their instance came from
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = current_state.get()
+        if state is not None:
+            state.wrote = True
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica is a copy of default, so objects from either relate
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives schema changes through replication
+        return db != REPLICA
+
+
+class ReplicaRoutingMiddleware:
+    """Give each request a routing state; pin users whose request wrote."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        state = RoutingState()
+        token = current_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_state.reset(token)
+        if state.wrote and replica_configured():
+            self.pin(request)
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = current_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_state.reset(token)
+        if state.wrote and replica_configured():
+            await sync_to_async(self.pin)(request)
+        return response
+
+    def pin(self, request):
+        # DRF copies the token-authenticated user onto the Django request
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            pin_to_primary(user)
+
+
+class ReplicaReadMixin:
+    """
+    Serve a viewset's safe ``replica_actions`` from the read replica.
+
+    Has no effect without ``ReplicaRoutingMiddleware`` or a configured
+    replica, or for users pinned to ``default`` after a write.
+    """
+
+    replica_actions = ('list', 'retrieve')
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        state = current_state.get()
+        if (
+            state is not None
+            and replica_configured()
+            and request.method in SAFE_METHODS
+            and self.action in self.replica_actions
+            and not is_pinned(request.user)
+        ):
+            state.use_replica = True
@@ -0,0 +1,250 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What a worker does before it can answer its first request: set up Django
+# (settings, apps, models), build the WSGI/ASGI handler (middleware) and
+# import the URLconf, which Django otherwise does on the first request
+BOOTSTRAP = """
+import json, os, time
+started = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'recruit_art.settings')
+import django
+django.setup(set_prefix=False)
+setup = time.perf_counter()
+from recruit_art.{app} import application
+loaded = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+done = time.perf_counter()
+print(json.dumps({{
+    'setup_ms': (setup - started) * 1000,
+    'app_ms': (loaded - setup) * 1000,
+    'urls_ms': (done - loaded) * 1000,
+}}))
+"""
+
+# -X importtime only reports imports made through __import__, so modules
+# Django loads with importlib.import_module (apps, admin modules, middleware,
+# URLconfs) would be missing and their imports credited to whatever was
+# being imported at the time. Route absolute import_module calls through
+# __import__ while profiling so every module shows up under its importer.
+PROFILE_PRELUDE = """
+import importlib, sys
+_import_module = importlib.import_module
+def import_module(name, package=None):
+    if name.startswith('.'):
+        return _import_module(name, package)
+    __import__(name)
+    return sys.modules[name]
+importlib.import_module = import_module
+"""
+
+# About 1.2s measured after deferring the admin, social auth, Firebase and
+# httpx imports; the headroom absorbs slower CI machines
+DEFAULT_BUDGET_MS = 1500
+
+
+def parse_importtime(text):
+    """
+    Parse ``python -X importtime`` output into a list of modules.
+
+    Each entry has ``name``, ``self_us``, ``cumulative_us``, ``depth`` and
+    ``parent`` (the importing module's name, None at the top level).
+    Python reports a module after everything it imported, so children are
+    collected per depth until their parent's line appears.
+    """
+    modules = []
+    pending = {}
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            # The "self [us] | cumulative | imported package" header
+            continue
+        # One separator space, then two spaces per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        module = {
+            'name': name.strip(),
+            'self_us': self_us,
+            'cumulative_us': cumulative_us,
+            'depth': depth,
+            'parent': None,
+        }
+        for child in pending.pop(depth + 1, []):
+            child['parent'] = module['name']
+        pending.setdefault(depth, []).append(module)
+        modules.append(module)
+    return modules
+
+
+def project_packages():
+    """Top-level packages that live in this repository."""
+    return {
+        entry for entry in os.listdir(settings.BASE_DIR)
+        if os.path.isfile(os.path.join(settings.BASE_DIR, entry, '__init__.py'))
+    }
+
+
+def root(name):
+    return name.split('.', 1)[0]
+
+
+def attribute_imports(modules, packages):
+    """
+    Sum the cost of third-party imports by the project module that made them.
+
+    Returns ``[(importer, package, cumulative_us)]``, heaviest first, where
+    ``importer`` is the nearest project module above ``package`` (or
+    ``None`` when only framework code imported it).
+    """
+    by_name = {module['name']: module for module in modules}
+    totals = {}
+    for module in modules:
+        if root(module['name']) in packages:
+            continue
+        parent = by_name.get(module['parent'])
+        # Only the outermost module of each third-party subtree
+        if parent is not None and root(parent['name']) not in packages:
+            continue
+        importer = None
+        while parent is not None:
+            if root(parent['name']) in packages:
+                importer = parent['name']
+                break
+            parent = by_name.get(parent['parent'])
+        key = (importer, root(module['name']))
+        totals[key] = totals.get(key, 0) + module['cumulative_us']
+    return sorted(
+        ((importer, package, us) for (importer, package), us in totals.items()),
+        key=lambda item: -item[2],
+    )
+
+
+def self_time_by_package(modules):
+    totals = {}
+    for module in modules:
+        package = root(module['name'])
+        totals[package] = totals.get(package, 0) + module['self_us']
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures cold start (a fresh interpreter loading the WSGI/ASGI app and '
+        'URLconf), reports per-module import time from `python -X importtime` '
+        'and fails if the median cold start exceeds the budget.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Timed cold starts.')
+        parser.add_argument('--asgi', action='store_true', help='Load recruit_art.asgi instead of wsgi.')
+        parser.add_argument('--top', type=int, default=15, help='Rows per table.')
+        parser.add_argument(
+            '--budget-ms',
+            type=float,
+            default=float(os.getenv('STARTUP_BUDGET_MS', DEFAULT_BUDGET_MS)),
+            help='Allowed median cold start in ms (env STARTUP_BUDGET_MS).',
+        )
+        parser.add_argument('--output', help='Also write the results JSON to this path.')
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs must be at least 1.')
+        code = BOOTSTRAP.format(app='asgi' if options['asgi'] else 'wsgi')
+
+        # Profile first: it also warms the bytecode cache, which a deployed
+        # instance has on disk, so the timed runs measure imports, not compiles
+        profile = self.start(code, importtime=True)
+        modules = parse_importtime(profile['stderr'])
+        if not modules:
+            raise CommandError('No -X importtime output; did the interpreter start?')
+
+        runs = [self.start(code) for _ in range(options['runs'])]
+        totals = sorted(run['total_ms'] for run in runs)
+        results = {
+            'cold_start_ms': {
+                'median': round(statistics.median(totals), 1),
+                'min': round(totals[0], 1),
+                'max': round(totals[-1], 1),
+            },
+            'setup_ms': round(statistics.median(run['setup_ms'] for run in runs), 1),
+            'app_ms': round(statistics.median(run['app_ms'] for run in runs), 1),
+            'urls_ms': round(statistics.median(run['urls_ms'] for run in runs), 1),
+            'modules_imported': len(modules),
+            'imports': [
+                {'importer': importer, 'package': package, 'ms': round(us / 1000, 1)}
+                for importer, package, us in attribute_imports(modules, project_packages())
+            ],
+            'self_ms_by_package': {
+                package: round(us / 1000, 1) for package, us in self_time_by_package(modules)
+            },
+        }
+
+        self.print_report(results, modules, options['top'])
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(
+                    {'config': {'runs': options['runs'], 'asgi': options['asgi']}, 'results': results},
+                    f, indent=2, sort_keys=True,
+                )
+                f.write('\n')
+
+        median = results['cold_start_ms']['median']
+        if median > options['budget_ms']:
+            raise CommandError(
+                f"Cold start {median}ms exceeds the {options['budget_ms']:g}ms budget"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Cold start {median}ms is within the {options['budget_ms']:g}ms budget."
+        ))
+
+    def start(self, code, importtime=False):
+        """Start a fresh interpreter on ``code`` and time it until it exits."""
+        command = [sys.executable]
+        if importtime:
+            command += ['-X', 'importtime']
+            code = PROFILE_PRELUDE + code
+        started = time.perf_counter()
+        process = subprocess.run(
+            command + ['-c', code],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        total_ms = (time.perf_counter() - started) * 1000
+        if process.returncode != 0:
+            raise CommandError(f'Startup failed:\n{process.stderr[-2000:]}')
+        timings = json.loads(process.stdout.strip().splitlines()[-1])
+        return dict(timings, total_ms=total_ms, stderr=process.stderr)
+
+    def print_report(self, results, modules, top):
+        cold = results['cold_start_ms']
+        self.stdout.write(
+            f"Cold start: median {cold['median']}ms (min {cold['min']}ms, max {cold['max']}ms); "
+            f"django.setup() {results['setup_ms']}ms, handler {results['app_ms']}ms, "
+            f"URLconf {results['urls_ms']}ms, "
+            f"{results['modules_imported']} modules"
+        )
+
+        self.stdout.write('\nHeaviest third-party imports, by the project module that made them:')
+        for row in results['imports'][:top]:
+            importer = row['importer'] or '(framework)'
+            self.stdout.write(f"  {row['ms']:>8.1f}ms  {row['package']:<24} <- {importer}")
+
+        self.stdout.write('\nSlowest modules (cumulative):')
+        for module in sorted(modules, key=lambda module: -module['cumulative_us'])[:top]:
+            self.stdout.write(f"  {module['cumulative_us'] / 1000:>8.1f}ms  {module['name']}")
+
+        self.stdout.write('\nImport time by package (self):')
+        for package, ms in list(results['self_ms_by_package'].items())[:top]:
+            self.stdout.write(f"  {ms:>8.1f}ms  {package}")
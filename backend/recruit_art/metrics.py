@@ -0,0 +1,363 @@
+"""
+Request Metrics for Recruit Art
+
+This module records, for every request, the number of DB queries, time
+spent in the database, total time and response size, keyed by resolved
+URL name and method. Admins can read the totals in Prometheus text format
+at ``GET /api/_metrics`` and the latest slow requests, with their SQL, at
+``GET /api/_metrics/slow``.
+
+Counters and histograms are cumulative for the life of the process, as
+Prometheus expects; use ``rate()`` for windows. Each gunicorn worker keeps
+its own totals, so label scrapes by instance or scrape each worker.
+
+Query counting uses a permanent ``execute_wrapper`` on every connection
+(no DEBUG query log) that reports to the current request's recorder
+through a context variable, so it also sees async ORM calls, which run in
+another thread. The per-request cost is a few counter updates. Set
+``METRICS_ENABLED=False`` to remove the middleware entirely.
+
+Connection churn is exported too: ``db_connections_opened_total`` for
+databases without a pool, and psycopg's pool statistics (``db_pool_*``,
+including time spent waiting for a free connection) for pooled ones.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+logger = logging.getLogger(__name__)
+
+# psycopg pool stats exported as (stat, metric, help, type, scale)
+POOL_STATS = (
+    ('connections_num', 'db_pool_connections_opened_total', 'Connections opened by the pool.', 'counter', 1),
+    ('connections_ms', 'db_pool_connect_seconds_total', 'Time spent opening connections.', 'counter', 0.001),
+    ('requests_num', 'db_pool_requests_total', 'Connections handed out.', 'counter', 1),
+    ('requests_queued', 'db_pool_requests_queued_total', 'Requests that had to wait for a connection.', 'counter', 1),
+    ('requests_wait_ms', 'db_pool_wait_seconds_total', 'Time spent waiting for a connection.', 'counter', 0.001),
+    ('requests_errors', 'db_pool_timeouts_total', 'Requests that timed out waiting for a connection.', 'counter', 1),
+    ('pool_size', 'db_pool_size', 'Connections currently open.', 'gauge', 1),
+    ('pool_available', 'db_pool_available', 'Idle connections in the pool.', 'gauge', 1),
+    ('requests_waiting', 'db_pool_requests_waiting', 'Requests waiting for a connection now.', 'gauge', 1),
+)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds (Prometheus style)."""
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Yield ``(le, count)`` pairs, ending with ``+Inf``."""
+        running = 0
+        for bound, count in zip(self.bounds + ('+Inf',), self.counts):
+            running += count
+            yield bound, running
+
+
+class EndpointStats:
+    __slots__ = ('duration', 'queries', 'db_seconds', 'response_bytes', 'statuses')
+
+    def __init__(self):
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.db_seconds = 0.0
+        self.response_bytes = 0
+        self.statuses = {}
+
+
+class MetricsRegistry:
+    """Thread-safe per-endpoint totals plus a ring of slow request samples."""
+
+    def __init__(self, slow_samples):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._slow = deque(maxlen=slow_samples)
+        self._connections_opened = {}
+
+    def record(self, view, method, status, seconds, queries, db_seconds, size):
+        with self._lock:
+            stats = self._endpoints.get((view, method))
+            if stats is None:
+                stats = self._endpoints[(view, method)] = EndpointStats()
+            stats.duration.observe(seconds)
+            stats.queries.observe(queries)
+            stats.db_seconds += db_seconds
+            stats.response_bytes += size
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def connection_opened(self, alias):
+        with self._lock:
+            self._connections_opened[alias] = self._connections_opened.get(alias, 0) + 1
+
+    def add_slow(self, sample):
+        with self._lock:
+            self._slow.append(sample)
+
+    def slow_samples(self):
+        with self._lock:
+            return list(self._slow)
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._slow.clear()
+            self._connections_opened.clear()
+
+    def render(self):
+        """Return all metrics in Prometheus text exposition format."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = []
+
+            lines += [
+                '# HELP http_requests_total Requests by view, method and status.',
+                '# TYPE http_requests_total counter',
+            ]
+            for (view, method), stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(
+                        f'http_requests_total{{{labels(view, method)},status="{status}"}} {count}'
+                    )
+
+            for name, help_text, attr in (
+                ('http_request_duration_seconds', 'Total request time.', 'duration'),
+                ('http_request_db_queries', 'DB queries per request.', 'queries'),
+            ):
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+                for (view, method), stats in endpoints:
+                    histogram = getattr(stats, attr)
+                    for bound, count in histogram.cumulative():
+                        lines.append(f'{name}_bucket{{{labels(view, method)},le="{bound}"}} {count}')
+                    lines.append(f'{name}_sum{{{labels(view, method)}}} {histogram.sum:.6f}')
+                    lines.append(f'{name}_count{{{labels(view, method)}}} {histogram.count}')
+
+            for name, help_text, attr in (
+                ('http_request_db_duration_seconds_total', 'Time spent in DB queries.', 'db_seconds'),
+                ('http_response_size_bytes_total', 'Response body bytes sent.', 'response_bytes'),
+            ):
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+                for (view, method), stats in endpoints:
+                    lines.append(f'{name}{{{labels(view, method)}}} {getattr(stats, attr)}')
+
+            lines += [
+                '# HELP db_connections_opened_total New connections to unpooled databases.',
+                '# TYPE db_connections_opened_total counter',
+            ]
+            for alias, count in sorted(self._connections_opened.items()):
+                lines.append(f'db_connections_opened_total{{database="{alias}"}} {count}')
+
+        lines += pool_lines()
+        return '\n'.join(lines) + '\n'
+
+
+def pool_lines():
+    """Prometheus lines for every database using a psycopg connection pool."""
+    pools = [
+        (alias, connections[alias].pool)
+        for alias in connections
+        if connections.settings[alias].get('OPTIONS', {}).get('pool')
+    ]
+    lines = []
+    if not pools:
+        return lines
+    for stat, name, help_text, kind, scale in POOL_STATS:
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+        for alias, pool in pools:
+            value = pool.get_stats().get(stat, 0) * scale
+            lines.append(f'{name}{{database="{alias}"}} {value:g}')
+    return lines
+
+
+def labels(view, method):
+    view = view.replace('\\', '\\\\').replace('"', '\\"')
+    return f'view="{view}",method="{method}"'
+
+
+registry = MetricsRegistry(settings.METRICS_SLOW_SAMPLES)
+
+
+class QueryRecorder:
+    """Query count and DB time for one request."""
+
+    def __init__(self, keep_sql):
+        self.count = 0
+        self.seconds = 0.0
+        self.keep_sql = keep_sql
+        self.statements = []
+
+    def add(self, sql, elapsed):
+        self.count += 1
+        self.seconds += elapsed
+        if len(self.statements) < self.keep_sql:
+            self.statements.append((sql, elapsed))
+
+
+current_recorder = ContextVar('metrics_query_recorder', default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    """``execute_wrapper`` reporting to the current request's recorder, if any."""
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        recorder.add(sql, time.perf_counter() - started)
+
+
+def add_query_wrapper(connection):
+    # Wrappers survive reconnects, so add once
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def connection_opened(connection, **kwargs):
+    """
+    connection_created receiver: wrap the connection and count the open.
+
+    Pooled databases are not counted here, because this fires on every
+    checkout; the pool reports its own opens.
+    """
+    add_query_wrapper(connection)
+    if not connection.settings_dict.get('OPTIONS', {}).get('pool'):
+        registry.connection_opened(connection.alias)
+
+
+class RequestMetricsMiddleware:
+    """Record query count, DB time, total time and size for every request."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_seconds = settings.METRICS_SLOW_REQUEST_MS / 1000
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+        connection_created.connect(connection_opened, dispatch_uid='metrics:connection_opened')
+        # Connections opened before the middleware loaded missed the signal
+        for connection in connections.all(initialized_only=True):
+            add_query_wrapper(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        recorder = QueryRecorder(settings.METRICS_SLOW_SQL_LIMIT)
+        token = current_recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        self.record(request, response, time.perf_counter() - started, recorder)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder(settings.METRICS_SLOW_SQL_LIMIT)
+        token = current_recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        self.record(request, response, time.perf_counter() - started, recorder)
+        return response
+
+    def record(self, request, response, seconds, recorder):
+        """Add one finished request to the registry and keep it if slow."""
+        match = request.resolver_match
+        view = match.view_name if match else '<unresolved>'
+        if response.streaming:
+            size = int(response.get('Content-Length') or 0)
+        else:
+            size = len(response.content)
+
+        registry.record(
+            view, request.method, response.status_code,
+            seconds, recorder.count, recorder.seconds, size,
+        )
+
+        if seconds >= self.slow_seconds:
+            sample = {
+                'view': view,
+                'method': request.method,
+                'path': request.path,
+                'request_id': getattr(request, 'request_id', None),
+                'status': response.status_code,
+                'duration_ms': round(seconds * 1000, 1),
+                'queries': recorder.count,
+                'db_ms': round(recorder.seconds * 1000, 1),
+                'sql': [
+                    {'sql': sql, 'ms': round(elapsed * 1000, 2)}
+                    for sql, elapsed in recorder.statements
+                ],
+            }
+            registry.add_slow(sample)
+            logger.warning(
+                "Slow request %s %s (%s): %sms, %s queries, %sms in DB",
+                request.method, request.path, view,
+                sample['duration_ms'], recorder.count, sample['db_ms'],
+            )
+
+
+class MetricsView(APIView):
+    """
+    Prometheus metrics for this process (admin only).
+
+    GET: Text exposition format 0.0.4
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(
+            registry.render(),
+            content_type='text/plain; version=0.0.4; charset=utf-8',
+        )
+
+
+class SlowRequestsView(APIView):
+    """
+    Most recent slow requests with their SQL (admin only).
+
+    GET: List of samples, newest last
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(registry.slow_samples())
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 import os
 from datetime import timedelta
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -43,14 +44,15 @@ SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 # Application definition
 
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    # No autodiscovery at startup; the admin URLconf runs it on first use
+    # (recruit_art/lazy_urls.py) and the admin checks before they run
+    'recruit_art.apps.LazyAdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'cloudinary_storage',
-    'cloudinary',
     'storages',
 
     # Third-party apps
@@ -61,6 +63,7 @@ INSTALLED_APPS = [
     'import_export',
     
     # Local apps
+    'recruit_art',
     'accounts',
     'jobs',
     'enquiries',
@@ -71,13 +74,16 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'recruit_art.structured_logging.RequestIDMiddleware',
+    'recruit_art.metrics.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'recruit_art.async_api.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'recruit_art.db_routing.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'social_django.middleware.SocialAuthExceptionMiddleware',
@@ -117,7 +123,7 @@ if DEBUG:
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
+            'NAME': os.getenv('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
         }
     }
 else:
@@ -125,9 +131,82 @@ else:
         'default': dj_database_url.config(
             default=os.getenv('DATABASE_URL'),
             conn_max_age=600,
-            ssl_require=True
+            conn_health_checks=True,
+            ssl_require=os.getenv('DB_SSL_REQUIRE', 'True').lower() == 'true'
         )
     }
+    # Optional read replica for public list/detail reads (recruit_art/db_routing.py)
+    if os.getenv('DATABASE_REPLICA_URL'):
+        DATABASES['replica'] = dj_database_url.config(
+            'DATABASE_REPLICA_URL',
+            conn_max_age=600,
+            conn_health_checks=True,
+            ssl_require=os.getenv('DB_SSL_REQUIRE', 'True').lower() == 'true',
+            # Tests read the replica through the default test database
+            test_options={'MIRROR': 'default'},
+        )
+
+DATABASE_ROUTERS = ['recruit_art.db_routing.ReplicaRouter']
+# Seconds a user reads from default after their own write, covering replica lag
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv('DATABASE_REPLICA_PIN_SECONDS', 15))
+
+# Postgres connection reuse (DB_POOL):
+#   native     psycopg pool per worker process and database (Django 5.1+),
+#              bounded by DB_POOL_MAX_SIZE (defaults to the gthread thread
+#              count); waiting for a free connection shows up as db_pool_*
+#              in /api/_metrics
+#   pgbouncer  an external PgBouncer in transaction mode; persistent client
+#              connections, no server-side cursors
+#   persistent one connection per thread, kept for DB_CONN_MAX_AGE seconds
+# CONN_HEALTH_CHECKS pings connections before reuse in every mode (for the
+# native pool, on each checkout).
+DB_POOL = os.getenv('DB_POOL', 'native')
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', 600))
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', os.getenv('GUNICORN_THREADS', 4)))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+DB_POOL_MAX_IDLE = float(os.getenv('DB_POOL_MAX_IDLE', 300))
+DB_POOL_MAX_LIFETIME = float(os.getenv('DB_POOL_MAX_LIFETIME', 1800))
+
+for database in DATABASES.values():
+    if database['ENGINE'] != 'django.db.backends.postgresql':
+        continue
+    if DB_POOL == 'native':
+        # Pooled connections are returned to the pool, never kept per thread
+        database['CONN_MAX_AGE'] = 0
+        database.setdefault('OPTIONS', {})['pool'] = {
+            'min_size': DB_POOL_MIN_SIZE,
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': DB_POOL_TIMEOUT,
+            'max_idle': DB_POOL_MAX_IDLE,
+            'max_lifetime': DB_POOL_MAX_LIFETIME,
+        }
+    elif DB_POOL in ('pgbouncer', 'persistent'):
+        database['CONN_MAX_AGE'] = DB_CONN_MAX_AGE
+        if DB_POOL == 'pgbouncer':
+            database['DISABLE_SERVER_SIDE_CURSORS'] = True
+    else:
+        raise ImproperlyConfigured(f"DB_POOL must be native, pgbouncer or persistent, not {DB_POOL!r}")
+
+
+# Cache
+# Per-process memory cache by default; set REDIS_URL so throttling and cached
+# payloads are shared across gunicorn workers. Without it each worker keeps
+# its own throttle counters (`check --deploy` warns, accounts.W001).
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'recruit-art',
+        }
+    }
 
 
 # Custom User Model
@@ -211,59 +290,47 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
 # Logging Configuration
+# Records are queued in the request thread and written by a listener thread
+# (recruit_art/structured_logging.py). LOG_JSON picks JSON lines (default
+# when DEBUG is off) or text lines (default for local DEBUG runs);
+# LOG_SAMPLE_RATES keeps a fraction of INFO records from chatty loggers,
+# e.g. "jobs.views=0.1,accounts=0.5" (warnings and errors are never sampled).
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_JSON = os.getenv('LOG_JSON', str(not DEBUG)).lower() == 'true'
+LOG_SAMPLE_RATES = os.getenv('LOG_SAMPLE_RATES', 'jobs.views=0.1')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
-    'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
+    'filters': {
+        'request_id': {
+            '()': 'recruit_art.structured_logging.RequestIDFilter',
         },
-        'simple': {
-            'format': '{levelname} {message}',
-            'style': '{',
+        'sampling': {
+            '()': 'recruit_art.structured_logging.SamplingFilter',
+            'rates': LOG_SAMPLE_RATES,
         },
     },
     'handlers': {
         'console': {
-            'level': 'INFO',
-            'class': 'logging.StreamHandler',
-            'formatter': 'simple',
-        },
-        'file': {
-            'level': 'WARNING',
-            'class': 'logging.FileHandler',
-            'filename': os.path.join(BASE_DIR, 'logs/django-production.log'),
-            'formatter': 'verbose',
+            '()': 'recruit_art.structured_logging.QueuedStreamHandler',
+            'json': LOG_JSON,
+            'filters': ['request_id', 'sampling'],
         },
     },
+    'root': {
+        'handlers': ['console'],
+        'level': LOG_LEVEL,
+    },
     'loggers': {
         'django': {
             'handlers': ['console'],
-            'level': os.getenv('DJANGO_LOG_LEVEL', 'INFO'),
-            'propagate': True,
-        },
-        'accounts': {
-            'handlers': ['console'],
-            'level': 'INFO',
-            'propagate': False,
-        },
-        'jobs': {
-            'handlers': ['console'],
-            'level': 'INFO',
+            'level': os.getenv('DJANGO_LOG_LEVEL', LOG_LEVEL),
             'propagate': False,
         },
     },
 }
 
-# Create logs directory if it doesn't exist
-LOG_DIR = os.path.join(BASE_DIR, 'logs')
-if not os.path.exists(LOG_DIR):
-    try:
-        os.makedirs(LOG_DIR)
-    except OSError:
-        pass
-
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
@@ -286,6 +353,27 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,
+    # Render terminates TLS at one proxy hop in front of gunicorn
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', 1)),
+    # Sliding-window limits for public endpoints ('<scope>.<identity>', see accounts/throttles.py)
+    'DEFAULT_THROTTLE_RATES': {
+        'otp_send.ip': os.getenv('THROTTLE_OTP_SEND_IP', '20/hour'),
+        'otp_send.mobile': os.getenv('THROTTLE_OTP_SEND_MOBILE', '5/hour'),
+        'otp_send.email': os.getenv('THROTTLE_OTP_SEND_EMAIL', '5/hour'),
+        'login.ip': os.getenv('THROTTLE_LOGIN_IP', '30/min'),
+        'login.mobile': os.getenv('THROTTLE_LOGIN_MOBILE', '10/min'),
+        'login.email': os.getenv('THROTTLE_LOGIN_EMAIL', '10/min'),
+        'password_reset.ip': os.getenv('THROTTLE_PASSWORD_RESET_IP', '10/hour'),
+        'password_reset.mobile': os.getenv('THROTTLE_PASSWORD_RESET_MOBILE', '5/hour'),
+        'password_reset.email': os.getenv('THROTTLE_PASSWORD_RESET_EMAIL', '5/hour'),
+        'enquiry.ip': os.getenv('THROTTLE_ENQUIRY_IP', '10/hour'),
+        'enquiry.email': os.getenv('THROTTLE_ENQUIRY_EMAIL', '5/hour'),
+        'feedback.ip': os.getenv('THROTTLE_FEEDBACK_IP', '10/hour'),
+        'feedback.email': os.getenv('THROTTLE_FEEDBACK_EMAIL', '5/hour'),
+        'job_application.ip': os.getenv('THROTTLE_JOB_APPLICATION_IP', '30/hour'),
+        'job_application.email': os.getenv('THROTTLE_JOB_APPLICATION_EMAIL', '20/hour'),
+        'resume_upload.ip': os.getenv('THROTTLE_RESUME_UPLOAD_IP', '30/hour'),
+    },
 }
 
 # JWT Configuration
@@ -352,43 +440,57 @@ EMAIL_TIMEOUT = 10  # Timeout in seconds to prevent worker hang
 SENDGRID_API_KEY = os.getenv('SENDGRID_API_KEY')
 SENDGRID_FROM_EMAIL = os.getenv('SENDGRID_FROM_EMAIL', 'sajjanboynaveen4@gmail.com')
 
-# Logging Configuration
-LOGGING = {
-    'version': 1,
-    'disable_existing_loggers': False,
-    'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
-        },
-    },
-    'handlers': {
-        'console': {
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
-        },
-    },
-    'root': {
-        'handlers': ['console'],
-        'level': 'INFO',
-    },
-    'loggers': {
-        'django': {
-            'handlers': ['console'],
-            'level': 'INFO',
-            'propagate': False,
-        },
-        'accounts': {
-            'handlers': ['console'],
-            'level': 'DEBUG',
-            'propagate': False,
-        },
-    },
-}
-
-
-
 
 # OTP Configuration
 OTP_EXPIRY_MINUTES = int(os.getenv('OTP_EXPIRY_MINUTES', 5))
 OTP_ATTEMPTS_ALLOWED = int(os.getenv('OTP_ATTEMPTS_ALLOWED', 3))
+
+# Profile endpoint
+PROFILE_APPLICATIONS_LIMIT = int(os.getenv('PROFILE_APPLICATIONS_LIMIT', 20))
+PROFILE_CACHE_TIMEOUT = int(os.getenv('PROFILE_CACHE_TIMEOUT', 300))
+
+# Hash uploads while they stream in so identical resumes are stored once
+FILE_UPLOAD_HANDLERS = [
+    'jobs.resumes.Sha256MemoryFileUploadHandler',
+    'jobs.resumes.Sha256TemporaryFileUploadHandler',
+]
+
+# Landing page bundle (GET /api/content/landing/)
+LANDING_CACHE_TIMEOUT = int(os.getenv('LANDING_CACHE_TIMEOUT', 300))
+LANDING_FEATURED_JOBS_LIMIT = int(os.getenv('LANDING_FEATURED_JOBS_LIMIT', 6))
+
+# Seconds between folding cached visitor counts into the database
+VISITOR_FLUSH_INTERVAL = int(os.getenv('VISITOR_FLUSH_INTERVAL', 60))
+
+# Per-process memo of storage URLs (see jobs/storage_urls.py)
+STORAGE_URL_CACHE_SIZE = int(os.getenv('STORAGE_URL_CACHE_SIZE', 10000))
+
+# Background threads per process for resized image copies (0: only via
+# `manage.py generate_image_derivatives`)
+IMAGE_DERIVATIVE_WORKERS = int(os.getenv('IMAGE_DERIVATIVE_WORKERS', 2))
+
+# Direct resume uploads: seconds a signed upload token stays valid
+RESUME_UPLOAD_MAX_AGE = int(os.getenv('RESUME_UPLOAD_MAX_AGE', 3600))
+
+# Resume text extraction (see `manage.py extract_resume_text`)
+RESUME_TEXT_BATCH_SIZE = int(os.getenv('RESUME_TEXT_BATCH_SIZE', 50))
+RESUME_TEXT_WORKERS = int(os.getenv('RESUME_TEXT_WORKERS', 0))
+RESUME_TEXT_MAX_CHARS = int(os.getenv('RESUME_TEXT_MAX_CHARS', 100000))
+RESUME_SEARCH_CONFIG = os.getenv('RESUME_SEARCH_CONFIG', 'english')
+
+# Expired OTP / JWT purge (see `manage.py purge_expired_auth`)
+AUTH_PURGE_BATCH_SIZE = int(os.getenv('AUTH_PURGE_BATCH_SIZE', 5000))
+
+# Per-request query/latency metrics (GET /api/_metrics, see recruit_art/metrics.py)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+METRICS_SLOW_REQUEST_MS = int(os.getenv('METRICS_SLOW_REQUEST_MS', 1000))
+METRICS_SLOW_SAMPLES = int(os.getenv('METRICS_SLOW_SAMPLES', 50))
+METRICS_SLOW_SQL_LIMIT = int(os.getenv('METRICS_SLOW_SQL_LIMIT', 20))
+
+# ASGI mode (set by recruit_art/asgi.py): routes OTP send, Firebase login and
+# the notification stream to async views (see recruit_art/async_api.py)
+ASGI_MODE = os.getenv('ASGI_MODE', 'False').lower() == 'true'
+ASYNC_HTTP_TIMEOUT = float(os.getenv('ASYNC_HTTP_TIMEOUT', 10))
+ASYNC_HTTP_MAX_CONNECTIONS = int(os.getenv('ASYNC_HTTP_MAX_CONNECTIONS', 100))
+NOTIFICATION_STREAM_POLL_SECONDS = int(os.getenv('NOTIFICATION_STREAM_POLL_SECONDS', 5))
+NOTIFICATION_STREAM_MAX_SECONDS = int(os.getenv('NOTIFICATION_STREAM_MAX_SECONDS', 300))
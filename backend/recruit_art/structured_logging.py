@@ -0,0 +1,242 @@
+"""
+Structured Logging for Recruit Art
+
+This module provides the pieces wired together by ``LOGGING`` in settings:
+
+- ``RequestIDMiddleware`` gives every request an ID (the incoming
+  ``X-Request-ID`` header if it looks sane, otherwise a new UUID), echoes
+  it in the response, and exposes it to log records via a context variable.
+- ``RequestIDFilter`` stamps ``record.request_id`` on each record.
+- ``SamplingFilter`` keeps only a fraction of INFO/DEBUG records from
+  chatty loggers (``LOG_SAMPLE_RATES``); warnings and errors always pass.
+- ``JsonFormatter`` renders one JSON object per line, including any
+  JSON-serializable ``extra={...}`` fields.
+- ``QueuedStreamHandler`` puts records on an in-memory queue; a
+  ``QueueListener`` thread formats and writes them, so request threads
+  never block on stream I/O.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+request_id_var = ContextVar('request_id', default=None)
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._\-]{1,128}$')
+
+# Attributes every LogRecord has; anything else came from ``extra``. Django
+# also passes the request object (django.request, django.server), which is
+# neither JSON nor safe to dump.
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {
+    'message', 'asctime', 'request_id', 'request', 'server_time',
+}
+
+
+def parse_sample_rates(value):
+    """Parse ``"jobs.views=0.1,accounts=0.5"`` into ``{logger: rate}``."""
+    rates = {}
+    for item in (value or '').split(','):
+        name, sep, rate = item.partition('=')
+        if sep and name.strip():
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+
+class RequestIDFilter(logging.Filter):
+    """Attach the current request's ID (or None) to every record."""
+
+    def filter(self, record):
+        # django.request logs 4xx/5xx after the middleware chain returns,
+        # outside the context variable, but passes the request along
+        record.request_id = request_id_var.get() or getattr(
+            getattr(record, 'request', None), 'request_id', None
+        )
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a random fraction of INFO-and-below records per logger.
+
+    Args:
+        rates (dict | str): Logger name (prefix) -> fraction kept, or the
+            ``LOG_SAMPLE_RATES`` string form
+    """
+
+    def __init__(self, rates=None):
+        super().__init__()
+        if isinstance(rates, str):
+            rates = parse_sample_rates(rates)
+        # Longest prefix first so "jobs.views" wins over "jobs"
+        self.rates = sorted((rates or {}).items(), key=lambda item: -len(item[0]))
+        self._cache = {}
+
+    def rate_for(self, name):
+        rate = self._cache.get(name)
+        if rate is None:
+            rate = 1.0
+            for prefix, prefix_rate in self.rates:
+                if name == prefix or name.startswith(prefix + '.'):
+                    rate = prefix_rate
+                    break
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno > logging.INFO:
+            return True
+        rate = self.rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, request ID, extras."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'process': record.process,
+            'thread': record.thread,
+        }
+        request_id = getattr(record, 'request_id', None)
+        if request_id:
+            entry['request_id'] = request_id
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_ATTRS and not key.startswith('_') and is_json(value):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(entry)
+
+
+def is_json(value):
+    """True if ``value`` serializes as JSON; other extras are left out."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+class QueuedStreamHandler(QueueHandler):
+    """
+    Queue records in the calling thread; write them from a listener thread.
+
+    Filters on this handler (request ID, sampling) run in the calling
+    thread, so dropped records cost nothing further and the request ID
+    is captured before the record leaves the request's context.
+
+    Args:
+        json (bool): Write JSON lines instead of the verbose text format
+        stream (str): ``'stdout'`` or ``'stderr'``
+    """
+
+    def __init__(self, json=True, stream='stderr'):
+        self.target = logging.StreamHandler(sys.stdout if stream == 'stdout' else sys.stderr)
+        self.target.setFormatter(JsonFormatter() if json else logging.Formatter(
+            '{levelname} {asctime} {module} {process:d} {thread:d} {request_id} {message}',
+            style='{',
+        ))
+        super().__init__(queue.SimpleQueue())
+        self.listener = None
+        self.start()
+        atexit.register(self.stop)
+        # A listener thread started before a fork (e.g. gunicorn --preload)
+        # does not exist in the child, so start a fresh one there
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def start(self):
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def _restart_in_child(self):
+        self.queue = queue.SimpleQueue()
+        self.start()
+
+    def prepare(self, record):
+        """
+        Make the record safe to hand to another thread.
+
+        Merges args into the message and renders the traceback now, but
+        leaves formatting to the target handler's formatter.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if not hasattr(record, 'request_id'):
+            record.request_id = request_id_var.get()
+        return record
+
+
+class RequestIDMiddleware:
+    """Assign a request ID, expose it to logging and echo it in the response."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def assign(self, request):
+        request_id = request.headers.get(REQUEST_ID_HEADER, '')
+        if not REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
+        return request_id
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        request_id = self.assign(request)
+        token = request_id_var.set(request_id)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_id_var.reset(token)
+        response[REQUEST_ID_HEADER] = request_id
+        return response
+
+    async def __acall__(self, request):
+        request_id = self.assign(request)
+        token = request_id_var.set(request_id)
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_id_var.reset(token)
+        response[REQUEST_ID_HEADER] = request_id
+        return response
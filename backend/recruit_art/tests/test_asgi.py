@@ -0,0 +1,47 @@
+import logging
+
+from django.core.handlers.asgi import ASGIHandler
+from django.db import connection
+from django.test import AsyncClient, SimpleTestCase, TestCase, override_settings
+
+from recruit_art.metrics import add_query_wrapper, registry
+
+
+class AsgiMiddlewareTests(SimpleTestCase):
+    def test_middleware_chain_needs_no_adapting(self):
+        with self.assertLogs('django.request', 'DEBUG') as logs:
+            logging.getLogger('django.request').debug('loading middleware')
+            ASGIHandler()
+
+        self.assertFalse([line for line in logs.output if 'adapted' in line], logs.output)
+
+
+@override_settings(ROOT_URLCONF='accounts.tests.test_async_views')
+class AsyncMetricsTests(TestCase):
+    def setUp(self):
+        registry.clear()
+        # The test database connection predates the middleware, which only
+        # sees connections opened in its own thread when it loads
+        add_query_wrapper(connection)
+
+    async def test_async_orm_queries_are_counted(self):
+
+        await self.async_client.post(
+            '/api/accounts/otp/send/', {'mobile': '1111111111', 'otp_type': 'login'},
+            content_type='application/json',
+        )
+
+        line = next(
+            line for line in registry.render().splitlines()
+            if line.startswith('http_request_db_queries_sum') and 'otp-send' in line
+        )
+        self.assertGreater(float(line.split()[-1]), 0)
+
+
+class AsyncStaticFilesTests(SimpleTestCase):
+    @override_settings(WHITENOISE_USE_FINDERS=True, WHITENOISE_AUTOREFRESH=False)
+    async def test_static_files_are_served(self):
+        response = await AsyncClient().get('/static/admin/css/base.css')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'body', b''.join([chunk async for chunk in response]))
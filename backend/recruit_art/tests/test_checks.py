@@ -0,0 +1,28 @@
+from django.contrib import admin
+from django.contrib.admin.checks import check_admin_app as django_check_admin_app
+from django.core import checks
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from jobs.models import Job, JobApplication
+from recruit_art.checks import check_admin_app
+
+
+class AdminCheckTests(SimpleTestCase):
+    def test_admin_checks_load_the_admin_modules(self):
+        registered = checks.registry.registry.get_checks()
+        self.assertIn(check_admin_app, registered)
+        self.assertNotIn(django_check_admin_app, registered)
+
+        call_command('check', tags=['admin'], verbosity=0)
+
+        self.assertIn(Job, admin.site._registry)
+        self.assertIn(JobApplication, admin.site._registry)
+
+    def test_broken_model_admin_is_reported(self):
+        site = admin.AdminSite(name='broken')
+        site.register(Job, list_display=['no_such_field'])
+
+        errors = checks.run_checks(tags=[checks.Tags.admin])
+
+        self.assertIn('admin.E108', [error.id for error in errors])
@@ -0,0 +1,72 @@
+"""
+Run against Postgres with the native pool, e.g.:
+
+    DEBUG=False DB_SSL_REQUIRE=False DATABASE_URL=postgres://postgres@localhost/recruit_art \\
+        python manage.py test recruit_art.tests.test_db_pool
+"""
+
+import unittest
+
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections, connection
+from django.test import TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from notifications.models import Notification
+from recruit_art.metrics import registry
+
+POOLED = connection.vendor == 'postgresql' and bool(connection.settings_dict.get('OPTIONS', {}).get('pool'))
+
+
+@unittest.skipUnless(POOLED, 'needs Postgres with DB_POOL=native')
+class ConnectionPoolTests(TransactionTestCase):
+    def assert_all_returned(self):
+        stats = connection.pool.get_stats()
+        self.assertEqual(stats['pool_available'], stats['pool_size'], stats)
+
+    def get(self, client, url):
+        response = client.get(url)
+        # The test client skips this; servers run it when a request finishes
+        close_old_connections()
+        return response
+
+    def test_requests_return_their_connection(self):
+        client = APIClient()
+        self.get(client, '/api/jobs/jobs/')
+        opened = connection.pool.get_stats().get('connections_num', 0)
+
+        for _ in range(20):
+            self.assertEqual(self.get(client, '/api/jobs/jobs/').status_code, 200)
+
+        self.assert_all_returned()
+        self.assertEqual(connection.pool.get_stats().get('connections_num', 0), opened)
+        self.assertIn('db_pool_requests_total{database="default"}', registry.render())
+
+    @override_settings(
+        ROOT_URLCONF='notifications.tests.test_stream',
+        NOTIFICATION_STREAM_MAX_SECONDS=5,
+        NOTIFICATION_STREAM_POLL_SECONDS=1,
+    )
+    async def test_open_stream_holds_no_connection(self):
+        user = await get_user_model().objects.acreate(email='asha@example.com', mobile='9000000001')
+        notification = await Notification.objects.acreate(
+            user=user, title='hello', message='m', notification_type='system',
+        )
+        refresh = RefreshToken.for_user(user)
+        refresh['token_version'] = user.token_version
+
+        response = await self.async_client.get(
+            '/api/notifications/notifications/stream/',
+            headers={'Authorization': f'Bearer {refresh.access_token}', 'Last-Event-ID': '0'},
+        )
+        chunks = aiter(response)
+        received = ''
+        while 'keep-alive' not in received:
+            received += (await anext(chunks)).decode()
+
+        # Idle between polls, with the stream still open
+        self.assertIn(f'id: {notification.id}\n', received)
+        self.assert_all_returned()
+        await chunks.aclose()
+        response.close()
@@ -0,0 +1,96 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from jobs.models import Job
+from recruit_art.db_routing import REPLICA, ReplicaRouter, RoutingState, current_state, is_pinned
+
+
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch('recruit_art.db_routing.replica_configured', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.router = ReplicaRouter()
+
+    def with_state(self, use_replica):
+        state = RoutingState()
+        state.use_replica = use_replica
+        token = current_state.set(state)
+        self.addCleanup(current_state.reset, token)
+        return state
+
+    def test_reads_outside_a_request_use_default(self):
+        self.assertIsNone(self.router.db_for_read(Job))
+
+    def test_marked_reads_use_the_replica_until_a_write(self):
+        state = self.with_state(use_replica=True)
+        self.assertEqual(self.router.db_for_read(Job), REPLICA)
+
+        self.assertEqual(self.router.db_for_write(Job), 'default')
+
+        self.assertTrue(state.wrote)
+        self.assertIsNone(self.router.db_for_read(Job))
+
+    def test_unmarked_reads_use_default(self):
+        self.with_state(use_replica=False)
+        self.assertIsNone(self.router.db_for_read(Job))
+
+    def test_replica_is_never_migrated(self):
+        self.assertFalse(self.router.allow_migrate(REPLICA, 'jobs'))
+        self.assertTrue(self.router.allow_migrate('default', 'jobs'))
+
+
+class ReplicaReadMixinTests(TestCase):
+    """Which requests are marked for the replica (tests have no real replica)."""
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch('recruit_art.db_routing.replica_configured', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.job = Job.objects.create(
+            title='Editor', company_name='Studio', location='Chennai', description='d',
+            status='active', apply_deadline=timezone.now() + timedelta(days=3),
+        )
+        self.admin = CustomUser.objects.create_superuser(email='admin@example.com', mobile='9999999999', password='x')
+
+    def marked(self, method, url, client=None, **kwargs):
+        """Send a request and return whether any read was routed to the replica."""
+        marked = []
+
+        def record_read(router, model, **hints):
+            state = current_state.get()
+            marked.append(bool(state and state.use_replica and not state.wrote))
+            # Read from the test database either way
+            return None
+
+        with mock.patch.object(ReplicaRouter, 'db_for_read', record_read):
+            response = getattr(client or APIClient(), method)(url, **kwargs)
+        self.assertLess(response.status_code, 400, response.content)
+        return any(marked)
+
+    def test_public_list_and_detail_use_the_replica(self):
+        self.assertTrue(self.marked('get', '/api/jobs/jobs/'))
+        self.assertTrue(self.marked('get', f'/api/jobs/jobs/{self.job.id}/'))
+        self.assertTrue(self.marked('get', '/api/content/news/'))
+
+    def test_other_actions_use_default(self):
+        self.assertFalse(self.marked('get', f'/api/jobs/jobs/{self.job.id}/requirements/'))
+
+    def test_writer_is_pinned_to_default(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        self.assertTrue(self.marked('get', '/api/jobs/jobs/', client))
+
+        self.marked('patch', f'/api/jobs/jobs/{self.job.id}/', client, data={'title': 'Colorist'}, format='json')
+
+        self.assertTrue(is_pinned(self.admin))
+        self.assertFalse(self.marked('get', '/api/jobs/jobs/', client))
+        self.assertTrue(self.marked('get', '/api/jobs/jobs/'))
+
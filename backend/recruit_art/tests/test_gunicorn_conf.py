@@ -0,0 +1,60 @@
+import importlib.util
+import os
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+CONF_PATH = Path(__file__).resolve().parents[2] / 'gunicorn.conf.py'
+
+
+def load_conf(**env):
+    """Execute gunicorn.conf.py as gunicorn would, with ``env`` set."""
+    spec = importlib.util.spec_from_file_location('gunicorn_conf', CONF_PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(os.environ, env):
+        spec.loader.exec_module(module)
+    return module
+
+
+class GunicornConfTests(SimpleTestCase):
+    def test_worker_class_selects_the_app(self):
+        conf = load_conf(GUNICORN_WORKER_CLASS='uvicorn', WEB_CONCURRENCY='2')
+        self.assertEqual(conf.worker_class, 'uvicorn_worker.UvicornWorker')
+        self.assertEqual(conf.wsgi_app, 'recruit_art.asgi:application')
+        self.assertEqual(conf.workers, 2)
+
+        conf = load_conf(GUNICORN_WORKER_CLASS='gthread', WEB_CONCURRENCY='2', GUNICORN_THREADS='8')
+        self.assertEqual(conf.wsgi_app, 'recruit_art.wsgi:application')
+        self.assertEqual(conf.threads, 8)
+
+    def test_unknown_worker_class_is_refused(self):
+        with self.assertRaisesMessage(RuntimeError, 'GUNICORN_WORKER_CLASS must be one of'):
+            load_conf(GUNICORN_WORKER_CLASS='gevent')
+
+    def test_default_workers_follow_cpus_and_memory(self):
+        expected = {'sync': 9, 'gthread': 5, 'uvicorn': 4}
+        for worker_type, workers in expected.items():
+            conf = load_conf(GUNICORN_WORKER_CLASS=worker_type, WEB_CONCURRENCY='1')
+            with mock.patch.object(conf, 'cpu_count', return_value=4), \
+                    mock.patch.object(conf, 'memory_mb', return_value=None):
+                self.assertEqual(conf.default_workers(), workers, worker_type)
+
+        # 512MB leaves room for two 150MB workers in 80% of memory
+        conf = load_conf(GUNICORN_WORKER_CLASS='sync', WEB_CONCURRENCY='1')
+        with mock.patch.object(conf, 'cpu_count', return_value=4), \
+                mock.patch.object(conf, 'memory_mb', return_value=512):
+            self.assertEqual(conf.default_workers(), 2)
+
+    def test_cpu_count_honours_the_cgroup_quota(self):
+        conf = load_conf(WEB_CONCURRENCY='1')
+        real_open = open
+
+        def fake_open(path, *args, **kwargs):
+            if path == '/sys/fs/cgroup/cpu.max':
+                return mock.mock_open(read_data='150000 100000\n')()
+            return real_open(path, *args, **kwargs)
+
+        with mock.patch.object(conf.os, 'sched_getaffinity', return_value=set(range(8)), create=True), \
+                mock.patch('builtins.open', fake_open):
+            self.assertEqual(conf.cpu_count(), 2)
@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import path, reverse
+
+from accounts.models import CustomUser
+from recruit_art.lazy_urls import LazyPatterns
+
+
+class LazyPatternsTests(SimpleTestCase):
+    def test_patterns_are_built_once_on_first_use(self):
+        pattern = path('ping/', lambda request: None, name='ping')
+        loader = mock.Mock(return_value=[pattern])
+
+        patterns = LazyPatterns(loader)
+        loader.assert_not_called()
+
+        self.assertEqual(len(patterns), 1)
+        self.assertIs(patterns[0], pattern)
+        self.assertEqual(list(patterns), [pattern])
+        loader.assert_called_once_with()
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class LazyIncludeTests(TestCase):
+    def test_admin_loads_on_first_use(self):
+        from django.contrib import admin
+        from jobs.models import JobApplication
+
+        self.assertEqual(self.client.get('/api/jobs/jobs/').status_code, 200)
+        self.assertEqual(reverse('admin:index'), '/admin/')
+        self.assertIn(JobApplication, admin.site._registry)
+
+        user = CustomUser.objects.create_superuser(email='admin@example.com', mobile='9000000001', password='x')
+        self.client.force_login(user)
+        response = self.client.get('/admin/jobs/jobapplication/')
+        self.assertContains(response, 'export')
+        self.assertEqual(self.client.get('/admin/jobs/jobapplication/export/').status_code, 200)
+
+    def test_social_auth_urls_resolve(self):
+        self.assertEqual(reverse('social:begin', args=['google-oauth2']), '/auth/login/google-oauth2/')
+        self.assertIn(self.client.get('/auth/login/google-oauth2/').status_code, (302, 405))
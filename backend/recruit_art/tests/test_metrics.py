@@ -0,0 +1,61 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from recruit_art.metrics import Histogram, registry
+
+
+class HistogramTests(TestCase):
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram((1, 5, 10))
+        for value in (0, 1, 3, 7, 50):
+            histogram.observe(value)
+
+        self.assertEqual(list(histogram.cumulative()), [(1, 2), (5, 3), (10, 4), ('+Inf', 5)])
+        self.assertEqual(histogram.sum, 61)
+        self.assertEqual(histogram.count, 5)
+
+
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        registry.clear()
+        self.admin = CustomUser.objects.create_superuser(email='admin@example.com', mobile='9999999999', password='x')
+
+    def admin_client(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        return client
+
+    def test_metrics_are_admin_only(self):
+        self.assertIn(APIClient().get('/api/_metrics').status_code, (401, 403))
+        self.assertIn(APIClient().get('/api/_metrics/slow').status_code, (401, 403))
+
+    def test_requests_are_counted_by_view(self):
+        client = APIClient()
+        for _ in range(3):
+            client.get('/api/jobs/jobs/')
+        client.get('/api/nope/')
+
+        response = self.admin_client().get('/api/_metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        text = response.content.decode()
+        self.assertIn('http_requests_total{view="jobs:job-list",method="GET",status="200"} 3', text)
+        self.assertIn('http_requests_total{view="<unresolved>",method="GET",status="404"} 1', text)
+        self.assertIn('http_request_db_queries_count{view="jobs:job-list",method="GET"} 3', text)
+        self.assertIn('# TYPE http_request_duration_seconds histogram', text)
+        # The job list runs queries, so its zero-query bucket stays empty
+        self.assertIn('http_request_db_queries_bucket{view="jobs:job-list",method="GET",le="0"} 0', text)
+
+    @override_settings(METRICS_SLOW_REQUEST_MS=0)
+    def test_slow_requests_keep_their_sql(self):
+        with self.assertLogs('recruit_art.metrics', 'WARNING'):
+            APIClient().get('/api/jobs/jobs/')
+
+        samples = self.admin_client().get('/api/_metrics/slow').json()
+
+        sample = next(s for s in samples if s['view'] == 'jobs:job-list')
+        self.assertEqual(sample['status'], 200)
+        self.assertEqual(len(sample['sql']), sample['queries'])
+        self.assertTrue(sample['sql'])
@@ -0,0 +1,113 @@
+import io
+import json
+import logging
+import os
+import unittest
+
+from django.test import Client, SimpleTestCase, TestCase
+
+from recruit_art.structured_logging import (
+    JsonFormatter,
+    QueuedStreamHandler,
+    SamplingFilter,
+    request_id_var,
+)
+
+
+def make_record(name='recruit_art.tests', level=logging.INFO, msg='hello', args=None, **extra):
+    record = logging.LogRecord(name, level, __file__, 0, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class RequestIDTests(TestCase):
+    def test_request_id_is_echoed_or_generated(self):
+        client = Client()
+
+        response = client.get('/api/jobs/jobs/', HTTP_X_REQUEST_ID='abc-123')
+        self.assertEqual(response['X-Request-ID'], 'abc-123')
+
+        response = client.get('/api/jobs/jobs/', HTTP_X_REQUEST_ID='bad value\n')
+        self.assertEqual(len(response['X-Request-ID']), 32)
+
+
+class SamplingFilterTests(SimpleTestCase):
+    def test_longest_prefix_wins_and_warnings_always_pass(self):
+        sampling = SamplingFilter('jobs=0,jobs.views=1')
+
+        self.assertTrue(sampling.filter(make_record('jobs.views')))
+        self.assertFalse(sampling.filter(make_record('jobs.models')))
+        self.assertTrue(sampling.filter(make_record('jobs.models', logging.WARNING)))
+        self.assertTrue(sampling.filter(make_record('jobsx')))
+
+
+class JsonFormatterTests(SimpleTestCase):
+    def test_extras_are_included(self):
+        entry = json.loads(JsonFormatter().format(
+            make_record(msg='applied %s', args=(5,), job_id=5, errors={'email': ['Required']})
+        ))
+
+        self.assertEqual(entry['message'], 'applied 5')
+        self.assertEqual(entry['job_id'], 5)
+        self.assertEqual(entry['errors'], {'email': ['Required']})
+
+    def test_request_and_unserializable_extras_are_left_out(self):
+        entry = json.loads(JsonFormatter().format(
+            make_record(request=object(), status_code=404, handle=object(), tags={1, 2})
+        ))
+
+        self.assertEqual(entry['status_code'], 404)
+        self.assertNotIn('request', entry)
+        self.assertNotIn('handle', entry)
+        self.assertNotIn('tags', entry)
+
+
+class QueuedStreamHandlerTests(SimpleTestCase):
+    def logger_with_handler(self, name):
+        handler = QueuedStreamHandler(json=True)
+        self.addCleanup(handler.stop)
+        logger = logging.getLogger(name)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return logger, handler
+
+    def test_records_are_written_as_json_lines(self):
+        logger, handler = self.logger_with_handler('recruit_art.tests.queued')
+        handler.target.stream = io.StringIO()
+
+        token = request_id_var.set('rid-1')
+        try:
+            logger.info('hello %s', 'there', extra={'job_id': 5})
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                logger.exception('boom')
+        finally:
+            request_id_var.reset(token)
+        stream = handler.target.stream
+        handler.stop()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines[0]['message'], 'hello there')
+        self.assertEqual(lines[0]['job_id'], 5)
+        self.assertEqual(lines[0]['request_id'], 'rid-1')
+        self.assertIn('ZeroDivisionError', lines[1]['exception'])
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'needs os.fork')
+    def test_forked_child_gets_a_listener(self):
+        logger, handler = self.logger_with_handler('recruit_art.tests.forked')
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            handler.target.stream = os.fdopen(write_fd, 'w')
+            logger.warning('from the child')
+            handler.stop()
+            handler.target.stream.flush()
+            os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as output:
+            self.assertIn('from the child', output.read())
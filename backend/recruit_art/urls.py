@@ -1,11 +1,13 @@
 """
 URL configuration for recruit_art project.
 """
-from django.contrib import admin
 from django.urls import path, include
+from recruit_art.lazy_urls import admin_loader, lazy_include, urlconf_loader
+from recruit_art.metrics import MetricsView, SlowRequestsView
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
+    # Admin modules are discovered on the first admin URL, not at startup
+    path("admin/", lazy_include(admin_loader(), "admin")),
     
     # API URLs
     path("api/accounts/", include("accounts.urls", namespace="accounts")),
@@ -16,9 +18,11 @@ urlpatterns = [
     path("api/requirements/", include("requirements.urls", namespace="requirements")),
     path("api/notifications/", include("notifications.urls", namespace="notifications")),
     path("api/content/", include("content.urls")),
+    path("api/_metrics", MetricsView.as_view(), name="metrics"),
+    path("api/_metrics/slow", SlowRequestsView.as_view(), name="metrics-slow"),
     
     # Social Auth URLs
-    path("auth/", include("social_django.urls", namespace="social")),
+    path("auth/", lazy_include(urlconf_loader("social_django.urls"), "social")),
 ]
 
 from django.conf import settings
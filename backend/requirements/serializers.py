@@ -4,9 +4,26 @@ Serializers for Requirements App
 This module contains serializers for requirement templates and fields.
 """
 
+from django.db import transaction
 from rest_framework import serializers
 from requirements.models import RequirementTemplate, RequirementField
 
+# Upper bound on jobs per batch apply request
+APPLY_TEMPLATE_MAX_JOBS = 500
+
+
+def template_fields_count(template):
+    """
+    Field count from the ``fields_count`` annotation or prefetched fields,
+    falling back to a COUNT query.
+    """
+    count = getattr(template, 'fields_count', None)
+    if count is not None:
+        return count
+    if 'fields' in getattr(template, '_prefetched_objects_cache', {}):
+        return len(template.fields.all())
+    return template.fields.count()
+
 
 class RequirementFieldSerializer(serializers.ModelSerializer):
     """Serializer for RequirementField model."""
@@ -26,12 +43,19 @@ class RequirementFieldSerializer(serializers.ModelSerializer):
 
 
 class RequirementFieldCreateSerializer(serializers.ModelSerializer):
-    """Serializer for creating requirement fields."""
+    """
+    Serializer for creating requirement fields.
+    
+    ``id`` is optional and only used by nested template updates to match
+    an incoming field to an existing one.
+    """
+    
+    id = serializers.IntegerField(required=False)
     
     class Meta:
         model = RequirementField
         fields = [
-            'question_text', 'field_type', 'field_name',
+            'id', 'question_text', 'field_type', 'field_name',
             'is_required', 'options', 'help_text', 'display_order'
         ]
     
@@ -73,7 +97,7 @@ class RequirementTemplateSerializer(serializers.ModelSerializer):
     
     def get_fields_count(self, obj):
         """Return the count of fields in the template."""
-        return obj.fields.count()
+        return template_fields_count(obj)
 
 
 class RequirementTemplateListSerializer(serializers.ModelSerializer):
@@ -90,11 +114,18 @@ class RequirementTemplateListSerializer(serializers.ModelSerializer):
     
     def get_fields_count(self, obj):
         """Return the count of fields in the template."""
-        return obj.fields.count()
+        return template_fields_count(obj)
 
 
 class RequirementTemplateCreateSerializer(serializers.ModelSerializer):
-    """Serializer for creating requirement templates."""
+    """
+    Serializer for creating requirement templates.
+    
+    On update, a ``fields`` list replaces the template's fields: incoming
+    fields are matched to existing ones by ``id`` (or else by
+    ``field_name``), unmatched existing fields are deleted. Each kind of
+    write is a single bulk statement. Omitting ``fields`` leaves them as is.
+    """
     
     fields = RequirementFieldCreateSerializer(many=True, required=False)
     
@@ -102,87 +133,186 @@ class RequirementTemplateCreateSerializer(serializers.ModelSerializer):
         model = RequirementTemplate
         fields = ['name', 'description', 'is_active', 'fields']
     
+    def validate_fields(self, value):
+        """Ensure field names and ids are unique within the payload."""
+        names = [field_data['field_name'] for field_data in value]
+        if len(names) != len(set(names)):
+            raise serializers.ValidationError(
+                'Field name must be unique for this template.'
+            )
+        ids = [field_data['id'] for field_data in value if field_data.get('id')]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError('Each field id may only appear once.')
+        return value
+    
     def create(self, validated_data):
         """Create template with nested fields."""
         fields_data = validated_data.pop('fields', [])
-        template = RequirementTemplate.objects.create(**validated_data)
         
-        for field_data in fields_data:
-            RequirementField.objects.create(template=template, **field_data)
+        with transaction.atomic():
+            template = RequirementTemplate.objects.create(**validated_data)
+            RequirementField.objects.bulk_create([
+                RequirementField(template=template, **self._field_values(field_data))
+                for field_data in fields_data
+            ])
         
         return template
     
     def update(self, instance, validated_data):
         """Update template with nested fields."""
-        fields_data = validated_data.pop('fields', [])
+        fields_data = validated_data.pop('fields', None)
         
-        instance.name = validated_data.get('name', instance.name)
-        instance.description = validated_data.get('description', instance.description)
-        instance.is_active = validated_data.get('is_active', instance.is_active)
-        instance.save()
+        with transaction.atomic():
+            instance.name = validated_data.get('name', instance.name)
+            instance.description = validated_data.get('description', instance.description)
+            instance.is_active = validated_data.get('is_active', instance.is_active)
+            instance.save()
+            
+            if fields_data is not None:
+                self._sync_fields(instance, fields_data)
         
-        # Update existing fields and add new ones
+        return instance
+    
+    @staticmethod
+    def _field_values(field_data):
+        return {key: value for key, value in field_data.items() if key != 'id'}
+    
+    def _sync_fields(self, template, fields_data):
+        """Diff incoming fields against stored ones and write in bulk."""
+        existing = {field.pk: field for field in RequirementField.objects.filter(template=template)}
+        
+        unknown = [
+            field_data['id'] for field_data in fields_data
+            if field_data.get('id') and field_data['id'] not in existing
+        ]
+        if unknown:
+            raise serializers.ValidationError(
+                {'fields': [f'Fields not found in this template: {unknown}']}
+            )
+        
+        claimed = {field_data['id'] for field_data in fields_data if field_data.get('id')}
+        by_name = {
+            field.field_name: field for pk, field in existing.items() if pk not in claimed
+        }
+        
+        to_create, to_update, changed = [], [], set()
         for field_data in fields_data:
-            field_id = field_data.pop('id', None)
-            if field_id:
-                # Update existing field
-                RequirementField.objects.filter(
-                    pk=field_id, template=instance
-                ).update(**field_data)
-            else:
-                # Create new field
-                RequirementField.objects.create(template=instance, **field_data)
+            values = self._field_values(field_data)
+            field = existing[field_data['id']] if field_data.get('id') else by_name.pop(values['field_name'], None)
+            if field is None:
+                to_create.append(RequirementField(template=template, **values))
+                continue
+            claimed.add(field.pk)
+            dirty = [name for name, value in values.items() if getattr(field, name) != value]
+            if dirty:
+                for name in dirty:
+                    setattr(field, name, values[name])
+                changed.update(dirty)
+                to_update.append(field)
         
-        return instance
+        stale = [pk for pk in existing if pk not in claimed]
+        if stale:
+            RequirementField.objects.filter(pk__in=stale).delete()
+        if to_update:
+            RequirementField.objects.bulk_update(to_update, sorted(changed))
+        if to_create:
+            RequirementField.objects.bulk_create(to_create)
 
 
 class ApplyTemplateSerializer(serializers.Serializer):
-    """Serializer for applying a template to a job."""
+    """
+    Serializer for applying a template to one job or many jobs.
+    
+    Pass ``job_id`` for a single job or ``job_ids`` for a batch. Fields
+    a job already has (matched by ``field_name``) are left untouched.
+    Pass the template in context as ``template`` to avoid re-fetching it.
+    """
     
     template_id = serializers.IntegerField()
-    job_id = serializers.IntegerField()
+    job_id = serializers.IntegerField(required=False)
+    job_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=APPLY_TEMPLATE_MAX_JOBS,
+    )
     
     def validate_template_id(self, value):
         """Validate template exists and is active."""
-        try:
-            template = RequirementTemplate.objects.get(pk=value, is_active=True)
-        except RequirementTemplate.DoesNotExist:
+        template = self.context.get('template')
+        if template is None or template.pk != value:
+            template = RequirementTemplate.objects.filter(pk=value).first()
+        if template is None or not template.is_active:
             raise serializers.ValidationError(
                 'Template not found or is inactive.'
             )
+        self.template = template
         return value
     
-    def validate_job_id(self, value):
-        """Validate job exists."""
+    def validate(self, attrs):
+        """Resolve the target jobs with a single existence query."""
         from jobs.models import Job
-        try:
-            Job.objects.get(pk=value)
-        except Job.DoesNotExist:
-            raise serializers.ValidationError('Job not found.')
-        return value
+        
+        if 'job_ids' in attrs:
+            key, job_ids = 'job_ids', list(dict.fromkeys(attrs['job_ids']))
+        elif 'job_id' in attrs:
+            key, job_ids = 'job_id', [attrs['job_id']]
+        else:
+            raise serializers.ValidationError(
+                {'job_id': 'Provide job_id or job_ids.'}
+            )
+        
+        found = set(Job.objects.filter(pk__in=job_ids).order_by().values_list('pk', flat=True))
+        missing = [pk for pk in job_ids if pk not in found]
+        if missing:
+            message = 'Job not found.' if key == 'job_id' else f'Jobs not found: {missing}'
+            raise serializers.ValidationError({key: message})
+        
+        attrs['job_ids'] = job_ids
+        return attrs
     
     def apply(self):
-        """Apply template fields to a job as requirements."""
-        from jobs.models import Job, JobRequirement
+        """
+        Apply template fields to the jobs as requirements.
         
-        template = RequirementTemplate.objects.get(pk=self.validated_data['template_id'])
-        job = Job.objects.get(pk=self.validated_data['job_id'])
+        Runs a fixed number of queries however many jobs and fields are
+        involved: lock the jobs, read the existing field names, insert
+        the rest in one ``bulk_create``.
         
-        created_fields = []
-        for field in template.fields.all().order_by('display_order'):
-            requirement, created = JobRequirement.objects.get_or_create(
-                job=job,
-                field_name=field.field_name,
-                defaults={
-                    'question_text': field.question_text,
-                    'field_type': field.field_type,
-                    'is_required': field.is_required,
-                    'options': field.options,
-                    'help_text': field.help_text,
-                    'display_order': field.display_order,
-                }
-            )
-            created_fields.append(requirement)
+        Returns:
+            list: Newly created JobRequirement instances
+        """
+        from jobs.models import Job, JobRequirement
         
-        return created_fields
-
+        job_ids = self.validated_data['job_ids']
+        # Uses the viewset's prefetch when present; Meta ordering is per template
+        fields = sorted(self.template.fields.all(), key=lambda f: f.display_order)
+        if not fields:
+            return []
+        
+        with transaction.atomic():
+            # Serialize concurrent applies to the same jobs so the
+            # existence check below cannot race into duplicate fields
+            list(Job.objects.select_for_update().filter(pk__in=job_ids).order_by('pk').values_list('pk'))
+            
+            existing = set(JobRequirement.objects.filter(
+                job_id__in=job_ids,
+                field_name__in=[field.field_name for field in fields],
+            ).order_by().values_list('job_id', 'field_name'))
+            
+            requirements = [
+                JobRequirement(
+                    job_id=job_id,
+                    field_name=field.field_name,
+                    question_text=field.question_text,
+                    field_type=field.field_type,
+                    is_required=field.is_required,
+                    options=field.options,
+                    help_text=field.help_text,
+                    display_order=field.display_order,
+                )
+                for job_id in job_ids
+                for field in fields
+                if (job_id, field.field_name) not in existing
+            ]
+            return JobRequirement.objects.bulk_create(requirements, batch_size=500)
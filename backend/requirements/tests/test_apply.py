@@ -0,0 +1,92 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from jobs.models import Job, JobRequirement
+from requirements.models import RequirementField, RequirementTemplate
+
+
+class ApplyTemplateTests(TestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_superuser(email='admin@example.com', mobile='9999999999', password='x')
+        self.template = RequirementTemplate.objects.create(name='Portfolio')
+        for i in range(20):
+            RequirementField.objects.create(
+                template=self.template, field_name=f'f{i}', question_text='q', display_order=20 - i,
+            )
+        self.jobs = [
+            Job.objects.create(
+                title='Colorist', company_name='Studio', location='Chennai', description='d',
+                number_of_openings=1, apply_deadline=timezone.now(),
+            )
+            for _ in range(30)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.url = f'/api/requirements/templates/{self.template.id}/'
+
+    def test_apply_to_job_inserts_only_missing_fields(self):
+        job = self.jobs[0]
+        JobRequirement.objects.create(job=job, field_name='f3', question_text='existing')
+
+        with self.assertNumQueries(8):
+            response = self.client.post(self.url + 'apply_to_job/', {'job_id': job.id}, format='json')
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['requirements_count'], 19)
+        self.assertEqual(job.requirements.count(), 20)
+        self.assertEqual(job.requirements.get(field_name='f3').question_text, 'existing')
+
+    def test_apply_to_job_rejects_unknown_job(self):
+        response = self.client.post(self.url + 'apply_to_job/', {'job_id': 99999}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'job_id': ['Job not found.']})
+
+    def test_apply_requires_admin(self):
+        response = APIClient().post(self.url + 'apply_to_job/', {'job_id': self.jobs[0].id}, format='json')
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_apply_to_jobs_query_count_is_constant(self):
+        def apply(jobs):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    self.url + 'apply_to_jobs/', {'job_ids': [job.id for job in jobs]}, format='json',
+                )
+            self.assertEqual(response.status_code, 200, response.content)
+            return len(queries)
+
+        self.assertEqual(apply(self.jobs[6:12]), apply(self.jobs[:3]))
+
+    def test_apply_to_jobs_creates_missing_requirements(self):
+        ids = [job.id for job in self.jobs]
+
+        response = self.client.post(self.url + 'apply_to_jobs/', {'job_ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['jobs_count'], 30)
+        self.assertEqual(response.json()['requirements_count'], 600)
+        self.assertEqual(JobRequirement.objects.count(), 600)
+
+        # Applying again creates nothing
+        response = self.client.post(self.url + 'apply_to_jobs/', {'job_ids': ids}, format='json')
+        self.assertEqual(response.json()['requirements_count'], 0)
+
+    def test_apply_to_jobs_rejects_unknown_jobs(self):
+        ids = [job.id for job in self.jobs] + [99999]
+
+        response = self.client.post(self.url + 'apply_to_jobs/', {'job_ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'job_ids': ['Jobs not found: [99999]']})
+        self.assertFalse(JobRequirement.objects.exists())
+
+    def test_apply_to_jobs_requires_job_ids(self):
+        response = self.client.post(self.url + 'apply_to_jobs/', {}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('job_ids', response.json())
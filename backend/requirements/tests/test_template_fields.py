@@ -0,0 +1,103 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from requirements.models import RequirementField
+
+
+def fields(count, prefix='f'):
+    return [
+        {'question_text': 'q', 'field_name': f'{prefix}{i}', 'display_order': i}
+        for i in range(count)
+    ]
+
+
+class TemplateFieldWriteTests(TestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_superuser(email='admin@example.com', mobile='9999999999', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def create_template(self, count):
+        response = self.client.post(
+            '/api/requirements/templates/', {'name': 'Portfolio', 'fields': fields(count)}, format='json',
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.json()['template']['id']
+
+    def test_create_writes_fields_in_bulk(self):
+        with self.assertNumQueries(6):
+            self.create_template(50)
+
+        self.assertEqual(RequirementField.objects.count(), 50)
+
+    def test_update_keeps_updates_adds_and_drops_fields(self):
+        template_id = self.create_template(50)
+        url = f'/api/requirements/templates/{template_id}/'
+        current = self.client.get(url).json()['fields']
+        kept = current[:40]
+        payload = [
+            {key: field[key] for key in ('id', 'question_text', 'field_name', 'display_order')}
+            for field in kept
+        ]
+        for field in payload[:5]:
+            field['question_text'] = 'changed'
+        payload += fields(10, 'n')
+
+        with self.assertNumQueries(10):
+            response = self.client.put(url, {'name': 'Portfolio 2', 'fields': payload}, format='json')
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(RequirementField.objects.count(), 50)
+        self.assertEqual(RequirementField.objects.filter(question_text='changed').count(), 5)
+        self.assertTrue(
+            {field['id'] for field in kept} <= set(RequirementField.objects.values_list('id', flat=True))
+        )
+        self.assertFalse(RequirementField.objects.filter(field_name='f45').exists())
+
+    def test_update_matches_fields_without_id_by_name(self):
+        template_id = self.create_template(5)
+        ids = sorted(RequirementField.objects.values_list('id', flat=True))
+
+        self.client.put(
+            f'/api/requirements/templates/{template_id}/', {'name': 'Portfolio', 'fields': fields(3)}, format='json',
+        )
+
+        self.assertEqual(sorted(RequirementField.objects.values_list('id', flat=True)), ids[:3])
+
+    def test_update_rejects_bad_fields(self):
+        template_id = self.create_template(3)
+        url = f'/api/requirements/templates/{template_id}/'
+
+        response = self.client.put(
+            url,
+            {'name': 'Portfolio', 'fields': fields(2) + [{'id': 99999, 'question_text': 'q', 'field_name': 'z'}]},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Fields not found in this template: [99999]']})
+
+        response = self.client.put(url, {'name': 'Portfolio', 'fields': fields(2) + fields(1)}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Field name must be unique for this template.']})
+
+        self.assertEqual(RequirementField.objects.count(), 3)
+
+    def test_partial_update_without_fields_keeps_them(self):
+        template_id = self.create_template(3)
+
+        self.client.patch(f'/api/requirements/templates/{template_id}/', {'name': 'Renamed'}, format='json')
+
+        self.assertEqual(RequirementField.objects.count(), 3)
+
+    def test_duplicate_copies_fields_in_bulk(self):
+        template_id = self.create_template(50)
+        url = f'/api/requirements/templates/{template_id}/duplicate/'
+
+        with self.assertNumQueries(8):
+            response = self.client.post(url)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()['template']['fields']), 50)
+        self.assertEqual(RequirementField.objects.count(), 100)
+        self.assertEqual(APIClient().post(url).status_code, 401)
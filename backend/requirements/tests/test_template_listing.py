@@ -0,0 +1,53 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from requirements.models import RequirementField, RequirementTemplate
+
+
+class TemplateListingTests(TestCase):
+    def setUp(self):
+        for count in range(15):
+            template = RequirementTemplate.objects.create(name=f't{count}')
+            RequirementField.objects.bulk_create([
+                RequirementField(template=template, field_name=f'f{i}', question_text='q', display_order=20 - i)
+                for i in range(count)
+            ])
+        self.admin = CustomUser.objects.create_superuser(email='admin@example.com', mobile='9999999999', password='x')
+        self.client = APIClient()
+
+    def test_list_annotates_fields_count(self):
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/requirements/templates/')
+
+        data = response.json()
+        templates = data.get('results', data)
+        counts = {template['name']: template['fields_count'] for template in templates}
+        self.assertEqual(counts['t14'], 14)
+        self.assertEqual(counts['t0'], 0)
+
+    def test_detail_prefetches_fields_in_display_order(self):
+        template = RequirementTemplate.objects.get(name='t14')
+
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/requirements/templates/{template.id}/')
+
+        data = response.json()
+        self.assertEqual(data['fields_count'], 14)
+        orders = [field['display_order'] for field in data['fields']]
+        self.assertEqual(orders, sorted(orders))
+
+    def test_update_response_reflects_new_fields(self):
+        template = RequirementTemplate.objects.get(name='t14')
+        self.client.force_authenticate(self.admin)
+
+        response = self.client.put(
+            f'/api/requirements/templates/{template.id}/',
+            {'name': 'x', 'fields': [{'question_text': 'q', 'field_name': 'only'}]},
+            format='json',
+        )
+
+        self.assertEqual(response.json()['template']['fields_count'], 1)
+        self.assertEqual(len(response.json()['template']['fields']), 1)
+        response = self.client.get(f'/api/requirements/templates/{template.id}/fields/')
+        self.assertEqual(len(response.json()), 1)
@@ -8,6 +8,8 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAdminUser
+from django.db import transaction
+from django.db.models import Count, Prefetch
 from django.shortcuts import get_object_or_404
 from requirements.models import RequirementTemplate, RequirementField
 from requirements.serializers import (
@@ -33,6 +35,9 @@ class RequirementTemplateViewSet(viewsets.ModelViewSet):
     queryset = RequirementTemplate.objects.all()
     permission_classes = [AllowAny]
     
+    # Actions that read every field of the template
+    FIELD_ACTIONS = ['retrieve', 'fields', 'apply_to_job', 'apply_to_jobs', 'duplicate']
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == 'list':
@@ -42,8 +47,21 @@ class RequirementTemplateViewSet(viewsets.ModelViewSet):
         return RequirementTemplateSerializer
     
     def get_queryset(self):
-        """Filter templates based on user role and query params."""
-        queryset = RequirementTemplate.objects.prefetch_related('fields')
+        """
+        Filter templates based on user role and query params.
+        
+        Listings only need a field count, so they annotate it instead of
+        loading fields; actions that render or copy fields prefetch them
+        in display order. Write actions load neither, so responses never
+        show a stale prefetch.
+        """
+        queryset = RequirementTemplate.objects.all()
+        if self.action == 'list':
+            queryset = queryset.annotate(fields_count=Count('fields'))
+        elif self.action in self.FIELD_ACTIONS:
+            queryset = queryset.prefetch_related(
+                Prefetch('fields', queryset=RequirementField.objects.order_by('display_order'))
+            )
         
         # Non-admin users only see active templates
         if not self.request.user.is_staff:
@@ -58,7 +76,10 @@ class RequirementTemplateViewSet(viewsets.ModelViewSet):
     
     def get_permissions(self):
         """Set permissions based on action."""
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
+        if self.action in [
+            'create', 'update', 'partial_update', 'destroy',
+            'apply_to_job', 'apply_to_jobs', 'duplicate', 'activate', 'deactivate',
+        ]:
             return [IsAdminUser()]
         return [AllowAny()]
     
@@ -106,7 +127,7 @@ class RequirementTemplateViewSet(viewsets.ModelViewSet):
     def fields(self, request, pk=None):
         """Get all fields for a specific template."""
         template = self.get_object()
-        fields = template.fields.all().order_by('display_order')
+        fields = template.fields.all()
         serializer = RequirementFieldSerializer(fields, many=True)
         return Response(serializer.data)
     
@@ -119,10 +140,13 @@ class RequirementTemplateViewSet(viewsets.ModelViewSet):
         """
         template = self.get_object()
         
-        serializer = ApplyTemplateSerializer(data={
-            'template_id': template.id,
-            'job_id': request.data.get('job_id')
-        })
+        serializer = ApplyTemplateSerializer(
+            data={
+                'template_id': template.id,
+                'job_id': request.data.get('job_id')
+            },
+            context={'template': template}
+        )
         
         if serializer.is_valid():
             requirements = serializer.apply()
@@ -137,6 +161,38 @@ class RequirementTemplateViewSet(viewsets.ModelViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    @action(detail=True, methods=['post'])
+    def apply_to_jobs(self, request, pk=None):
+        """
+        Apply template fields to many jobs in one request.
+        
+        POST: {"job_ids": [1, 2, ...]}
+        """
+        template = self.get_object()
+        
+        serializer = ApplyTemplateSerializer(
+            data={
+                'template_id': template.id,
+                'job_ids': request.data.get('job_ids')
+            },
+            context={'template': template}
+        )
+        
+        if serializer.is_valid():
+            requirements = serializer.apply()
+            jobs_count = len(serializer.validated_data['job_ids'])
+            
+            return Response(
+                {
+                    'message': f'Template applied to {jobs_count} jobs. {len(requirements)} requirements created.',
+                    'jobs_count': jobs_count,
+                    'requirements_count': len(requirements)
+                },
+                status=status.HTTP_200_OK
+            )
+        
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
     @action(detail=True, methods=['post'])
     def duplicate(self, request, pk=None):
         """
@@ -146,25 +202,28 @@ class RequirementTemplateViewSet(viewsets.ModelViewSet):
         """
         template = self.get_object()
         
-        # Create a copy of the template
-        new_template = RequirementTemplate.objects.create(
-            name=f"{template.name} (Copy)",
-            description=template.description,
-            is_active=False
-        )
-        
-        # Copy all fields
-        for field in template.fields.all():
-            RequirementField.objects.create(
-                template=new_template,
-                question_text=field.question_text,
-                field_type=field.field_type,
-                field_name=field.field_name,
-                is_required=field.is_required,
-                options=field.options,
-                help_text=field.help_text,
-                display_order=field.display_order
+        with transaction.atomic():
+            # Create a copy of the template
+            new_template = RequirementTemplate.objects.create(
+                name=f"{template.name} (Copy)",
+                description=template.description,
+                is_active=False
             )
+            
+            # Copy all fields in one statement
+            RequirementField.objects.bulk_create([
+                RequirementField(
+                    template=new_template,
+                    question_text=field.question_text,
+                    field_type=field.field_type,
+                    field_name=field.field_name,
+                    is_required=field.is_required,
+                    options=field.options,
+                    help_text=field.help_text,
+                    display_order=field.display_order
+                )
+                for field in template.fields.all()
+            ])
         
         return Response(
             {